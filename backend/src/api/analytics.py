@@ -175,6 +175,9 @@ async def get_dashboard_summary(
     today = datetime.utcnow().date()
     yesterday = today - timedelta(days=1)
     last_week = today - timedelta(days=7)
+    # Range bounds instead of DATE(column) = today: no per-row cast
+    today_start = datetime.combine(today, datetime.min.time())
+    tomorrow_start = today_start + timedelta(days=1)
     
     # Efficient single-query aggregation
     stats_query = db.query(
@@ -195,10 +198,10 @@ async def get_dashboard_summary(
             Lead.priority == PriorityType.LOW
         ).label('low_leads'),
         func.count(Lead.id).filter(
-            func.date(Lead.created_at) == today
+            Lead.created_at >= today_start, Lead.created_at < tomorrow_start
         ).label('new_today'),
         func.count(Lead.id).filter(
-            func.date(Lead.contacted_at) == today
+            Lead.contacted_at >= today_start, Lead.contacted_at < tomorrow_start
         ).label('contacted_today'),
     ).filter(Lead.created_at >= cutoff_date).first()
     
@@ -301,7 +304,8 @@ async def get_leads_trend(
             Lead.status.in_([LeadStatus.CONSULTATION_COMPLETE, LeadStatus.TREATMENT_STARTED])
         ).label('converted_leads'),
     ).filter(
-        func.date(Lead.created_at) >= start_date
+        # Sargable: compare the raw column so the created_at index is usable
+        Lead.created_at >= datetime.combine(start_date, datetime.min.time())
     ).group_by(
         func.date(Lead.created_at)
     ).order_by(
@@ -47,6 +47,7 @@ from ..services.encryption import EncryptionService
 from ..services.audit import AuditService
 from ..services.lead_number import generate_lead_number
 from ..services.cache import get_cache
+from ..services.provider_cache import invalidate_provider_cache
 from ..core.auth import get_current_user, require_role
 
 
@@ -433,6 +434,10 @@ async def submit_lead(
         except Exception:
             pass  # Don't fail the request if cache invalidation fails
 
+        # Provider was created or its referral count changed above
+        if referring_provider_id:
+            invalidate_provider_cache(referring_provider_id)
+
         # Generate confirmation message and estimated time BEFORE notifications
         # Note: v2 functions expect string priority (hot, medium, low, disqualified)
         message = get_confirmation_message(score_breakdown.priority, in_service_area)
@@ -1425,6 +1430,7 @@ async def update_lead_status(
             provider.converted_referrals = (
                 provider.converted_referrals or 0) + 1
             db.commit()
+            invalidate_provider_cache(provider.id)
 
     # Invalidate cache to ensure dashboard metrics are accurate
     try:
@@ -12,22 +12,30 @@ OPTIMIZED v3.0:
 """
 
 import time
+import functools
+import hashlib
 import logging
 import uuid
 import json
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 from typing import Optional, List
 from enum import Enum
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case, extract, and_, or_
+from sqlalchemy import func, case, extract, and_, or_, select, bindparam
 from sqlalchemy.exc import SQLAlchemyError, OperationalError
 
-from ..core.database import get_db
+from ..core.database import get_db, get_async_db
 from ..core.config import settings
 from ..models.lead import Lead, PriorityType, LeadStatus, ContactOutcome
-from ..services.cache import get_cache, CacheService
+from ..services.cache import get_cache, CacheService, LocalTTLCache
+from ..services.dashboard_counters import read_dashboard_summary, reconcile_dashboard_counters_async
+from ..services.lead_change_listener import register_lead_change_handler
 from pydantic import BaseModel, Field
 
 
@@ -41,6 +49,79 @@ CACHE_PREFIX_DASHBOARD_SUMMARY = "neuroreach:metrics:dashboard_summary"
 CACHE_TTL_QUEUE_METRICS = 30  # 30 seconds for queue metrics
 CACHE_TTL_TRENDS = 60  # 60 seconds for trends
 CACHE_TTL_DASHBOARD = 30  # 30 seconds for dashboard summary
+LOCAL_CACHE_TTL = 2.0  # In-process L1 in front of Redis (absorbs dashboard polling)
+
+# Browser cache policy for the polled dashboard summary
+DASHBOARD_CACHE_CONTROL = "private, max-age=10, stale-while-revalidate=30"
+
+# Per-process L1 caches (checked before Redis / SQL)
+_local_dashboard_summary = LocalTTLCache(ttl=LOCAL_CACHE_TTL, maxsize=1)
+_local_daily_trends = LocalTTLCache(ttl=LOCAL_CACHE_TTL, maxsize=8)
+
+# Drop the L1 entries as soon as Postgres reports a lead change
+register_lead_change_handler(_local_dashboard_summary.clear)
+register_lead_change_handler(_local_daily_trends.clear)
+
+# Calendar labels, built once at import (indexed by weekday / month - 1)
+_DOW = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTH = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+_MONDAY_ANCHOR = date(2024, 1, 1).toordinal()  # Any Monday; weekday = (ordinal - anchor) % 7
+
+
+def _fmt_label(d: date) -> str:
+    """Short chart label for a day, e.g. 'Jan 5'."""
+    return f"{_MONTH[d.month - 1]} {d.day}"
+
+
+@functools.lru_cache(maxsize=8)
+def _calendar(days: int, today_ordinal: int) -> tuple:
+    """
+    Per-day strings for a trend window ending today, oldest first.
+    
+    Keyed by today's ordinal, so each (period, day) pair is formatted once
+    and reused by every poll until midnight UTC.
+    
+    Args:
+        days: Window length including today
+        today_ordinal: date.toordinal() of the last day
+    
+    Returns:
+        (ordinals, date_keys, labels, dow_names) tuples
+    """
+    ordinals = tuple(range(today_ordinal - days + 1, today_ordinal + 1))
+    dates = [date.fromordinal(o) for o in ordinals]
+    return (
+        ordinals,
+        tuple(d.isoformat() for d in dates),
+        tuple(_fmt_label(d) for d in dates),
+        tuple(_DOW[(o - _MONDAY_ANCHOR) % 7] for o in ordinals),
+    )
+
+
+def _conditional_json_response(request: Request, content: dict, cache_control: str) -> Response:
+    """
+    Serialize content once and answer with 304 if the client's ETag matches.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        content: JSON-serializable payload
+        cache_control: Cache-Control header value
+    
+    Returns:
+        304 Response on ETag match, otherwise the JSON body with ETag set
+    """
+    body = orjson.dumps(content)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 # =============================================================================
@@ -171,11 +252,12 @@ async def get_queue_metrics(
         logger.debug(f"Queue metrics cache hit for {queue_type.value} ({(time.time() - start_time) * 1000:.2f}ms)")
         return QueueMetricsResponse(**cached_data)
     
-    # Cache miss - compute
-    def compute_queue_metrics():
-        return _compute_queue_metrics(queue_type, db)
+    # Cache miss - compute off the event loop (sync session queries), and
+    # wait for another worker's result with the async (non-blocking) poll
+    async def compute_queue_metrics():
+        return await run_in_threadpool(_compute_queue_metrics, queue_type, db)
     
-    result = cache.get_or_compute(
+    result = await cache.get_or_compute_async(
         key=cache_key,
         compute_func=compute_queue_metrics,
         ttl=CACHE_TTL_QUEUE_METRICS,
@@ -184,7 +266,7 @@ async def get_queue_metrics(
     
     if result is None:
         # Fallback if cache fails
-        result = _compute_queue_metrics(queue_type, db)
+        result = await compute_queue_metrics()
     
     query_time = (time.time() - start_time) * 1000
     logger.debug(f"Queue metrics for {queue_type.value} computed in {query_time:.2f}ms")
@@ -561,6 +643,33 @@ async def get_monthly_trends(
 # Daily Trends Endpoint
 # =============================================================================
 
+# Daily aggregation built once at import; start_date is a bind parameter so
+# every period reuses the same compiled SQL from the engine's compiled cache
+_DAILY_TRENDS_DAY = func.date_trunc('day', Lead.created_at)
+_DAILY_TRENDS_STMT = select(
+    _DAILY_TRENDS_DAY.label('day'),
+    func.count(Lead.id).label('total_leads'),
+    func.sum(
+        case((Lead.priority == PriorityType.HOT, 1), else_=0)
+    ).label('hot_leads'),
+    func.sum(
+        case((Lead.priority == PriorityType.MEDIUM, 1), else_=0)
+    ).label('medium_leads'),
+    func.sum(
+        case((Lead.priority == PriorityType.LOW, 1), else_=0)
+    ).label('low_leads'),
+    func.sum(
+        case((Lead.status.in_([LeadStatus.SCHEDULED, LeadStatus.CONSULTATION_COMPLETE]), 1), else_=0)
+    ).label('scheduled_count'),
+).where(
+    Lead.created_at >= bindparam('start_date', type_=Lead.created_at.type)
+).group_by(
+    _DAILY_TRENDS_DAY
+).order_by(
+    _DAILY_TRENDS_DAY
+)
+
+
 @router.get(
     "/analytics/trends/daily",
     response_model=DailyTrendsResponse,
@@ -569,21 +678,29 @@ async def get_monthly_trends(
 )
 async def get_daily_trends(
     period: DailyTrendPeriod = Query(DailyTrendPeriod.THIRTY_DAYS, description="Time period"),
-    db: Session = Depends(get_db),
-) -> DailyTrendsResponse:
+    db: AsyncSession = Depends(get_async_db),
+) -> ORJSONResponse:
     """
     Get lead trends aggregated by day.
     
     Provides daily lead counts for trend visualization.
     Best for short-term analysis (7-60 days).
     
+    Uses AsyncSession so the aggregate does not block the event loop, and
+    returns pre-built JSON (response_model documents the schema only).
+    
     Args:
         period: Time period to retrieve
-        db: Database session
+        db: Async database session
         
     Returns:
         Daily trend data with summary statistics
     """
+    # In-process L1: identical for every caller within LOCAL_CACHE_TTL
+    local_hit = _local_daily_trends.get(period.value)
+    if local_hit is not None:
+        return ORJSONResponse(content=local_hit)
+    
     now = datetime.now(timezone.utc)
     today = now.replace(hour=0, minute=0, second=0, microsecond=0)
     
@@ -597,79 +714,50 @@ async def get_daily_trends(
     days = period_days.get(period, 30)
     start_date = today - timedelta(days=days - 1)  # Include today
     
-    # Query with daily aggregation using date_trunc
-    daily_data = db.query(
-        func.date_trunc('day', Lead.created_at).label('day'),
-        func.count(Lead.id).label('total_leads'),
-        func.sum(
-            case((Lead.priority == PriorityType.HOT, 1), else_=0)
-        ).label('hot_leads'),
-        func.sum(
-            case((Lead.priority == PriorityType.MEDIUM, 1), else_=0)
-        ).label('medium_leads'),
-        func.sum(
-            case((Lead.priority == PriorityType.LOW, 1), else_=0)
-        ).label('low_leads'),
-        func.sum(
-            case((Lead.status.in_([LeadStatus.SCHEDULED, LeadStatus.CONSULTATION_COMPLETE]), 1), else_=0)
-        ).label('scheduled_count'),
-    ).filter(
-        Lead.created_at >= start_date
-    ).group_by(
-        func.date_trunc('day', Lead.created_at)
-    ).order_by(
-        func.date_trunc('day', Lead.created_at)
-    ).all()
-    
-    # Create a dict for quick lookup
-    data_by_date = {}
-    for row in daily_data:
-        date_key = row.day.strftime('%Y-%m-%d')
-        data_by_date[date_key] = row
-    
-    # Day name mapping
-    day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    # Daily aggregation (prebuilt statement, date boundary bound per call)
+    daily_data = (await db.execute(_DAILY_TRENDS_STMT, {"start_date": start_date})).all()
+    
+    # Create a dict for quick lookup, keyed by proleptic ordinal
+    data_by_ordinal = {row.day.toordinal(): row for row in daily_data}
     
     # Generate complete date range (fill missing days with 0)
-    data_points: List[DailyTrendDataPoint] = []
-    total_leads_sum = 0
-    peak_day = None
-    peak_count = 0
+    data_points: List[dict] = []
+    totals: List[int] = []
     
-    current_date = start_date
-    while current_date <= today:
-        date_key = current_date.strftime('%Y-%m-%d')
-        row = data_by_date.get(date_key)
+    ordinals, date_keys, labels, dow_names = _calendar(days, today.toordinal())
+    for ordinal, date_key, label, dow in zip(ordinals, date_keys, labels, dow_names):
+        row = data_by_ordinal.get(ordinal)
         
         total = row.total_leads if row else 0
         scheduled = row.scheduled_count if row else 0
         conversion_rate = (scheduled / total * 100) if total > 0 else 0.0
         
-        point = DailyTrendDataPoint(
-            date=date_key,
-            label=f"{month_names[current_date.month - 1]} {current_date.day}",
-            day_of_week=day_names[current_date.weekday()],
-            total_leads=total,
-            hot_leads=row.hot_leads if row else 0,
-            medium_leads=row.medium_leads if row else 0,
-            low_leads=row.low_leads if row else 0,
-            scheduled_count=scheduled,
-            conversion_rate=round(conversion_rate, 1),
-        )
+        point = {
+            "date": date_key,
+            "label": label,
+            "day_of_week": dow,
+            "total_leads": total,
+            "hot_leads": row.hot_leads if row else 0,
+            "medium_leads": row.medium_leads if row else 0,
+            "low_leads": row.low_leads if row else 0,
+            "scheduled_count": scheduled,
+            "conversion_rate": round(conversion_rate, 1),
+        }
         data_points.append(point)
-        
-        total_leads_sum += total
-        if total > peak_count:
-            peak_count = total
-            peak_day = f"{month_names[current_date.month - 1]} {current_date.day}"
-        
-        current_date += timedelta(days=1)
+        totals.append(total)
     
-    # Calculate summary
+    # Calculate summary with C-level reductions over the totals column
+    # (max() keeps the first peak, matching the previous strict '>' scan)
     num_days = len(data_points) if data_points else 1
+    total_leads_sum = sum(totals)
     daily_average = total_leads_sum / num_days
+    peak_day = None
+    peak_count = 0
+    if totals:
+        peak_idx = max(range(len(totals)), key=totals.__getitem__)
+        if totals[peak_idx] > 0:
+            peak_count = totals[peak_idx]
+            peak_day = data_points[peak_idx]["label"]
     
     summary = {
         "total_leads": total_leads_sum,
@@ -679,11 +767,14 @@ async def get_daily_trends(
         "num_days": num_days,
     }
     
-    return DailyTrendsResponse(
-        period=period.value,
-        data=data_points,
-        summary=summary,
-    )
+    result = {
+        "period": period.value,
+        "data": data_points,
+        "summary": summary,
+    }
+    _local_daily_trends.set(period.value, result)
+    
+    return ORJSONResponse(content=result)
 
 
 # =============================================================================
@@ -723,8 +814,9 @@ class DashboardSummaryResponse(BaseModel):
     description="Get quick summary metrics for the main dashboard with Redis caching.",
 )
 async def get_dashboard_summary(
-    db: Session = Depends(get_db),
-) -> DashboardSummaryResponse:
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
     """
     Get quick summary metrics for the main dashboard.
     
@@ -752,119 +844,52 @@ async def get_dashboard_summary(
     
     leads_today: Non-deleted leads created today
     
-    OPTIMIZED with Redis caching:
-    - 30-second cache TTL
-    - Stampede prevention with distributed locking
-    - Sub-10ms response times for cached data
+    OPTIMIZED with write-maintained Redis counters:
+    - Counters updated via HINCRBY on every committed Lead write
+    - Reconciled from SQL every 5 minutes (Celery beat) to correct drift
+    - SQL aggregate only on a missing/rolled-over hash, with stampede prevention
+    - Sub-10ms response times (one HGETALL)
+    - AsyncSession so a cache miss does not block the event loop
+    - Returns pre-built ORJSON (no Pydantic round-trip on the hot path)
+    - 2s in-process L1 in front of Redis for polling bursts
+    - ETag + Cache-Control (private, max-age=10) so browsers skip most
+      polls entirely and revalidate the rest with a bodiless 304
     
     This is a single call that returns all key metrics
     for the dashboard overview.
     """
     start_time = time.time()
+    
+    # In-process L1 first: absorbs polling bursts without a Redis round-trip
+    local_hit = _local_dashboard_summary.get(CACHE_PREFIX_DASHBOARD_SUMMARY)
+    if local_hit is not None:
+        return _conditional_json_response(request, local_hit, DASHBOARD_CACHE_CONTROL)
+    
     cache = get_cache()
     cache_key = CACHE_PREFIX_DASHBOARD_SUMMARY
     
-    # Try cache first
+    # Write-maintained counters first: a single HGETALL, kept current by the
+    # Lead write hooks in services/dashboard_counters.py
+    counters = read_dashboard_summary()
+    if counters is not None:
+        logger.debug(f"Dashboard summary served from counters ({(time.time() - start_time) * 1000:.2f}ms)")
+        _local_dashboard_summary.set(cache_key, counters)
+        return _conditional_json_response(request, counters, DASHBOARD_CACHE_CONTROL)
+    
+    # Try cache next
     cached_data = cache.get(cache_key)
     if cached_data:
         logger.debug(f"Dashboard summary cache hit ({(time.time() - start_time) * 1000:.2f}ms)")
-        return DashboardSummaryResponse(**cached_data)
+        _local_dashboard_summary.set(cache_key, cached_data)
+        return _conditional_json_response(request, cached_data, DASHBOARD_CACHE_CONTROL)
     
-    # Cache miss - compute with stampede prevention
-    def compute_dashboard_summary():
-        now = datetime.now(timezone.utc)
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_start = today_start - timedelta(days=today_start.weekday())
-        
-        # CRITICAL FIX: Filter out soft-deleted leads from ALL metrics
-        # This ensures KPI counts match the table which uses: Lead.deleted_at.is_(None)
-        # Without this filter, deleted leads inflate the total_leads count
-        base_filter = Lead.deleted_at.is_(None)
-        
-        # Terminal statuses to exclude for "active" leads
-        # These match the frontend's activeLeads filter:
-        # !['consultation complete', 'treatment started', 'lost', 'disqualified'].includes(l.status)
-        terminal_statuses = [
-            LeadStatus.CONSULTATION_COMPLETE,
-            LeadStatus.TREATMENT_STARTED,
-            LeadStatus.LOST,
-            LeadStatus.DISQUALIFIED,
-        ]
-        
-        # Use a single efficient query with multiple aggregations
-        # All counts now include the base_filter to exclude soft-deleted leads
-        summary_query = db.query(
-            # total_leads: All non-deleted leads (for historical context)
-            func.count(Lead.id).filter(base_filter).label('total_leads'),
-            # active_leads: Non-deleted leads EXCLUDING terminal statuses (MATCHES TABLE VIEW)
-            # This is the count that should match the "All Active Leads" table
-            func.count(Lead.id).filter(
-                base_filter,
-                Lead.status.notin_(terminal_statuses)
-            ).label('active_leads'),
-            # hot_leads: Non-deleted HOT priority leads (in active statuses only)
-            func.count(Lead.id).filter(
-                base_filter,
-                Lead.priority == PriorityType.HOT,
-                Lead.status.notin_(terminal_statuses)
-            ).label('hot_leads'),
-            # new_leads: Non-deleted leads that have never been contacted
-            func.count(Lead.id).filter(
-                base_filter,
-                or_(Lead.contact_outcome == ContactOutcome.NEW, Lead.contact_outcome.is_(None))
-            ).label('new_leads'),
-            # leads_this_week: Non-deleted leads created this week
-            func.count(Lead.id).filter(base_filter, Lead.created_at >= week_start).label('leads_this_week'),
-            # leads_today: Non-deleted leads created today
-            func.count(Lead.id).filter(base_filter, Lead.created_at >= today_start).label('leads_today'),
-            # total_contacted: Non-deleted leads with any contact attempt
-            func.count(Lead.id).filter(
-                base_filter,
-                Lead.contact_outcome.isnot(None),
-                Lead.contact_outcome != ContactOutcome.NEW
-            ).label('total_contacted'),
-            # answered: Non-deleted leads that responded positively
-            func.count(Lead.id).filter(
-                base_filter,
-                Lead.contact_outcome.in_([ContactOutcome.ANSWERED, ContactOutcome.CALLBACK_REQUESTED])
-            ).label('answered'),
-            # scheduled: Non-deleted leads that reached scheduling stage
-            func.count(Lead.id).filter(
-                base_filter,
-                Lead.status.in_([LeadStatus.SCHEDULED, LeadStatus.CONSULTATION_COMPLETE])
-            ).label('scheduled'),
-        ).first()
-        
-        # Scheduled today (requires date filter on scheduled_callback_at)
-        tomorrow_start = today_start + timedelta(days=1)
-        scheduled_today = db.query(func.count(Lead.id)).filter(
-            Lead.status == LeadStatus.SCHEDULED,
-            Lead.scheduled_callback_at >= today_start,
-            Lead.scheduled_callback_at < tomorrow_start,
-        ).scalar() or 0
-        
-        total_leads = summary_query.total_leads or 0
-        total_contacted = summary_query.total_contacted or 0
-        answered = summary_query.answered or 0
-        scheduled = summary_query.scheduled or 0
-        
-        response_rate = (answered / total_contacted * 100) if total_contacted > 0 else 0.0
-        conversion_rate = (scheduled / total_leads * 100) if total_leads > 0 else 0.0
-        
-        return {
-            "total_leads": total_leads,
-            "active_leads": summary_query.active_leads or 0,  # MATCHES TABLE COUNT
-            "hot_leads": summary_query.hot_leads or 0,
-            "new_leads": summary_query.new_leads or 0,
-            "scheduled_today": scheduled_today,
-            "overall_response_rate": round(response_rate, 1),
-            "overall_conversion_rate": round(conversion_rate, 1),
-            "leads_this_week": summary_query.leads_this_week or 0,
-            "leads_today": summary_query.leads_today or 0,
-        }
+    # Cache miss - recompute from SQL (also re-seeds the write-maintained
+    # counters so subsequent reads are served from them)
+    async def compute_dashboard_summary():
+        return await reconcile_dashboard_counters_async(db)
     
     # Use cache with stampede prevention
-    result = cache.get_or_compute(
+    result = await cache.get_or_compute_async(
         key=cache_key,
         compute_func=compute_dashboard_summary,
         ttl=CACHE_TTL_DASHBOARD,
@@ -873,9 +898,10 @@ async def get_dashboard_summary(
     
     if result is None:
         # Fallback if cache fails
-        result = compute_dashboard_summary()
+        result = await compute_dashboard_summary()
     
     query_time = (time.time() - start_time) * 1000
     logger.debug(f"Dashboard summary computed in {query_time:.2f}ms")
     
-    return DashboardSummaryResponse(**result)
+    _local_dashboard_summary.set(cache_key, result)
+    return _conditional_json_response(request, result, DASHBOARD_CACHE_CONTROL)
@@ -7,15 +7,18 @@ Notes form a chronological log for coordinator-specialist handoff.
 
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Iterator, List, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+import orjson
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, exists, func, insert, literal, select, tuple_, update
 
-from ..core.database import get_db
+from ..core.database import SessionLocal, get_db
 from ..core.auth import get_current_user, require_role
 from ..models.lead import Lead
 from ..models.lead_note import LeadNote
@@ -26,6 +29,12 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/leads", tags=["Lead Notes"])
 
+# Rows fetched per server-side cursor batch when streaming NDJSON
+NDJSON_BATCH_SIZE = 200
+
+# Page size when a cursor is passed without an explicit limit
+NOTES_DEFAULT_PAGE_SIZE = 100
+
 
 # =============================================================================
 # Schemas
@@ -52,6 +61,74 @@ class NoteResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def _parse_notes_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Parse a notes pagination cursor.
+    
+    Cursor format matches /api/analytics/leads-cursor: "<created_at ISO>_<uuid>".
+    
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        cursor_timestamp, cursor_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(cursor_timestamp), UUID(cursor_id)
+    except (ValueError, IndexError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def _note_row_to_dict(row, fallback_created_at: str) -> dict:
+    """Build a NoteResponse-shaped dict from a selected notes row mapping."""
+    return {
+        "id": str(row["id"]),
+        "lead_id": str(row["lead_id"]),
+        "note_text": row["note_text"],
+        "created_by": str(row["created_by"]) if row["created_by"] else None,
+        "created_by_name": row["created_by_name"] or "System",
+        "note_type": row["note_type"] or "manual",
+        "related_outcome": row["related_outcome"],
+        "created_at": row["created_at"].isoformat() if row["created_at"] else fallback_created_at,
+    }
+
+
+def _stream_notes_ndjson(stmt) -> Iterator[bytes]:
+    """
+    Yield notes as NDJSON lines, fetched in batches via a server-side cursor.
+    
+    Opens its own session: the request-scoped get_db session is closed
+    before a streaming body starts. Closing the generator (client
+    disconnect) closes the cursor and the session.
+    """
+    db = SessionLocal()
+    try:
+        fallback_created_at = datetime.now(timezone.utc).isoformat()
+        result = db.execute(stmt.execution_options(yield_per=NDJSON_BATCH_SIZE)).mappings()
+        for row in result:
+            yield orjson.dumps(_note_row_to_dict(row, fallback_created_at)) + b"\n"
+    finally:
+        db.close()
+
+
+def _active_lead_exists(lead_id: UUID):
+    """EXISTS clause for a non-deleted lead (evaluated once as an InitPlan)."""
+    return exists().where(Lead.id == lead_id, Lead.deleted_at.is_(None))
+
+
+def _lead_not_found() -> HTTPException:
+    """404 raised when the lead is missing or soft-deleted."""
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Lead not found",
+    )
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -60,58 +137,106 @@ class NoteResponse(BaseModel):
     "/{lead_id}/notes",
     response_model=List[NoteResponse],
     summary="Get Lead Notes",
-    description="Get all notes for a lead in reverse chronological order.",
+    description=(
+        "Get notes for a lead in reverse chronological order. Returns every note "
+        "unless ?limit= or ?cursor= is given; then keyset-paginated: pass the "
+        "X-Next-Cursor response header back as ?cursor= for older notes. "
+        "With ?format=ndjson, streams every note (older than ?cursor=) one JSON object per line."
+    ),
     dependencies=[Depends(get_current_user)],
 )
 async def get_lead_notes(
     lead_id: UUID,
     request: Request,
     db: Session = Depends(get_db),
+    limit: Optional[int] = Query(default=None, ge=1, le=500, description="Notes per page (default: all notes)"),
+    cursor: Optional[str] = Query(default=None, description="Pagination cursor from X-Next-Cursor"),
+    format: Literal["json", "ndjson"] = Query(default="json", description="Response format"),
 ) -> List[NoteResponse]:
     """
-    Get all notes for a lead, newest first.
+    Get notes for a lead, newest first.
+    
+    Without limit or cursor every note is returned, as existing clients
+    expect. Otherwise uses keyset pagination on (created_at, id), backed by
+    idx_lead_notes_lead_created, so fetch time is independent of how many
+    notes the lead has. When more notes exist, the cursor for the next page
+    is returned in the X-Next-Cursor header (the body stays a plain list).
+    
+    Selects only the response columns (no ORM entity hydration or joined
+    author load) and returns pre-serialized JSON; response_model is kept
+    for the OpenAPI schema only.
+    
+    With format=ndjson the full history (after the cursor) is streamed as
+    application/x-ndjson, fetched in batches with yield_per, so very long
+    histories never materialize as one list; limit does not apply.
     
     Args:
         lead_id: UUID of the lead
         request: FastAPI request
         db: Database session
+        limit: Maximum notes to return (all notes when omitted without a cursor)
+        cursor: Cursor of the last note from the previous page
+        format: "json" (paginated list) or "ndjson" (streamed)
     
     Returns:
         List of notes in reverse chronological order
     """
-    # Verify lead exists
-    lead = db.query(Lead).filter(
-        Lead.id == lead_id,
-        Lead.deleted_at.is_(None)
-    ).first()
+    # Notes query (newest first), optionally continued from a cursor. The
+    # lead check is folded in as an EXISTS guard, so the common case is a
+    # single round-trip; only an empty page needs a separate lookup to tell
+    # "no notes" from "no lead".
+    stmt = select(
+        LeadNote.id,
+        LeadNote.lead_id,
+        LeadNote.note_text,
+        LeadNote.created_by,
+        LeadNote.created_by_name,
+        LeadNote.note_type,
+        LeadNote.related_outcome,
+        LeadNote.created_at,
+    ).where(LeadNote.lead_id == lead_id, _active_lead_exists(lead_id))
+    if cursor:
+        cursor_created_at, cursor_id = _parse_notes_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(LeadNote.created_at, LeadNote.id) < tuple_(cursor_created_at, cursor_id)
+        )
+    stmt = stmt.order_by(desc(LeadNote.created_at), desc(LeadNote.id))
     
-    if not lead:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Lead not found",
+    if format == "ndjson":
+        # Status is sent before the first line, so 404 must be decided up front
+        if not db.execute(select(_active_lead_exists(lead_id))).scalar():
+            raise _lead_not_found()
+        return StreamingResponse(
+            _stream_notes_ndjson(stmt),
+            media_type="application/x-ndjson",
         )
     
-    # Fetch notes
-    notes = (
-        db.query(LeadNote)
-        .filter(LeadNote.lead_id == lead_id)
-        .order_by(desc(LeadNote.created_at))
-        .all()
-    )
+    # Unpaginated request: return the full history
+    if limit is None and not cursor:
+        rows = db.execute(stmt).mappings().all()
+        if not rows and not db.execute(select(_active_lead_exists(lead_id))).scalar():
+            raise _lead_not_found()
+        fallback_created_at = datetime.now(timezone.utc).isoformat()
+        return ORJSONResponse(content=[_note_row_to_dict(row, fallback_created_at) for row in rows])
     
-    return [
-        NoteResponse(
-            id=str(note.id),
-            lead_id=str(note.lead_id),
-            note_text=note.note_text,
-            created_by=str(note.created_by) if note.created_by else None,
-            created_by_name=note.created_by_name or "System",
-            note_type=note.note_type or "manual",
-            related_outcome=note.related_outcome,
-            created_at=note.created_at.isoformat() if note.created_at else datetime.now(timezone.utc).isoformat(),
-        )
-        for note in notes
-    ]
+    if limit is None:
+        limit = NOTES_DEFAULT_PAGE_SIZE
+    
+    # Fetch one page of notes (one extra row to detect a next page)
+    rows = db.execute(stmt.limit(limit + 1)).mappings().all()
+    if not rows and not db.execute(select(_active_lead_exists(lead_id))).scalar():
+        raise _lead_not_found()
+    
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_row = rows[-1]
+        headers["X-Next-Cursor"] = f"{last_row['created_at'].isoformat()}_{last_row['id']}"
+    
+    fallback_created_at = datetime.now(timezone.utc).isoformat()
+    notes = [_note_row_to_dict(row, fallback_created_at) for row in rows]
+    
+    return ORJSONResponse(content=notes, headers=headers)
 
 
 @router.post(
@@ -145,48 +270,63 @@ async def create_lead_note(
     Returns:
         Created note
     """
-    # Verify lead exists
-    lead = db.query(Lead).filter(
-        Lead.id == lead_id,
-        Lead.deleted_at.is_(None)
-    ).first()
-    
-    if not lead:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Lead not found",
-        )
-    
     try:
-        # Create note
-        note = LeadNote(
-            lead_id=lead_id,
-            note_text=note_data.note_text.strip(),
-            created_by=current_user.id,
-            created_by_name=current_user.full_name,
-            note_type=note_data.note_type or "manual",
-            related_outcome=note_data.related_outcome,
+        note_text = note_data.note_text.strip()
+        note_type = note_data.note_type or "manual"
+        
+        # INSERT ... SELECT guarded by EXISTS: verifies the lead and inserts
+        # the note in one round-trip, returning server-generated
+        # id/created_at (no ORM instance, identity map, or refresh SELECT).
+        # No row back means the lead is missing or deleted.
+        note_columns = (
+            LeadNote.lead_id,
+            LeadNote.note_text,
+            LeadNote.created_by,
+            LeadNote.created_by_name,
+            LeadNote.note_type,
+            LeadNote.related_outcome,
         )
+        note_values = select(
+            literal(lead_id, LeadNote.lead_id.type),
+            literal(note_text, LeadNote.note_text.type),
+            literal(current_user.id, LeadNote.created_by.type),
+            literal(current_user.full_name, LeadNote.created_by_name.type),
+            literal(note_type, LeadNote.note_type.type),
+            literal(note_data.related_outcome, LeadNote.related_outcome.type),
+        ).where(_active_lead_exists(lead_id))
+        created = db.execute(
+            insert(LeadNote)
+            .from_select([column.key for column in note_columns], note_values)
+            .returning(LeadNote.id, LeadNote.created_at)
+        ).first()
         
-        db.add(note)
+        if created is None:
+            db.rollback()
+            raise _lead_not_found()
         
-        # Update lead's last_updated_at timestamp
-        lead.last_updated_at = datetime.now(timezone.utc)
+        # Update lead's last_updated_at timestamp in the same transaction
+        db.execute(
+            update(Lead)
+            .where(Lead.id == lead_id)
+            .values(last_updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
         
         db.commit()
-        db.refresh(note)
         
         return NoteResponse(
-            id=str(note.id),
-            lead_id=str(note.lead_id),
-            note_text=note.note_text,
-            created_by=str(note.created_by) if note.created_by else None,
-            created_by_name=note.created_by_name,
-            note_type=note.note_type,
-            related_outcome=note.related_outcome,
-            created_at=note.created_at.isoformat(),
+            id=str(created.id),
+            lead_id=str(lead_id),
+            note_text=note_text,
+            created_by=str(current_user.id),
+            created_by_name=current_user.full_name,
+            note_type=note_type,
+            related_outcome=note_data.related_outcome,
+            created_at=created.created_at.isoformat(),
         )
     
+    except HTTPException:
+        raise
     except Exception as e:
         db.rollback()
         logger.error(f"Error creating note for lead {lead_id}: {e}", exc_info=True)
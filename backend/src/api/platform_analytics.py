@@ -5,10 +5,12 @@ High-performance REST API for platform performance analytics.
 Designed for <200ms response times with millions of leads.
 """
 
+import hashlib
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from ..core.database import get_db
@@ -22,6 +24,51 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/platform-analytics", tags=["Platform Analytics"])
 
+# Shared CDN/browser policy for summary-derived analytics responses;
+# stale-if-error lets caches keep serving the last good body during DB blips
+ANALYTICS_CACHE_CONTROL = (
+    "public, s-maxage=60, stale-while-revalidate=300, stale-if-error=86400"
+)
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def _analytics_response(
+    request: Request,
+    content: dict,
+    *etag_parts: Optional[str],
+    headers: Optional[dict] = None,
+) -> Response:
+    """
+    Serialize an analytics payload with orjson, with cache validators.
+    
+    Summary payloads contain only JSON-native values, so they are handed
+    straight to ORJSONResponse (skipping FastAPI's jsonable_encoder pass).
+    A weak ETag derived from the summary's refreshedAt (plus any request
+    parameters that shape the body) short-circuits revalidations with 304.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        content: JSON-native response body
+        etag_parts: Values the response body depends on
+        headers: Extra response headers
+    
+    Returns:
+        304 Response if the client's copy is current, otherwise ORJSONResponse
+    """
+    digest = hashlib.blake2b(
+        "|".join(part or "" for part in etag_parts).encode(), digest_size=8
+    ).hexdigest()
+    etag = f'W/"{digest}"'
+    response_headers = {"ETag": etag, "Cache-Control": ANALYTICS_CACHE_CONTROL, **(headers or {})}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=response_headers)
+    return ORJSONResponse(content=content, headers=response_headers)
+
 
 # =============================================================================
 # Platform Summary Endpoints
@@ -29,7 +76,7 @@ router = APIRouter(prefix="/platform-analytics", tags=["Platform Analytics"])
 
 @router.get("/summary")
 async def get_platform_summary(
-    response: Response,
+    request: Request,
     period: str = Query(
         default="30d",
         description="Time period for analytics",
@@ -61,11 +108,13 @@ async def get_platform_summary(
         service = get_platform_analytics_service(db)
         result = service.get_platform_summary(period)
         
-        # Set cache headers for CDN/browser
-        response.headers["Cache-Control"] = "public, s-maxage=60, stale-while-revalidate=300"
-        response.headers["X-Data-Freshness"] = result.get("refreshedAt", "")
-        
-        return result
+        # Cache headers for CDN/browser
+        return _analytics_response(
+            request,
+            result,
+            "summary", period, result.get("refreshedAt"),
+            headers={"X-Data-Freshness": result.get("refreshedAt") or ""},
+        )
     except Exception as e:
         logger.error(f"Error fetching platform summary: {e}")
         raise HTTPException(
@@ -152,7 +201,7 @@ async def get_platform_details(
             )
         
         # Set cache headers
-        response.headers["Cache-Control"] = "public, s-maxage=60, stale-while-revalidate=300"
+        response.headers["Cache-Control"] = ANALYTICS_CACHE_CONTROL
         
         return {
             "platform": platform_data,
@@ -207,7 +256,7 @@ async def get_platform_trends(
                 trends[platform_id] = platform_data.get("growthMetrics", [])
         
         # Set cache headers
-        response.headers["Cache-Control"] = "public, s-maxage=60, stale-while-revalidate=300"
+        response.headers["Cache-Control"] = ANALYTICS_CACHE_CONTROL
         
         return {
             "trends": trends,
@@ -274,7 +323,7 @@ async def get_platform_comparison(
         comparison.sort(key=lambda x: x["value"] or 0, reverse=True)
         
         # Set cache headers
-        response.headers["Cache-Control"] = "public, s-maxage=60, stale-while-revalidate=300"
+        response.headers["Cache-Control"] = ANALYTICS_CACHE_CONTROL
         
         return {
             "comparison": comparison,
@@ -344,7 +393,7 @@ async def get_platform_activity(
 
 @router.get("/insights")
 async def get_platform_insights(
-    response: Response,
+    request: Request,
     period: str = Query(default="30d", regex="^(7d|30d|90d|all)$"),
     db: Session = Depends(get_db)
 ):
@@ -356,19 +405,23 @@ async def get_platform_insights(
     - Fastest growing platform
     - Highest quality lead source
     - Platforms needing attention
+    
+    Shares the per-process summary memo with the other summary-derived
+    endpoints; revalidations with a matching ETag get a 304.
     """
     try:
         service = get_platform_analytics_service(db)
         summary = service.get_platform_summary(period)
         
-        # Set cache headers
-        response.headers["Cache-Control"] = "public, s-maxage=60, stale-while-revalidate=300"
-        
-        return {
-            "insights": summary.get("insights", []),
-            "period": summary.get("period"),
-            "refreshedAt": summary.get("refreshedAt")
-        }
+        return _analytics_response(
+            request,
+            {
+                "insights": summary.get("insights", []),
+                "period": summary.get("period"),
+                "refreshedAt": summary.get("refreshedAt")
+            },
+            "insights", period, summary.get("refreshedAt"),
+        )
     except Exception as e:
         logger.error(f"Error fetching platform insights: {e}")
         raise HTTPException(
@@ -383,7 +436,7 @@ async def get_platform_insights(
 
 @router.get("/status-funnel")
 async def get_status_funnel(
-    response: Response,
+    request: Request,
     platform: Optional[str] = Query(default=None, description="Filter by platform"),
     db: Session = Depends(get_db)
 ):
@@ -394,6 +447,9 @@ async def get_status_funnel(
     - NEW → CONTACTED → SCHEDULED → CONSULTATION_COMPLETE → TREATMENT_STARTED
     - Lost and Disqualified counts
     - Drop-off percentages between stages
+    
+    Served from the shared per-process summary memo; revalidations with a
+    matching ETag get a 304.
     """
     try:
         service = get_platform_analytics_service(db)
@@ -412,13 +468,14 @@ async def get_status_funnel(
                 "distribution": platform_data.get("statusDistribution", [])
             }
         
-        # Set cache headers
-        response.headers["Cache-Control"] = "public, s-maxage=60, stale-while-revalidate=300"
-        
-        return {
-            "funnel": funnel_data,
-            "refreshedAt": summary.get("refreshedAt")
-        }
+        return _analytics_response(
+            request,
+            {
+                "funnel": funnel_data,
+                "refreshedAt": summary.get("refreshedAt")
+            },
+            "status-funnel", platform, summary.get("refreshedAt"),
+        )
     except Exception as e:
         logger.error(f"Error fetching status funnel: {e}")
         raise HTTPException(
@@ -429,7 +486,7 @@ async def get_status_funnel(
 
 @router.get("/quality-distribution")
 async def get_quality_distribution(
-    response: Response,
+    request: Request,
     platform: Optional[str] = Query(default=None, description="Filter by platform"),
     db: Session = Depends(get_db)
 ):
@@ -441,6 +498,9 @@ async def get_quality_distribution(
     - MEDIUM
     - LOW
     - DISQUALIFIED
+    
+    Served from the shared per-process summary memo; revalidations with a
+    matching ETag get a 304.
     """
     try:
         service = get_platform_analytics_service(db)
@@ -460,13 +520,14 @@ async def get_quality_distribution(
                 "qualityScore": platform_data.get("metrics", {}).get("qualityScore", 0)
             }
         
-        # Set cache headers
-        response.headers["Cache-Control"] = "public, s-maxage=60, stale-while-revalidate=300"
-        
-        return {
-            "quality": quality_data,
-            "refreshedAt": summary.get("refreshedAt")
-        }
+        return _analytics_response(
+            request,
+            {
+                "quality": quality_data,
+                "refreshedAt": summary.get("refreshedAt")
+            },
+            "quality-distribution", platform, summary.get("refreshedAt"),
+        )
     except Exception as e:
         logger.error(f"Error fetching quality distribution: {e}")
         raise HTTPException(
@@ -479,28 +540,31 @@ async def get_quality_distribution(
 # Admin/Maintenance Endpoints
 # =============================================================================
 
-@router.post("/refresh")
-async def refresh_analytics(
-    db: Session = Depends(get_db)
-):
+@router.post("/refresh", status_code=202)
+async def refresh_analytics():
     """
-    Manually refresh platform analytics materialized views.
+    Queue a refresh of the platform analytics materialized views.
     
     **Note**: This is automatically done every 5 minutes via Celery.
     Use this endpoint for immediate refresh after significant data changes.
     
+    The refresh runs on a Celery worker (REFRESH MATERIALIZED VIEW
+    CONCURRENTLY, so readers are not blocked) and this endpoint returns
+    202 with the task id immediately.
+    
     **Admin only** - should be protected in production.
     """
     try:
-        service = get_platform_analytics_service(db)
-        result = service.refresh_materialized_views()
+        from ..tasks.lead_tasks import refresh_platform_analytics_views
         
-        return result
+        task = refresh_platform_analytics_views.delay()
+        
+        return {"status": "queued", "task_id": task.id}
     except Exception as e:
-        logger.error(f"Error refreshing analytics: {e}")
+        logger.error(f"Error queueing analytics refresh: {e}")
         raise HTTPException(
             status_code=500,
-            detail="Failed to refresh analytics"
+            detail="Failed to queue analytics refresh"
         )
 
 
@@ -4,19 +4,23 @@ Referring Providers API endpoints.
 Handles provider management, statistics, and referral tracking.
 """
 
+import functools
 import logging
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from dateutil.relativedelta import relativedelta
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func, and_, or_
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import Float, Numeric, bindparam, case, cast, desc, func, insert, or_, select, true, update
 
-from ..core.database import get_db
+from ..core.database import get_db, get_async_db
 from ..models.provider import ReferringProvider, ProviderStatus, ProviderNotesHistory
 from ..models.lead import Lead, LeadStatus
+from ..models.audit_log import AuditAction
 from ..schemas.provider import (
     ProviderCreate,
     ProviderUpdate,
@@ -24,10 +28,18 @@ from ..schemas.provider import (
     ProviderListResponse,
     ProviderDashboardStats,
     ProviderReferralLeadInfo,
+    ProviderNotesBulkCreate,
 )
 from ..schemas.common import PaginatedResponse
-from ..services.audit import AuditService
+from ..services.audit import log_audit_in_background
 from ..services.cache import get_cache
+from ..services.provider_cache import (
+    CACHE_TTL_PROVIDERS,
+    invalidate_provider_cache,
+    provider_cache_key,
+    provider_list_cache_key,
+    provider_notes_cache_key,
+)
 from ..core.auth import get_current_user
 
 
@@ -85,20 +97,179 @@ def provider_to_response(provider: ReferringProvider) -> ProviderResponse:
     )
 
 
-def provider_to_list_response(provider: ReferringProvider) -> ProviderListResponse:
-    """Convert provider model to list response schema."""
-    return ProviderListResponse(
-        id=provider.id,
-        name=provider.name,
-        email=provider.email,  # Added: Include email in list response
-        practice_name=provider.practice_name,
-        specialty=provider.specialty,
-        status=provider.status,
-        total_referrals=provider.total_referrals,
-        converted_referrals=provider.converted_referrals,
-        conversion_rate=provider.conversion_rate,
-        last_referral_at=provider.last_referral_at,
+def check_duplicate_provider(
+    db: Session,
+    email: Optional[str],
+    npi_number: Optional[str],
+    exclude_id: Optional[UUID] = None,
+) -> None:
+    """
+    Raise 409 if another provider already uses this email or NPI.
+    
+    Both uniqueness checks run as a single query; the conflict type is
+    resolved from the returned rows (email is reported first, as before).
+    
+    Args:
+        db: Database session
+        email: Email to check (case-insensitive), or None to skip
+        npi_number: NPI to check, or None to skip
+        exclude_id: Provider being updated (excluded from the check)
+    """
+    conditions = []
+    if email:
+        conditions.append(func.lower(ReferringProvider.email) == email.lower())
+    if npi_number:
+        conditions.append(ReferringProvider.npi_number == npi_number)
+    if not conditions:
+        return
+    
+    query = select(ReferringProvider.email, ReferringProvider.npi_number).where(or_(*conditions))
+    if exclude_id is not None:
+        query = query.where(ReferringProvider.id != exclude_id)
+    rows = db.execute(query.limit(2)).all()
+    
+    if email and any(row.email and row.email.lower() == email.lower() for row in rows):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Provider with email {email} already exists",
+        )
+    if npi_number and any(row.npi_number == npi_number for row in rows):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Provider with NPI {npi_number} already exists",
+        )
+
+
+# Columns for ProviderListResponse, selected directly (no ORM hydration).
+# conversion_rate mirrors ReferringProvider.conversion_rate in SQL.
+PROVIDER_LIST_COLUMNS = (
+    ReferringProvider.id,
+    ReferringProvider.name,
+    ReferringProvider.email,
+    ReferringProvider.practice_name,
+    ReferringProvider.specialty,
+    ReferringProvider.status,
+    ReferringProvider.total_referrals,
+    ReferringProvider.converted_referrals,
+    cast(
+        case(
+            (ReferringProvider.total_referrals == 0, 0),
+            else_=func.round(
+                cast(ReferringProvider.converted_referrals, Numeric) * 100
+                / ReferringProvider.total_referrals,
+                1,
+            ),
+        ),
+        Float,
+    ).label("conversion_rate"),
+    ReferringProvider.last_referral_at,
+)
+
+# Sortable columns for list_providers (unknown sort_by falls back to referrals)
+PROVIDER_SORT_COLUMNS = {
+    "total_referrals": ReferringProvider.total_referrals,
+    "name": ReferringProvider.name,
+    "created_at": ReferringProvider.created_at,
+    "conversion_rate": ReferringProvider.converted_referrals,  # Will sort by converted count
+    "last_referral_at": ReferringProvider.last_referral_at,
+}
+
+
+# =============================================================================
+# Prebuilt Statements
+# =============================================================================
+# Hot statements are built once with bindparams, so each request skips
+# statement construction and hits SQLAlchemy's compiled cache with the same
+# cache key. Values are supplied at execute time.
+
+@functools.lru_cache(maxsize=64)
+def _provider_list_stmts(
+    has_status: bool,
+    has_specialty: bool,
+    has_search: bool,
+    sort_by: str,
+    ascending: bool,
+) -> tuple:
+    """
+    Build the (page, count) statements for one list_providers filter shape.
+    
+    Returns:
+        page statement (with total_count window column, offset/limit
+        bindparams) and the fallback total count statement
+    """
+    query = select(*PROVIDER_LIST_COLUMNS)
+    
+    if has_status:
+        query = query.where(ReferringProvider.status == bindparam("status"))
+    if has_specialty:
+        query = query.where(ReferringProvider.specialty.ilike(bindparam("specialty_pattern")))
+    if has_search:
+        search_term = bindparam("search_term")
+        query = query.where(
+            or_(
+                ReferringProvider.name.ilike(search_term),
+                ReferringProvider.practice_name.ilike(search_term),
+                ReferringProvider.email.ilike(search_term),
+            )
+        )
+    
+    count_stmt = select(func.count()).select_from(query.subquery())
+    
+    sort_column = PROVIDER_SORT_COLUMNS[sort_by]
+    page_stmt = (
+        query.order_by(sort_column if ascending else desc(sort_column))
+        # COUNT(*) OVER () is evaluated over the filtered set before OFFSET/LIMIT
+        .add_columns(func.count().over().label("total_count"))
+        .offset(bindparam("offset"))
+        .limit(bindparam("limit"))
     )
+    return page_stmt, count_stmt
+
+
+def _build_provider_stats_counts_stmt():
+    """All provider dashboard counts as one row (two FILTER aggregates)."""
+    provider_counts = select(
+        func.count().label("total_providers"),
+        func.count().filter(ReferringProvider.status == ProviderStatus.ACTIVE).label("active_providers"),
+        func.count().filter(ReferringProvider.status == ProviderStatus.PENDING).label("pending_providers"),
+    ).subquery()
+    
+    referral_counts = select(
+        func.count().label("total_referrals"),
+        # Converted referrals (reached SCHEDULED or beyond)
+        func.count().filter(
+            Lead.status.in_([
+                LeadStatus.SCHEDULED,
+                LeadStatus.CONSULTATION_COMPLETE,
+                LeadStatus.TREATMENT_STARTED,
+            ])
+        ).label("converted_referrals"),
+        func.count().filter(
+            Lead.created_at >= bindparam("first_of_month", type_=Lead.created_at.type)
+        ).label("referrals_this_month"),
+    ).where(Lead.is_referral == True).subquery()
+    
+    return (
+        select(provider_counts, referral_counts)
+        .select_from(provider_counts.join(referral_counts, true()))
+    )
+
+
+PROVIDER_STATS_COUNTS_STMT = _build_provider_stats_counts_stmt()
+
+
+@functools.lru_cache(maxsize=1)
+def _first_of_current_month(day: date) -> datetime:
+    """UTC midnight on the first of day's month (memoized per UTC day)."""
+    return datetime(day.year, day.month, 1, tzinfo=timezone.utc)
+
+
+TOP_PROVIDERS_STMT = (
+    select(*PROVIDER_LIST_COLUMNS)
+    .where(ReferringProvider.status == ProviderStatus.ACTIVE)
+    .order_by(desc(ReferringProvider.total_referrals))
+    .limit(5)
+)
 
 
 # =============================================================================
@@ -140,64 +311,80 @@ async def list_providers(
     """
     page_size = min(page_size, 100)
     
-    # Build base query
-    query = db.query(ReferringProvider)
-    
     # Apply filters - support both parameter names for compatibility
     effective_status = status_filter or status
     effective_specialty = specialty_filter or specialty
+    search_text = search.strip() if search else None
+    
+    # Versioned page cache (invalidated by INCR on any provider mutation)
+    cache = get_cache()
+    cache_key = provider_list_cache_key(cache, {
+        "page": page,
+        "page_size": page_size,
+        "status": effective_status,
+        "specialty": effective_specialty,
+        "search": search_text,
+        "sort_by": sort_by,
+        "sort_order": sort_order,
+    })
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    page_stmt, count_stmt = _provider_list_stmts(
+        has_status=bool(effective_status),
+        has_specialty=bool(effective_specialty),
+        has_search=bool(search_text),
+        sort_by=sort_by if sort_by in PROVIDER_SORT_COLUMNS else "total_referrals",
+        ascending=sort_order.lower() == "asc",
+    )
     
+    params = {}
     if effective_status:
-        query = query.filter(ReferringProvider.status == effective_status)
+        params["status"] = effective_status
     if effective_specialty:
         # Free text specialty - use case-insensitive LIKE match
-        query = query.filter(ReferringProvider.specialty.ilike(f"%{effective_specialty}%"))
-    
-    # Search by name or practice
-    if search:
-        search_term = f"%{search.strip()}%"
-        query = query.filter(
-            or_(
-                ReferringProvider.name.ilike(search_term),
-                ReferringProvider.practice_name.ilike(search_term),
-                ReferringProvider.email.ilike(search_term),
-            )
-        )
+        params["specialty_pattern"] = f"%{effective_specialty}%"
+    if search_text:
+        # Search by name, practice or email
+        params["search_term"] = f"%{search_text}%"
     
-    # Get total count
-    total = query.count()
-    
-    # Apply sorting
-    sort_column = {
-        "total_referrals": ReferringProvider.total_referrals,
-        "name": ReferringProvider.name,
-        "created_at": ReferringProvider.created_at,
-        "conversion_rate": ReferringProvider.converted_referrals,  # Will sort by converted count
-        "last_referral_at": ReferringProvider.last_referral_at,
-    }.get(sort_by, ReferringProvider.total_referrals)
-    
-    if sort_order.lower() == "asc":
-        query = query.order_by(sort_column)
+    # Page and total from one query
+    offset = (page - 1) * page_size
+    rows = db.execute(
+        page_stmt, {**params, "offset": offset, "limit": page_size}
+    ).mappings().all()
+    
+    if rows:
+        total = rows[0]["total_count"]
+    elif offset > 0:
+        # Past the last page: no row carries the window count
+        total = db.execute(count_stmt, params).scalar_one()
     else:
-        query = query.order_by(desc(sort_column))
+        total = 0
+    
+    # Rows already have the ProviderListResponse shape
+    items = []
+    for row in rows:
+        item = dict(row)
+        del item["total_count"]
+        items.append(item)
     
     # Pagination
     total_pages = (total + page_size - 1) // page_size if total > 0 else 1
-    offset = (page - 1) * page_size
     
-    providers = query.offset(offset).limit(page_size).all()
+    result = jsonable_encoder({
+        "items": items,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "has_next": page < total_pages,
+        "has_previous": page > 1,
+    })
+    cache.set(cache_key, result, ttl=CACHE_TTL_PROVIDERS)
     
-    items = [provider_to_list_response(p).model_dump() for p in providers]
-    
-    return PaginatedResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-        has_next=page < total_pages,
-        has_previous=page > 1,
-    )
+    return result
 
 
 @router.get(
@@ -212,64 +399,40 @@ async def get_provider_stats(
 ) -> ProviderDashboardStats:
     """
     Get dashboard summary statistics for providers.
+    
+    Two queries total: one for every count, one for the top providers.
     """
-    # Count providers by status
-    total_providers = db.query(ReferringProvider).count()
-    active_providers = db.query(ReferringProvider).filter(
-        ReferringProvider.status == ProviderStatus.ACTIVE
-    ).count()
-    pending_providers = db.query(ReferringProvider).filter(
-        ReferringProvider.status == ProviderStatus.PENDING
-    ).count()
-    
-    # Count referral leads
-    total_referrals = db.query(Lead).filter(Lead.is_referral == True).count()
-    
-    # Count converted referrals (reached SCHEDULED or beyond)
-    converted_referrals = db.query(Lead).filter(
-        and_(
-            Lead.is_referral == True,
-            Lead.status.in_([
-                LeadStatus.SCHEDULED,
-                LeadStatus.CONSULTATION_COMPLETE,
-                LeadStatus.TREATMENT_STARTED,
-            ])
-        )
-    ).count()
+    # All scalar counts in one round-trip: provider counts and referral lead
+    # counts are each a single FILTER aggregate, joined as one-row subqueries
+    first_of_month = _first_of_current_month(datetime.now(timezone.utc).date())
+    
+    counts = db.execute(
+        PROVIDER_STATS_COUNTS_STMT, {"first_of_month": first_of_month}
+    ).mappings().one()
+    
+    total_referrals = counts["total_referrals"]
+    converted_referrals = counts["converted_referrals"]
     
     # Calculate conversion rate
     overall_conversion_rate = 0.0
     if total_referrals > 0:
         overall_conversion_rate = round((converted_referrals / total_referrals) * 100, 1)
     
-    # Count referrals this month
-    first_of_month = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    referrals_this_month = db.query(Lead).filter(
-        and_(
-            Lead.is_referral == True,
-            Lead.created_at >= first_of_month
-        )
-    ).count()
-    
     # Get top 5 providers by referral count
-    top_providers_query = (
-        db.query(ReferringProvider)
-        .filter(ReferringProvider.status == ProviderStatus.ACTIVE)
-        .order_by(desc(ReferringProvider.total_referrals))
-        .limit(5)
-        .all()
-    )
-    
-    top_providers = [provider_to_list_response(p) for p in top_providers_query]
+    # (trusted DB columns: model_construct skips per-row validation)
+    top_providers = [
+        ProviderListResponse.model_construct(**row)
+        for row in db.execute(TOP_PROVIDERS_STMT).mappings()
+    ]
     
     return ProviderDashboardStats(
-        total_providers=total_providers,
-        active_providers=active_providers,
-        pending_providers=pending_providers,
+        total_providers=counts["total_providers"],
+        active_providers=counts["active_providers"],
+        pending_providers=counts["pending_providers"],
         total_referrals=total_referrals,
         converted_referrals=converted_referrals,
         overall_conversion_rate=overall_conversion_rate,
-        referrals_this_month=referrals_this_month,
+        referrals_this_month=counts["referrals_this_month"],
         top_providers=top_providers,
     )
 
@@ -283,34 +446,40 @@ async def get_provider_stats(
 async def get_provider(
     provider_id: UUID,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ) -> ProviderResponse:
     """Get provider details by ID."""
-    provider = db.query(ReferringProvider).filter(
-        ReferringProvider.id == provider_id
-    ).first()
-    
-    if not provider:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Provider not found",
-        )
+    cache = get_cache()
+    cache_key = provider_cache_key(provider_id)
+    result = cache.get(cache_key)
     
-    # Log audit
-    try:
-        audit_service = AuditService(db)
-        audit_service.log_read(
-            table_name="referring_providers",
-            record_id=provider.id,
-            ip_address=get_client_ip(request),
-            endpoint=f"/api/providers/{provider_id}",
-            request_method="GET",
-            user_agent=get_user_agent(request),
-        )
-    except Exception:
-        pass
+    if result is None:
+        provider = db.get(ReferringProvider, provider_id)
+        
+        if not provider:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Provider not found",
+            )
+        
+        result = jsonable_encoder(provider_to_response(provider))
+        cache.set(cache_key, result, ttl=CACHE_TTL_PROVIDERS)
+    
+    # Log audit after the response is sent (also on cache hits: every
+    # PHI-adjacent read is recorded)
+    background_tasks.add_task(
+        log_audit_in_background,
+        AuditAction.READ,
+        table_name="referring_providers",
+        record_id=provider_id,
+        ip_address=get_client_ip(request),
+        endpoint=f"/api/providers/{provider_id}",
+        request_method="GET",
+        user_agent=get_user_agent(request),
+    )
     
-    return provider_to_response(provider)
+    return result
 
 
 @router.post(
@@ -323,30 +492,12 @@ async def get_provider(
 async def create_provider(
     provider_data: ProviderCreate,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ) -> ProviderResponse:
     """Create a new referring provider."""
-    # Check for duplicate email
-    if provider_data.email:
-        existing = db.query(ReferringProvider).filter(
-            func.lower(ReferringProvider.email) == provider_data.email.lower()
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Provider with email {provider_data.email} already exists",
-            )
-    
-    # Check for duplicate NPI
-    if provider_data.npi_number:
-        existing = db.query(ReferringProvider).filter(
-            ReferringProvider.npi_number == provider_data.npi_number
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Provider with NPI {provider_data.npi_number} already exists",
-            )
+    # Check for duplicate email / NPI (one query)
+    check_duplicate_provider(db, provider_data.email, provider_data.npi_number)
     
     # Create provider
     provider = ReferringProvider(
@@ -380,26 +531,20 @@ async def create_provider(
     logger.info(f"Created provider: {provider.name} ({provider.id})")
     
     # Invalidate cache
-    try:
-        cache = get_cache()
-        cache.invalidate_pattern("providers:*")
-    except Exception:
-        pass
-    
-    # Log audit
-    try:
-        audit_service = AuditService(db)
-        audit_service.log_create(
-            table_name="referring_providers",
-            record_id=provider.id,
-            ip_address=get_client_ip(request),
-            endpoint="/api/providers",
-            request_method="POST",
-            user_agent=get_user_agent(request),
-            new_values={"name": provider.name, "status": provider.status.value},
-        )
-    except Exception:
-        pass
+    invalidate_provider_cache(provider.id)
+    
+    # Log audit after the response is sent
+    background_tasks.add_task(
+        log_audit_in_background,
+        AuditAction.CREATE,
+        table_name="referring_providers",
+        record_id=provider.id,
+        ip_address=get_client_ip(request),
+        endpoint="/api/providers",
+        request_method="POST",
+        user_agent=get_user_agent(request),
+        new_values={"name": provider.name, "status": provider.status.value},
+    )
     
     return provider_to_response(provider)
 
@@ -414,12 +559,11 @@ async def update_provider(
     provider_id: UUID,
     provider_data: ProviderUpdate,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ) -> ProviderResponse:
     """Update provider details."""
-    provider = db.query(ReferringProvider).filter(
-        ReferringProvider.id == provider_id
-    ).first()
+    provider = db.get(ReferringProvider, provider_id)
     
     if not provider:
         raise HTTPException(
@@ -436,33 +580,13 @@ async def update_provider(
     # Update fields that are provided
     update_data = provider_data.model_dump(exclude_unset=True)
     
-    # Check for duplicate email if changing
-    if "email" in update_data and update_data["email"]:
-        existing = db.query(ReferringProvider).filter(
-            and_(
-                func.lower(ReferringProvider.email) == update_data["email"].lower(),
-                ReferringProvider.id != provider_id
-            )
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Provider with email {update_data['email']} already exists",
-            )
-    
-    # Check for duplicate NPI if changing
-    if "npi_number" in update_data and update_data["npi_number"]:
-        existing = db.query(ReferringProvider).filter(
-            and_(
-                ReferringProvider.npi_number == update_data["npi_number"],
-                ReferringProvider.id != provider_id
-            )
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Provider with NPI {update_data['npi_number']} already exists",
-            )
+    # Check for duplicate email / NPI if changing (one query)
+    check_duplicate_provider(
+        db,
+        update_data.get("email"),
+        update_data.get("npi_number"),
+        exclude_id=provider_id,
+    )
     
     # Apply updates
     for field, value in update_data.items():
@@ -481,27 +605,21 @@ async def update_provider(
     logger.info(f"Updated provider: {provider.name} ({provider.id})")
     
     # Invalidate cache
-    try:
-        cache = get_cache()
-        cache.invalidate_pattern("providers:*")
-    except Exception:
-        pass
-    
-    # Log audit
-    try:
-        audit_service = AuditService(db)
-        audit_service.log_update(
-            table_name="referring_providers",
-            record_id=provider.id,
-            ip_address=get_client_ip(request),
-            endpoint=f"/api/providers/{provider_id}",
-            request_method="PATCH",
-            user_agent=get_user_agent(request),
-            old_values=old_values,
-            new_values=update_data,
-        )
-    except Exception:
-        pass
+    invalidate_provider_cache(provider.id)
+    
+    # Log audit after the response is sent
+    background_tasks.add_task(
+        log_audit_in_background,
+        AuditAction.UPDATE,
+        table_name="referring_providers",
+        record_id=provider.id,
+        ip_address=get_client_ip(request),
+        endpoint=f"/api/providers/{provider_id}",
+        request_method="PATCH",
+        user_agent=get_user_agent(request),
+        old_values=old_values,
+        new_values=update_data,
+    )
     
     return provider_to_response(provider)
 
@@ -515,55 +633,61 @@ async def update_provider(
 async def archive_provider(
     provider_id: UUID,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """Archive a provider (soft delete)."""
-    provider = db.query(ReferringProvider).filter(
-        ReferringProvider.id == provider_id
+    # Soft delete in one round-trip: UPDATE ... RETURNING, self-joined to the
+    # pre-update row so the audit log gets the previous status
+    previous = aliased(ReferringProvider)
+    archived = db.execute(
+        update(ReferringProvider)
+        .where(ReferringProvider.id == previous.id, previous.id == provider_id)
+        .values(status=ProviderStatus.ARCHIVED, archived_at=datetime.now(timezone.utc))
+        .returning(ReferringProvider.id, ReferringProvider.name, previous.status)
+        .execution_options(synchronize_session=False)
     ).first()
     
-    if not provider:
+    if archived is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Provider not found",
         )
     
-    # Soft delete - set status to ARCHIVED
-    provider.status = ProviderStatus.ARCHIVED
-    provider.archived_at = datetime.now(timezone.utc)
-    
     db.commit()
     
-    logger.info(f"Archived provider: {provider.name} ({provider.id})")
+    logger.info(f"Archived provider: {archived.name} ({archived.id})")
     
     # Invalidate cache
-    try:
-        cache = get_cache()
-        cache.invalidate_pattern("providers:*")
-    except Exception:
-        pass
-    
-    # Log audit
-    try:
-        audit_service = AuditService(db)
-        audit_service.log_update(
-            table_name="referring_providers",
-            record_id=provider.id,
-            ip_address=get_client_ip(request),
-            endpoint=f"/api/providers/{provider_id}",
-            request_method="DELETE",
-            user_agent=get_user_agent(request),
-            old_values={"status": provider.status.value},
-            new_values={"status": ProviderStatus.ARCHIVED.value},
-        )
-    except Exception:
-        pass
+    invalidate_provider_cache(archived.id)
+    
+    # Log audit after the response is sent
+    background_tasks.add_task(
+        log_audit_in_background,
+        AuditAction.UPDATE,
+        table_name="referring_providers",
+        record_id=archived.id,
+        ip_address=get_client_ip(request),
+        endpoint=f"/api/providers/{provider_id}",
+        request_method="DELETE",
+        user_agent=get_user_agent(request),
+        old_values={"status": archived.status.value},
+        new_values={"status": ProviderStatus.ARCHIVED.value},
+    )
 
 
 # =============================================================================
 # Provider Referrals Endpoint
 # =============================================================================
 
+# Referral statuses counted as converted (reached SCHEDULED or beyond)
+CONVERTED_REFERRAL_STATUSES = frozenset({
+    LeadStatus.SCHEDULED,
+    LeadStatus.CONSULTATION_COMPLETE,
+    LeadStatus.TREATMENT_STARTED,
+})
+
+
 @router.get(
     "/{provider_id}/referrals",
     response_model=List[ProviderReferralLeadInfo],
@@ -580,52 +704,59 @@ async def get_provider_referrals(
     Get referral leads for a provider.
     
     Returns minimal lead info (no PHI) for the provider's referral list.
-    """
-    provider = db.query(ReferringProvider).filter(
-        ReferringProvider.id == provider_id
-    ).first()
     
-    if not provider:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Provider not found",
+    One query in the common case; the provider is looked up separately only
+    when there are no referrals, to tell "none yet" from "no such provider".
+    """
+    # Get referral leads (only the columns the response needs)
+    leads = db.execute(
+        select(
+            Lead.id,
+            Lead.lead_number,
+            Lead.condition,
+            Lead.priority,
+            Lead.status,
+            Lead.created_at,
         )
-    
-    # Get referral leads
-    leads = (
-        db.query(Lead)
-        .filter(Lead.referring_provider_id == provider_id)
+        .where(Lead.referring_provider_id == provider_id)
         .order_by(desc(Lead.created_at))
         .limit(limit)
-        .all()
-    )
+    ).all()
     
-    result = []
-    for lead in leads:
-        is_converted = lead.status in [
-            LeadStatus.SCHEDULED,
-            LeadStatus.CONSULTATION_COMPLETE,
-            LeadStatus.TREATMENT_STARTED,
-        ]
-        result.append(
-            ProviderReferralLeadInfo(
-                id=lead.id,
-                lead_number=lead.lead_number,
-                condition=lead.condition.value if lead.condition else "Unknown",
-                priority=lead.priority.value if lead.priority else "Unknown",
-                status=lead.status.value if lead.status else "Unknown",
-                created_at=lead.created_at,
-                is_converted=is_converted,
+    if not leads:
+        provider_exists = db.execute(
+            select(ReferringProvider.id).where(ReferringProvider.id == provider_id)
+        ).first()
+        if provider_exists is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Provider not found",
             )
-        )
     
-    return result
+    # Plain dicts in the ProviderReferralLeadInfo shape; response_model
+    # serializes them without building a model per row here
+    return [
+        {
+            "id": lead.id,
+            "lead_number": lead.lead_number,
+            "condition": lead.condition.value if lead.condition else "Unknown",
+            "priority": lead.priority.value if lead.priority else "Unknown",
+            "status": lead.status.value if lead.status else "Unknown",
+            "created_at": lead.created_at,
+            "is_converted": lead.status in CONVERTED_REFERRAL_STATUSES,
+        }
+        for lead in leads
+    ]
 
 
 # =============================================================================
 # Provider Search/Lookup (for Jotform integration)
 # =============================================================================
 
+# Match score for an exact email hit; always outranks name + practice (80)
+EMAIL_MATCH_SCORE = 100
+
+
 @router.get(
     "/search/match",
     summary="Search for Matching Provider",
@@ -647,53 +778,53 @@ async def search_provider_match(
     if not email and not name:
         return {"found": False, "providers": []}
     
-    # Try exact email match first
+    # One ranked query instead of email / name / practice lookups in turn:
+    # exact email = 100, name ILIKE = 50, practice ILIKE = 30 (summed).
+    # Name/practice ILIKE use the trigram GIN indexes from migration 005.
+    # Each provider row is scanned once, so results are unique without
+    # DISTINCT or Python-side dedup.
+    score_terms = []
     if email:
-        provider = db.query(ReferringProvider).filter(
-            func.lower(ReferringProvider.email) == email.lower()
-        ).first()
-        
-        if provider:
-            return {
-                "found": True,
-                "match_type": "email",
-                "confidence": 1.0,
-                "provider": provider_to_list_response(provider).model_dump(),
-            }
-    
-    # Try name/practice fuzzy search
-    candidates = []
-    if name:
-        name_matches = (
-            db.query(ReferringProvider)
-            .filter(ReferringProvider.name.ilike(f"%{name}%"))
-            .limit(5)
-            .all()
+        score_terms.append(
+            (func.lower(ReferringProvider.email) == email.lower(), EMAIL_MATCH_SCORE)
         )
-        candidates.extend(name_matches)
-    
+    if name:
+        score_terms.append((ReferringProvider.name.ilike(f"%{name}%"), 50))
     if practice_name:
-        practice_matches = (
-            db.query(ReferringProvider)
-            .filter(ReferringProvider.practice_name.ilike(f"%{practice_name}%"))
-            .limit(5)
-            .all()
-        )
-        # Add unique matches
-        existing_ids = {c.id for c in candidates}
-        for p in practice_matches:
-            if p.id not in existing_ids:
-                candidates.append(p)
+        score_terms.append((ReferringProvider.practice_name.ilike(f"%{practice_name}%"), 30))
+    
+    score = sum(case((condition, points), else_=0) for condition, points in score_terms)
+    rows = db.execute(
+        select(*PROVIDER_LIST_COLUMNS, score.label("match_score"))
+        .where(or_(*(condition for condition, _ in score_terms)))
+        # Ties go to the busier referrer, keeping the top 5 deterministic
+        .order_by(desc("match_score"), desc(ReferringProvider.total_referrals), ReferringProvider.id)
+        .limit(5)
+    ).mappings().all()
     
-    if candidates:
+    if not rows:
+        return {"found": False, "providers": []}
+    
+    candidates = []
+    for row in rows:
+        candidate = dict(row)
+        candidate.pop("match_score")
+        candidates.append(candidate)
+    
+    if rows[0]["match_score"] >= EMAIL_MATCH_SCORE:
         return {
             "found": True,
-            "match_type": "fuzzy",
-            "confidence": 0.7,
-            "providers": [provider_to_list_response(p).model_dump() for p in candidates[:5]],
+            "match_type": "email",
+            "confidence": 1.0,
+            "provider": candidates[0],
         }
     
-    return {"found": False, "providers": []}
+    return {
+        "found": True,
+        "match_type": "fuzzy",
+        "confidence": 0.7,
+        "providers": candidates,
+    }
 
 
 # =============================================================================
@@ -708,41 +839,87 @@ async def search_provider_match(
 async def get_provider_notes_history(
     provider_id: UUID,
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     limit: int = 50,
 ) -> dict:
     """
     Get all notes history for a provider.
     
     Returns chronologically ordered list of all notes and interactions.
+    Uses AsyncSession so the query does not block the event loop.
     """
-    # Verify provider exists
-    provider = db.query(ReferringProvider).filter(
-        ReferringProvider.id == provider_id
-    ).first()
+    cache = get_cache()
+    cache_key = provider_notes_cache_key(cache, provider_id, limit)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Provider and its latest notes in one round-trip: LEFT JOIN LATERAL
+    # keeps the provider row even when it has no notes. Plain column rows,
+    # no ORM instances: this is a read-only list.
+    latest_notes = (
+        select(
+            ProviderNotesHistory.id,
+            ProviderNotesHistory.note_text,
+            ProviderNotesHistory.note_type,
+            ProviderNotesHistory.created_by,
+            ProviderNotesHistory.created_at,
+        )
+        .where(ProviderNotesHistory.provider_id == ReferringProvider.id)
+        .order_by(desc(ProviderNotesHistory.created_at))
+        .limit(limit)
+        .lateral("latest_notes")
+    )
+    # All notes for the provider, not just this page
+    total_notes = (
+        select(func.count())
+        .where(ProviderNotesHistory.provider_id == ReferringProvider.id)
+        .correlate(ReferringProvider)
+        .scalar_subquery()
+    )
+    rows = (await db.execute(
+        select(
+            ReferringProvider.name,
+            ReferringProvider.notes,
+            total_notes.label("total_notes"),
+            latest_notes,
+        )
+        .outerjoin(latest_notes, true())
+        .where(ReferringProvider.id == provider_id)
+        .order_by(desc(latest_notes.c.created_at))
+    )).all()
     
-    if not provider:
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Provider not found",
         )
     
-    # Get notes history
-    notes = (
-        db.query(ProviderNotesHistory)
-        .filter(ProviderNotesHistory.provider_id == provider_id)
-        .order_by(desc(ProviderNotesHistory.created_at))
-        .limit(limit)
-        .all()
-    )
-    
-    return {
-        "provider_id": str(provider_id),
-        "provider_name": provider.name,
-        "current_notes": provider.notes,
-        "notes_history": [note.to_dict() for note in notes],
-        "total_notes": len(notes),
+    # Same shape as ProviderNotesHistory.to_dict()
+    provider_id_str = str(provider_id)
+    notes_history = [
+        {
+            "id": str(row.id),
+            "provider_id": provider_id_str,
+            "note_text": row.note_text,
+            "note_type": row.note_type,
+            "created_by": row.created_by,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+        }
+        for row in rows
+        if row.id is not None
+    ]
+    
+    result = {
+        "provider_id": provider_id_str,
+        "provider_name": rows[0].name,
+        "current_notes": rows[0].notes,
+        "notes_history": notes_history,
+        "total_notes": rows[0].total_notes,
     }
+    cache.set(cache_key, result, ttl=CACHE_TTL_PROVIDERS)
+    
+    return result
 
 
 @router.post(
@@ -754,7 +931,7 @@ async def get_provider_notes_history(
 async def add_provider_note(
     provider_id: UUID,
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     note_text: str = "",
     note_type: str = "general",
     created_by: str = None,
@@ -764,10 +941,8 @@ async def add_provider_note(
     
     This creates a note in the history AND updates the provider's current notes field.
     """
-    # Verify provider exists
-    provider = db.query(ReferringProvider).filter(
-        ReferringProvider.id == provider_id
-    ).first()
+    # Verify provider exists (primary-key get: identity map first)
+    provider = await db.get(ReferringProvider, provider_id)
     
     if not provider:
         raise HTTPException(
@@ -794,21 +969,24 @@ async def add_provider_note(
             detail="note_text cannot be empty",
         )
     
-    # Create the note in history
-    note = ProviderNotesHistory(
-        provider_id=provider_id,
-        note_text=note_text.strip(),
-        note_type=note_type,
-        created_by=created_by or "Coordinator",
-    )
-    
-    db.add(note)
+    # Create the note in history; RETURNING fills the server defaults
+    # (id, created_at) without a refresh SELECT after commit
+    note = (await db.execute(
+        insert(ProviderNotesHistory)
+        .values(
+            provider_id=provider_id,
+            note_text=note_text.strip(),
+            note_type=note_type,
+            created_by=created_by or "Coordinator",
+        )
+        .returning(ProviderNotesHistory)
+    )).scalar_one()
     
     # Also update the provider's current notes field
     provider.notes = note_text.strip()
     
-    db.commit()
-    db.refresh(note)
+    await db.commit()
+    invalidate_provider_cache(provider_id)
     
     logger.info(f"Added note for provider {provider.name}: {note_type}")
     
@@ -817,3 +995,80 @@ async def add_provider_note(
         "note": note.to_dict(),
         "message": "Note added successfully",
     }
+
+
+@router.post(
+    "/{provider_id}/notes/bulk",
+    status_code=status.HTTP_201_CREATED,
+    summary="Bulk Add Provider Notes",
+    description="Add many notes to a provider's history in one statement.",
+)
+async def bulk_add_provider_notes(
+    provider_id: UUID,
+    payload: ProviderNotesBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+) -> dict:
+    """
+    Add a batch of notes to a provider (imports, migrations).
+    
+    All notes go in with one multi-row INSERT ... RETURNING, and the
+    provider's current notes field is set to the last note in the same
+    transaction.
+    
+    current_timestamp is fixed for the transaction, so each row is offset
+    by its index in microseconds: history (sorted by created_at) keeps the
+    submitted order and its newest entry is the provider's current notes.
+    """
+    provider = await db.get(ReferringProvider, provider_id)
+    
+    if not provider:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Provider not found",
+        )
+    
+    rows = [
+        {
+            "provider_id": provider_id,
+            "note_text": note.note_text,
+            "note_type": note.note_type,
+            "created_by": note.created_by or "Coordinator",
+            "created_at": func.current_timestamp() + timedelta(microseconds=index),
+        }
+        for index, note in enumerate(payload.notes)
+    ]
+    
+    inserted = (await db.execute(
+        insert(ProviderNotesHistory)
+        .values(rows)
+        .returning(
+            ProviderNotesHistory.id,
+            ProviderNotesHistory.note_text,
+            ProviderNotesHistory.created_at,
+        )
+    )).all()
+    
+    # History is read newest-first by created_at; it must match submission order
+    inserted = sorted(inserted, key=lambda row: row.created_at)
+    if [row.note_text for row in inserted] != [row["note_text"] for row in rows]:
+        await db.rollback()
+        logger.error(f"Bulk notes for provider {provider_id} out of order, rolled back")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to store notes in order",
+        )
+    inserted_ids = [row.id for row in inserted]
+    
+    provider.notes = rows[-1]["note_text"]
+    
+    await db.commit()
+    invalidate_provider_cache(provider_id)
+    
+    logger.info(f"Added {len(inserted_ids)} notes for provider {provider.name}")
+    
+    return {
+        "success": True,
+        "note_ids": [str(note_id) for note_id in inserted_ids],
+        "count": len(inserted_ids),
+        "message": f"{len(inserted_ids)} notes added successfully",
+    }
@@ -14,13 +14,17 @@ PLATFORMS SUPPORTED:
 @version 2.0.0 - Added Referral platform + error handling + retry logic
 """
 
+import functools
+import itertools
+import os
+import re
 import time
 import logging
-import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, case, text
 from sqlalchemy.exc import SQLAlchemyError
@@ -28,11 +32,16 @@ from pydantic import BaseModel, Field
 
 from ..core.database import get_db
 from ..models.lead import Lead, PriorityType, LeadStatus
-from ..services.cache import get_cache
+from ..services.cache import get_cache, CacheService, LocalTTLCache
+from ..services.lead_change_listener import register_lead_change_handler
 
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/analytics/sources", tags=["Source Analytics"])
+router = APIRouter(
+    prefix="/api/analytics/sources",
+    tags=["Source Analytics"],
+    default_response_class=ORJSONResponse,
+)
 
 
 # =============================================================================
@@ -40,7 +49,8 @@ router = APIRouter(prefix="/api/analytics/sources", tags=["Source Analytics"])
 # =============================================================================
 
 # Supported platforms - Widget, Google Ads, Jotform, Referral
-ALLOWED_PLATFORMS = ["Widget", "Google Ads", "Jotform", "Referral"]
+# (tuple: fixed display order, immutable)
+ALLOWED_PLATFORMS = ("Widget", "Google Ads", "Jotform", "Referral")
 
 # Map UTM sources/mediums to platform names
 SOURCE_MAPPING = {
@@ -90,9 +100,15 @@ PLATFORM_ICONS = {
     "Referral": "users",
 }
 
+# (color, icon) per platform, resolved once for the fixed platform set
+_PLATFORM_META = {
+    platform: (PLATFORM_COLORS.get(platform, "#6B7280"), PLATFORM_ICONS.get(platform, "globe"))
+    for platform in ALLOWED_PLATFORMS
+}
+
 # Default empty metrics for platforms with no data
-def get_empty_platform_metrics(platform: str) -> Dict[str, Any]:
-    """Return empty metrics structure for a platform with no data."""
+def _build_empty_platform_metrics(platform: str) -> Dict[str, Any]:
+    """Build the empty metrics structure for a platform."""
     return {
         "platform": platform,
         "total_leads": 0,
@@ -112,28 +128,140 @@ def get_empty_platform_metrics(platform: str) -> Dict[str, Any]:
     }
 
 
+# Built once; callers get a copy (all values are immutable scalars)
+_EMPTY_PLATFORM_METRICS = {
+    platform: _build_empty_platform_metrics(platform) for platform in ALLOWED_PLATFORMS
+}
+
+
+def get_empty_platform_metrics(platform: str) -> Dict[str, Any]:
+    """Return empty metrics structure for a platform with no data."""
+    template = _EMPTY_PLATFORM_METRICS.get(platform)
+    if template is None:
+        return _build_empty_platform_metrics(platform)
+    return dict(template)
+
+
+# Partial-match fallback compiled once into a single regex. Each alternative
+# is an anchored lookahead, so alternatives are tried in SOURCE_MAPPING order
+# and the first key contained anywhere in the source wins, exactly like a
+# loop over SOURCE_MAPPING, but in one C-level match call.
+_PARTIAL_MATCH_KEYS = [key for key in SOURCE_MAPPING if key]
+_PARTIAL_MATCH_RE = re.compile(
+    "|".join(f"^(?=.*?({re.escape(key)}))" for key in _PARTIAL_MATCH_KEYS),
+    re.DOTALL,
+)
+_PARTIAL_MATCH_PLATFORMS = [SOURCE_MAPPING[key] for key in _PARTIAL_MATCH_KEYS]
+
+
+@functools.lru_cache(maxsize=4096)
 def get_platform_from_source(utm_source: Optional[str], utm_medium: Optional[str] = None) -> str:
-    """Map UTM source/medium to platform name."""
-    if utm_source:
-        source_lower = utm_source.lower()
-        if source_lower in SOURCE_MAPPING:
-            return SOURCE_MAPPING[source_lower]
+    """
+    Map UTM source/medium to platform name.
+    
+    Memoized: utm_source/utm_medium cardinality is low, so aggregations over
+    many leads resolve almost every call from the cache.
+    """
+    # SOURCE_MAPPING keys are lowercase: one lowered lookup per input
+    source_lower = utm_source.lower() if utm_source else None
+    if source_lower:
+        platform = SOURCE_MAPPING.get(source_lower)
+        if platform is not None:
+            return platform
     
     if utm_medium:
-        medium_lower = utm_medium.lower()
-        if medium_lower in SOURCE_MAPPING:
-            return SOURCE_MAPPING[medium_lower]
+        platform = SOURCE_MAPPING.get(utm_medium.lower())
+        if platform is not None:
+            return platform
     
     # Check for partial matches
-    if utm_source:
-        source_lower = utm_source.lower()
-        for key, value in SOURCE_MAPPING.items():
-            if key and key in source_lower:
-                return value
+    if source_lower:
+        match = _PARTIAL_MATCH_RE.match(source_lower)
+        if match:
+            return _PARTIAL_MATCH_PLATFORMS[match.lastindex - 1]
     
     return "Widget"  # Default to Widget for direct/unknown
 
 
+def build_platform_expr(utm_source, utm_medium):
+    """
+    SQL CASE equivalent of get_platform_from_source.
+    
+    Same precedence: exact source key, then exact medium key, then the first
+    SOURCE_MAPPING key contained in the source (strpos, so "_" is literal),
+    defaulting to Widget. Lets Postgres GROUP BY platform directly.
+    """
+    source = func.lower(utm_source)
+    medium = func.lower(utm_medium)
+    exact_keys = {
+        platform: [key for key, value in SOURCE_MAPPING.items() if key and value == platform]
+        for platform in ALLOWED_PLATFORMS
+    }
+    whens = [(source.in_(keys), platform) for platform, keys in exact_keys.items()]
+    whens += [(medium.in_(keys), platform) for platform, keys in exact_keys.items()]
+    whens += [
+        (func.strpos(source, key) > 0, platform)
+        for key, platform in zip(_PARTIAL_MATCH_KEYS, _PARTIAL_MATCH_PLATFORMS)
+    ]
+    return case(*whens, else_="Widget")
+
+
+LEAD_PLATFORM_EXPR = build_platform_expr(Lead.utm_source, Lead.utm_medium)
+
+# Roll-up backed responses change at most once per refresh
+ROLLUP_CACHE_TTL = 300
+# Hot leads are aggregated live from leads
+HOT_LEADS_CACHE_TTL = 30
+CAMPAIGN_CACHE_TTL = 60
+LOCAL_CACHE_TTL = 30  # In-process L1 in front of Redis
+
+# Per-process L1 for the analytics payloads (same keys as Redis), so repeat
+# dashboard loads on a worker skip the Redis round-trip and JSON decode.
+# Dropped as soon as Postgres reports a lead change.
+_local_analytics = LocalTTLCache(ttl=LOCAL_CACHE_TTL, maxsize=64)
+register_lead_change_handler(_local_analytics.clear)
+
+# Overview and trend read the daily roll-up (migration 027, refreshed every
+# 5 minutes with the other platform views): O(days x 4) rows, not O(leads).
+# BIGINT casts keep SUM() results as ints instead of Decimal.
+PLATFORM_OVERVIEW_SQL = text("""
+    SELECT
+        platform,
+        SUM(total_leads)::BIGINT AS total,
+        SUM(hot_leads)::BIGINT AS hot,
+        SUM(medium_leads)::BIGINT AS medium,
+        SUM(low_leads)::BIGINT AS low,
+        SUM(converted_leads)::BIGINT AS converted,
+        SUM(scheduled_leads)::BIGINT AS scheduled,
+        SUM(score_sum)::BIGINT AS score_sum,
+        COALESCE(SUM(total_leads) FILTER (WHERE lead_date >= :this_week_start), 0)::BIGINT AS this_week,
+        COALESCE(SUM(total_leads) FILTER (
+            WHERE lead_date >= :last_week_start AND lead_date < :this_week_start
+        ), 0)::BIGINT AS last_week
+    FROM mv_lead_platform_daily
+    WHERE lead_date >= :start_date
+    GROUP BY platform
+""")
+
+PLATFORM_TREND_SQL = text("""
+    SELECT lead_date, platform, total_leads
+    FROM mv_lead_platform_daily
+    WHERE lead_date >= :start_date
+""")
+
+
+# Request IDs are for log correlation only (not security-sensitive): a
+# per-process random prefix plus a counter avoids an os.urandom call per
+# request while staying unique across workers in practice
+_REQUEST_ID_PREFIX = os.urandom(2).hex()
+_request_id_counter = itertools.count()
+
+
+def next_request_id() -> str:
+    """Return a short trace ID for this process (8+ hex chars)."""
+    return f"{_REQUEST_ID_PREFIX}{next(_request_id_counter):04x}"
+
+
 # =============================================================================
 # Response Models
 # =============================================================================
@@ -166,7 +294,7 @@ class SourceAnalyticsResponse(BaseModel):
     cache_hit: bool = Field(default=False)
     query_time_ms: float = Field(default=0)
     timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    request_id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
+    request_id: str = Field(default_factory=lambda: next_request_id())
 
 
 class PlatformTrendDataPoint(BaseModel):
@@ -206,6 +334,294 @@ def handle_db_error(error: Exception, operation: str, request_id: str) -> None:
     logger.error(f"[{request_id}] Database error during {operation}: {str(error)}", exc_info=True)
 
 
+def _analytics_json(payload: Dict[str, Any], **meta: Any) -> ORJSONResponse:
+    """
+    Serialize an analytics payload straight to JSON with orjson.
+    
+    The payload is already response-shaped (built here or read back from
+    cache), so skipping the response model avoids validating it twice;
+    response_model on the route still documents the schema.
+    """
+    return ORJSONResponse(content={
+        **payload,
+        **meta,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    })
+
+
+# =============================================================================
+# Payload Builders
+# =============================================================================
+# Each builder returns the cacheable, response-shaped payload for one
+# dashboard widget. They are shared by the individual endpoints and by
+# /dashboard/bundle, which computes only the payloads missing from cache.
+
+def _cached_payload(cache: CacheService, key: str) -> Optional[Dict[str, Any]]:
+    """Read a payload from the local L1, then Redis (populating the L1)."""
+    value = _local_analytics.get(key)
+    if value is None:
+        value = cache.get(key)
+        if value:
+            _local_analytics.set(key, value)
+    return value
+
+
+def _store_payload(cache: CacheService, key: str, value: Dict[str, Any], ttl: int) -> None:
+    """Write a payload to both the local L1 and Redis."""
+    _local_analytics.set(key, value)
+    cache.set(key, value, ttl=ttl)
+
+
+def _overview_cache_key(today, days_back: int) -> str:
+    return f"source_analytics:{today - timedelta(days=days_back)}:{today}"
+
+
+def _trend_cache_key(start_date, end_date) -> str:
+    return f"platform_trend:{start_date}:{end_date}"
+
+
+def _hot_leads_cache_key(days_back: int) -> str:
+    return f"hot_leads_platform:{days_back}"
+
+
+def _build_source_overview(db: Session, today, days_back: int, request_id: str) -> Dict[str, Any]:
+    """Per-platform overview payload from the daily roll-up."""
+    # Aggregate per platform from the daily roll-up (at most 4 rows);
+    # the roll-up already excludes soft-deleted leads, consistent with
+    # metrics.py and the All Leads table
+    rows = db.execute(PLATFORM_OVERVIEW_SQL, {
+        "start_date": today - timedelta(days=days_back),
+        "this_week_start": today - timedelta(days=7),
+        "last_week_start": today - timedelta(days=14),
+    }).all()
+    
+    # Initialize ALL 4 platforms with empty data
+    empty_row = {
+        "total": 0, "hot": 0, "medium": 0, "low": 0, "converted": 0,
+        "scheduled": 0, "score_sum": 0, "this_week": 0, "last_week": 0,
+    }
+    platform_data: Dict[str, Dict[str, Any]] = {
+        platform: dict(empty_row) for platform in ALLOWED_PLATFORMS
+    }
+    for row in rows:
+        platform_data[row.platform] = row._asdict()
+    
+    total_leads = sum(data["total"] for data in platform_data.values())
+    
+    logger.info(f"[{request_id}] Aggregated {total_leads} leads for analysis")
+    
+    # Build response - ALWAYS include all 4 platforms
+    platforms: List[PlatformMetrics] = []
+    top_conversion_rate = 0
+    top_platform = "Widget"
+    trending_up: List[str] = []
+    # Totals accumulated in the same pass as the per-platform metrics
+    total_hot = total_medium = total_low = total_converted = total_scheduled = 0
+    platform_count = 0
+    
+    for platform in ALLOWED_PLATFORMS:
+        data = platform_data[platform]
+        color, icon = _PLATFORM_META[platform]
+        total = data["total"]
+        converted = data["converted"]
+        total_hot += data["hot"]
+        total_medium += data["medium"]
+        total_low += data["low"]
+        total_converted += converted
+        total_scheduled += data["scheduled"]
+        if total > 0:
+            platform_count += 1
+        conversion_rate = round((converted / total * 100) if total > 0 else 0, 2)
+        avg_score = round(data["score_sum"] / total if total > 0 else 0, 1)
+        percentage = round((total / total_leads * 100) if total_leads > 0 else 0, 2)
+        
+        # Calculate trend
+        this_week = data["this_week"]
+        last_week_count = data["last_week"]
+        if last_week_count > 0:
+            trend = round(((this_week - last_week_count) / last_week_count) * 100, 1)
+        else:
+            trend = 100.0 if this_week > 0 else 0.0
+        
+        if trend > 0:
+            trending_up.append(platform)
+        
+        # Track top performer (only consider platforms with data)
+        if total > 0 and conversion_rate > top_conversion_rate:
+            top_conversion_rate = conversion_rate
+            top_platform = platform
+        
+        # Values are computed here, not user input: skip field validation
+        platforms.append(PlatformMetrics.model_construct(
+            platform=platform,
+            total_leads=total,
+            hot_leads=data["hot"],
+            medium_leads=data["medium"],
+            low_leads=data["low"],
+            converted_leads=converted,
+            conversion_rate=conversion_rate,
+            scheduled_leads=data["scheduled"],
+            percentage_of_total=percentage,
+            avg_score=avg_score,
+            color=color,
+            icon=icon,
+            trend=trend,
+            cost_per_lead=None,
+            has_data=total > 0,
+        ))
+    
+    # Sort: platforms with data first, then by total leads descending
+    platforms.sort(key=lambda x: (-1 if x.has_data else 0, -x.total_leads))
+    
+    # Calculate totals
+    totals = {
+        "total_leads": total_leads,
+        "total_hot": total_hot,
+        "total_medium": total_medium,
+        "total_low": total_low,
+        "total_converted": total_converted,
+        "overall_conversion_rate": round(
+            (total_converted / total_leads * 100) if total_leads > 0 else 0, 2
+        ),
+        "total_scheduled": total_scheduled,
+        "platform_count": platform_count,  # Only count platforms with data
+    }
+    
+    return {
+        "platforms": [p.model_dump() for p in platforms],
+        "totals": totals,
+        "top_performing": top_platform,
+        "trending_up": trending_up,
+    }
+
+
+def _build_platform_trend(db: Session, start_date, end_date, period: int) -> Dict[str, Any]:
+    """Daily per-platform lead counts payload from the daily roll-up."""
+    # Daily counts per platform from the roll-up
+    rows = db.execute(PLATFORM_TREND_SQL, {"start_date": start_date}).all()
+    
+    # Aggregate by date and platform (all 4 platforms). Keyed by date
+    # object and filled in ascending order, so no sort or re-parse below
+    daily_data: Dict[date, Dict[str, int]] = {}
+    
+    current = start_date
+    while current <= end_date:
+        daily_data[current] = {
+            "Widget": 0,
+            "Google Ads": 0,
+            "Jotform": 0,
+            "Referral": 0,
+        }
+        current += timedelta(days=1)
+    
+    for lead_date, platform, total_leads in rows:
+        counts = daily_data.get(lead_date)
+        if counts is not None:
+            counts[platform] += total_leads
+    
+    # Build response
+    data = [
+        PlatformTrendDataPoint.model_construct(
+            date=day.isoformat(),
+            label=day.strftime("%b %d"),
+            widget=counts["Widget"],
+            google_ads=counts["Google Ads"],
+            jotform=counts["Jotform"],
+            referral=counts["Referral"],
+        ).model_dump()
+        for day, counts in daily_data.items()
+    ]
+    
+    return {
+        "period_days": period,
+        "data": data,
+    }
+
+
+def _build_hot_leads(db: Session, days_back: int) -> Dict[str, Any]:
+    """Hot leads per platform payload, aggregated live in SQL."""
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+    
+    # Hot lead counts per (platform, condition), aggregated in SQL
+    # Exclude soft-deleted leads for consistency
+    rows = db.query(
+        LEAD_PLATFORM_EXPR.label("platform"),
+        Lead.condition,
+        func.count(Lead.id).label("count"),
+        func.count(Lead.id).filter(
+            Lead.status.in_([LeadStatus.CONSULTATION_COMPLETE, LeadStatus.TREATMENT_STARTED])
+        ).label("converted"),
+        func.count(Lead.id).filter(Lead.status == LeadStatus.SCHEDULED).label("scheduled"),
+        func.count(Lead.id).filter(Lead.status == LeadStatus.NEW).label("new"),
+        func.sum(Lead.score).label("score_sum"),
+    ).filter(
+        and_(
+            Lead.created_at >= cutoff_date,
+            Lead.priority == PriorityType.HOT,
+            Lead.deleted_at.is_(None)  # Exclude soft-deleted leads
+        )
+    ).group_by("platform", Lead.condition).all()
+    
+    # Initialize all 4 platforms
+    platform_data: Dict[str, Dict[str, Any]] = {}
+    for platform in ALLOWED_PLATFORMS:
+        platform_data[platform] = {
+            "count": 0,
+            "converted": 0,
+            "scheduled": 0,
+            "new": 0,
+            "score_sum": 0,
+            "conditions": {},
+        }
+    
+    # Unpack in select order: plain tuple access, and no clash between the
+    # "count" label and Row.count()
+    for platform, condition, count, converted, scheduled, new, score_sum in rows:
+        data = platform_data[platform]
+        data["count"] += count
+        data["converted"] += converted
+        data["scheduled"] += scheduled
+        data["new"] += new
+        data["score_sum"] += score_sum or 0
+        
+        # Condition breakdown
+        condition = condition.value if hasattr(condition, 'value') else str(condition)
+        data["conditions"][condition] = data["conditions"].get(condition, 0) + count
+    
+    # Build response - include all 4 platforms
+    platforms = []
+    for platform in ALLOWED_PLATFORMS:
+        data = platform_data[platform]
+        color, icon = _PLATFORM_META[platform]
+        avg_score = round(data["score_sum"] / data["count"] if data["count"] > 0 else 0, 1)
+        conversion_rate = round((data["converted"] / data["count"] * 100) if data["count"] > 0 else 0, 1)
+        
+        # Top condition for this platform
+        top_condition = max(data["conditions"].items(), key=lambda x: x[1])[0] if data["conditions"] else "N/A"
+        
+        platforms.append({
+            "platform": platform,
+            "count": data["count"],
+            "converted": data["converted"],
+            "scheduled": data["scheduled"],
+            "new_untouched": data["new"],
+            "conversion_rate": conversion_rate,
+            "avg_score": avg_score,
+            "top_condition": top_condition,
+            "color": color,
+            "icon": icon,
+            "has_data": data["count"] > 0,
+        })
+    
+    # Sort: platforms with data first, then by count descending
+    platforms.sort(key=lambda x: (-1 if x["has_data"] else 0, -x["count"]))
+    
+    return {
+        "platforms": platforms,
+        "total_hot_leads": sum(p["count"] for p in platforms),
+    }
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -219,7 +635,7 @@ def handle_db_error(error: Exception, operation: str, request_id: str) -> None:
 async def get_source_analytics(
     db: Session = Depends(get_db),
     days_back: int = Query(default=30, ge=1, le=365, description="Days to analyze"),
-) -> SourceAnalyticsResponse:
+) -> ORJSONResponse:
     """
     Get analytics overview broken down by platform/source.
     
@@ -233,179 +649,42 @@ async def get_source_analytics(
     - Referral (partner/affiliate/word-of-mouth)
     """
     start_time = time.time()
-    request_id = str(uuid.uuid4())[:8]
+    request_id = next_request_id()
     cache = get_cache()
     
     logger.info(f"[{request_id}] Source analytics request: days_back={days_back}")
     
     # Try cache first
-    cache_key = f"source_analytics:{days_back}"
+    # Date-bucketed: the roll-up window moves once per UTC day
+    today = datetime.now(timezone.utc).date()
+    cache_key = _overview_cache_key(today, days_back)
     try:
-        cached = cache.get(cache_key)
+        cached = _cached_payload(cache, cache_key)
         if cached:
             logger.info(f"[{request_id}] Cache hit for source analytics")
-            return SourceAnalyticsResponse(
-                **cached, 
-                cache_hit=True, 
+            return _analytics_json(
+                cached,
+                cache_hit=True,
                 query_time_ms=round((time.time() - start_time) * 1000, 2),
-                request_id=request_id
+                request_id=request_id,
             )
     except Exception as e:
         logger.warning(f"[{request_id}] Cache read failed: {e}")
     
     try:
-        # Calculate date range (use timezone-aware datetimes)
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
-        last_week = datetime.now(timezone.utc) - timedelta(days=7)
-        two_weeks_ago = datetime.now(timezone.utc) - timedelta(days=14)
-        
-        # Get all leads in period with source info
-        # CRITICAL: Exclude soft-deleted leads (deleted_at IS NOT NULL)
-        # This ensures consistency with metrics.py and All Leads table
-        leads = db.query(
-            Lead.utm_source,
-            Lead.utm_medium,
-            Lead.priority,
-            Lead.status,
-            Lead.score,
-            Lead.created_at,
-        ).filter(
-            Lead.created_at >= cutoff_date,
-            Lead.deleted_at.is_(None)  # Exclude soft-deleted leads
-        ).all()
+        result = _build_source_overview(db, today, days_back, request_id)
         
-        logger.info(f"[{request_id}] Retrieved {len(leads)} leads for analysis")
-        
-        # Initialize ALL 4 platforms with empty data
-        platform_data: Dict[str, Dict[str, Any]] = {}
-        for platform in ALLOWED_PLATFORMS:
-            platform_data[platform] = {
-                "total": 0,
-                "hot": 0,
-                "medium": 0,
-                "low": 0,
-                "converted": 0,
-                "scheduled": 0,
-                "scores": [],
-                "this_week": 0,
-                "last_week": 0,
-            }
-        
-        total_leads = len(leads)
-        
-        # Aggregate by platform
-        for lead in leads:
-            platform = get_platform_from_source(lead.utm_source, lead.utm_medium)
-            
-            # Ensure platform exists (should always be one of the 4)
-            if platform not in platform_data:
-                platform = "Widget"  # Default fallback
-            
-            platform_data[platform]["total"] += 1
-            platform_data[platform]["scores"].append(lead.score)
-            
-            # Priority breakdown
-            if lead.priority == PriorityType.HOT:
-                platform_data[platform]["hot"] += 1
-            elif lead.priority == PriorityType.MEDIUM:
-                platform_data[platform]["medium"] += 1
-            elif lead.priority == PriorityType.LOW:
-                platform_data[platform]["low"] += 1
-            
-            # Conversion tracking
-            if lead.status in [LeadStatus.CONSULTATION_COMPLETE, LeadStatus.TREATMENT_STARTED]:
-                platform_data[platform]["converted"] += 1
-            if lead.status == LeadStatus.SCHEDULED:
-                platform_data[platform]["scheduled"] += 1
-            
-            # Trend tracking
-            if lead.created_at >= last_week:
-                platform_data[platform]["this_week"] += 1
-            elif lead.created_at >= two_weeks_ago:
-                platform_data[platform]["last_week"] += 1
-        
-        # Build response - ALWAYS include all 4 platforms
-        platforms: List[PlatformMetrics] = []
-        top_conversion_rate = 0
-        top_platform = "Widget"
-        trending_up: List[str] = []
-        
-        for platform in ALLOWED_PLATFORMS:
-            data = platform_data[platform]
-            total = data["total"]
-            converted = data["converted"]
-            conversion_rate = round((converted / total * 100) if total > 0 else 0, 2)
-            avg_score = round(sum(data["scores"]) / len(data["scores"]) if data["scores"] else 0, 1)
-            percentage = round((total / total_leads * 100) if total_leads > 0 else 0, 2)
-            
-            # Calculate trend
-            this_week = data["this_week"]
-            last_week_count = data["last_week"]
-            if last_week_count > 0:
-                trend = round(((this_week - last_week_count) / last_week_count) * 100, 1)
-            else:
-                trend = 100.0 if this_week > 0 else 0.0
-            
-            if trend > 0:
-                trending_up.append(platform)
-            
-            # Track top performer (only consider platforms with data)
-            if total > 0 and conversion_rate > top_conversion_rate:
-                top_conversion_rate = conversion_rate
-                top_platform = platform
-            
-            platforms.append(PlatformMetrics(
-                platform=platform,
-                total_leads=total,
-                hot_leads=data["hot"],
-                medium_leads=data["medium"],
-                low_leads=data["low"],
-                converted_leads=converted,
-                conversion_rate=conversion_rate,
-                scheduled_leads=data["scheduled"],
-                percentage_of_total=percentage,
-                avg_score=avg_score,
-                color=PLATFORM_COLORS.get(platform, "#6B7280"),
-                icon=PLATFORM_ICONS.get(platform, "globe"),
-                trend=trend,
-                has_data=total > 0,
-            ))
-        
-        # Sort: platforms with data first, then by total leads descending
-        platforms.sort(key=lambda x: (-1 if x.has_data else 0, -x.total_leads))
-        
-        # Calculate totals
-        totals = {
-            "total_leads": total_leads,
-            "total_hot": sum(p.hot_leads for p in platforms),
-            "total_medium": sum(p.medium_leads for p in platforms),
-            "total_low": sum(p.low_leads for p in platforms),
-            "total_converted": sum(p.converted_leads for p in platforms),
-            "overall_conversion_rate": round(
-                (sum(p.converted_leads for p in platforms) / total_leads * 100) if total_leads > 0 else 0, 2
-            ),
-            "total_scheduled": sum(p.scheduled_leads for p in platforms),
-            "platform_count": len([p for p in platforms if p.has_data]),  # Only count platforms with data
-        }
-        
-        result = {
-            "platforms": [p.dict() for p in platforms],
-            "totals": totals,
-            "top_performing": top_platform,
-            "trending_up": trending_up,
-        }
-        
-        # Cache for 60 seconds
+        # Cache for 5 minutes (the roll-up refresh interval)
         try:
-            cache.set(cache_key, result, ttl=60)
+            _store_payload(cache, cache_key, result, ROLLUP_CACHE_TTL)
         except Exception as e:
             logger.warning(f"[{request_id}] Cache write failed: {e}")
         
         query_time = round((time.time() - start_time) * 1000, 2)
         logger.info(f"[{request_id}] Source analytics completed in {query_time}ms")
         
-        return SourceAnalyticsResponse(
-            **result,
+        return _analytics_json(
+            result,
             cache_hit=False,
             query_time_ms=query_time,
             request_id=request_id,
@@ -434,91 +713,41 @@ async def get_source_analytics(
 async def get_platform_trend(
     db: Session = Depends(get_db),
     period: int = Query(default=30, ge=7, le=90, description="Days to include"),
-) -> PlatformTrendResponse:
+) -> ORJSONResponse:
     """Get daily breakdown of leads by platform (all 4 platforms)."""
     start_time = time.time()
-    request_id = str(uuid.uuid4())[:8]
+    request_id = next_request_id()
     cache = get_cache()
     
     # Try cache
-    cache_key = f"platform_trend:{period}"
+    # Date-bucketed: the roll-up window moves once per UTC day
+    end_date = datetime.now(timezone.utc).date()
+    start_date = end_date - timedelta(days=period)
+    cache_key = _trend_cache_key(start_date, end_date)
     try:
-        cached = cache.get(cache_key)
+        cached = _cached_payload(cache, cache_key)
         if cached:
-            return PlatformTrendResponse(
-                **cached, 
-                cache_hit=True, 
-                query_time_ms=round((time.time() - start_time) * 1000, 2)
+            return _analytics_json(
+                cached,
+                cache_hit=True,
+                query_time_ms=round((time.time() - start_time) * 1000, 2),
             )
     except Exception as e:
         logger.warning(f"[{request_id}] Cache read failed: {e}")
     
     try:
-        # Get date range
-        end_date = datetime.now(timezone.utc).date()
-        start_date = end_date - timedelta(days=period)
-        
-        # Get leads with source info
-        # Exclude soft-deleted leads for consistency
-        leads = db.query(
-            func.date(Lead.created_at).label('date'),
-            Lead.utm_source,
-            Lead.utm_medium,
-        ).filter(
-            func.date(Lead.created_at) >= start_date,
-            Lead.deleted_at.is_(None)  # Exclude soft-deleted leads
-        ).all()
+        result = _build_platform_trend(db, start_date, end_date, period)
         
-        # Aggregate by date and platform (all 4 platforms)
-        daily_data: Dict[str, Dict[str, int]] = {}
-        
-        current = start_date
-        while current <= end_date:
-            date_str = current.isoformat()
-            daily_data[date_str] = {
-                "Widget": 0,
-                "Google Ads": 0,
-                "Jotform": 0,
-                "Referral": 0,
-            }
-            current += timedelta(days=1)
-        
-        for lead in leads:
-            date_str = lead.date.isoformat() if lead.date else None
-            if date_str and date_str in daily_data:
-                platform = get_platform_from_source(lead.utm_source, lead.utm_medium)
-                if platform in daily_data[date_str]:
-                    daily_data[date_str][platform] += 1
-        
-        # Build response
-        data = []
-        for date_str in sorted(daily_data.keys()):
-            date_obj = datetime.fromisoformat(date_str).date()
-            counts = daily_data[date_str]
-            data.append(PlatformTrendDataPoint(
-                date=date_str,
-                label=date_obj.strftime("%b %d"),
-                widget=counts.get("Widget", 0),
-                google_ads=counts.get("Google Ads", 0),
-                jotform=counts.get("Jotform", 0),
-                referral=counts.get("Referral", 0),
-            ))
-        
-        result = {
-            "period_days": period,
-            "data": [d.dict() for d in data],
-        }
-        
-        # Cache for 60 seconds
+        # Cache for 5 minutes (the roll-up refresh interval)
         try:
-            cache.set(cache_key, result, ttl=60)
+            _store_payload(cache, cache_key, result, ROLLUP_CACHE_TTL)
         except Exception as e:
             logger.warning(f"[{request_id}] Cache write failed: {e}")
         
-        return PlatformTrendResponse(
-            **result, 
-            cache_hit=False, 
-            query_time_ms=round((time.time() - start_time) * 1000, 2)
+        return _analytics_json(
+            result,
+            cache_hit=False,
+            query_time_ms=round((time.time() - start_time) * 1000, 2),
         )
         
     except SQLAlchemyError as e:
@@ -541,13 +770,13 @@ async def get_hot_leads_by_platform(
 ) -> HotLeadsByPlatformResponse:
     """Get hot leads breakdown by platform with details (all 4 platforms)."""
     start_time = time.time()
-    request_id = str(uuid.uuid4())[:8]
+    request_id = next_request_id()
     cache = get_cache()
     
     # Try cache
-    cache_key = f"hot_leads_platform:{days_back}"
+    cache_key = _hot_leads_cache_key(days_back)
     try:
-        cached = cache.get(cache_key)
+        cached = _cached_payload(cache, cache_key)
         if cached:
             return HotLeadsByPlatformResponse(
                 **cached, 
@@ -558,92 +787,11 @@ async def get_hot_leads_by_platform(
         logger.warning(f"[{request_id}] Cache read failed: {e}")
     
     try:
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
-        
-        # Get hot leads with source info
-        # Exclude soft-deleted leads for consistency
-        hot_leads = db.query(
-            Lead.utm_source,
-            Lead.utm_medium,
-            Lead.status,
-            Lead.score,
-            Lead.condition,
-        ).filter(
-            and_(
-                Lead.created_at >= cutoff_date,
-                Lead.priority == PriorityType.HOT,
-                Lead.deleted_at.is_(None)  # Exclude soft-deleted leads
-            )
-        ).all()
-        
-        # Initialize all 4 platforms
-        platform_data: Dict[str, Dict[str, Any]] = {}
-        for platform in ALLOWED_PLATFORMS:
-            platform_data[platform] = {
-                "count": 0,
-                "converted": 0,
-                "scheduled": 0,
-                "new": 0,
-                "scores": [],
-                "conditions": {},
-            }
-        
-        for lead in hot_leads:
-            platform = get_platform_from_source(lead.utm_source, lead.utm_medium)
-            
-            if platform not in platform_data:
-                platform = "Widget"
-            
-            platform_data[platform]["count"] += 1
-            platform_data[platform]["scores"].append(lead.score)
-            
-            # Condition breakdown
-            condition = lead.condition.value if hasattr(lead.condition, 'value') else str(lead.condition)
-            platform_data[platform]["conditions"][condition] = platform_data[platform]["conditions"].get(condition, 0) + 1
-            
-            # Status breakdown
-            if lead.status in [LeadStatus.CONSULTATION_COMPLETE, LeadStatus.TREATMENT_STARTED]:
-                platform_data[platform]["converted"] += 1
-            elif lead.status == LeadStatus.SCHEDULED:
-                platform_data[platform]["scheduled"] += 1
-            elif lead.status == LeadStatus.NEW:
-                platform_data[platform]["new"] += 1
-        
-        # Build response - include all 4 platforms
-        platforms = []
-        for platform in ALLOWED_PLATFORMS:
-            data = platform_data[platform]
-            avg_score = round(sum(data["scores"]) / len(data["scores"]) if data["scores"] else 0, 1)
-            conversion_rate = round((data["converted"] / data["count"] * 100) if data["count"] > 0 else 0, 1)
-            
-            # Top condition for this platform
-            top_condition = max(data["conditions"].items(), key=lambda x: x[1])[0] if data["conditions"] else "N/A"
-            
-            platforms.append({
-                "platform": platform,
-                "count": data["count"],
-                "converted": data["converted"],
-                "scheduled": data["scheduled"],
-                "new_untouched": data["new"],
-                "conversion_rate": conversion_rate,
-                "avg_score": avg_score,
-                "top_condition": top_condition,
-                "color": PLATFORM_COLORS.get(platform, "#6B7280"),
-                "icon": PLATFORM_ICONS.get(platform, "globe"),
-                "has_data": data["count"] > 0,
-            })
-        
-        # Sort: platforms with data first, then by count descending
-        platforms.sort(key=lambda x: (-1 if x["has_data"] else 0, -x["count"]))
-        
-        result = {
-            "platforms": platforms,
-            "total_hot_leads": sum(p["count"] for p in platforms),
-        }
+        result = _build_hot_leads(db, days_back)
         
         # Cache for 30 seconds
         try:
-            cache.set(cache_key, result, ttl=30)
+            _store_payload(cache, cache_key, result, HOT_LEADS_CACHE_TTL)
         except Exception as e:
             logger.warning(f"[{request_id}] Cache write failed: {e}")
         
@@ -661,6 +809,95 @@ async def get_hot_leads_by_platform(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get(
+    "/dashboard/bundle",
+    summary="Get Source Analytics Dashboard Bundle",
+    description="Overview, trend and hot leads in one response, read from cache with a single MGET.",
+)
+async def get_dashboard_bundle(
+    db: Session = Depends(get_db),
+    days_back: int = Query(default=30, ge=1, le=365, description="Days to analyze (overview, hot leads)"),
+    period: int = Query(default=30, ge=7, le=90, description="Days to include (trend)"),
+) -> ORJSONResponse:
+    """
+    Get every source analytics widget the dashboard renders together.
+    
+    All three cache keys are fetched in one Redis round-trip; only the
+    payloads that miss are computed (and written back) individually.
+    """
+    start_time = time.time()
+    request_id = next_request_id()
+    cache = get_cache()
+    
+    today = datetime.now(timezone.utc).date()
+    trend_start = today - timedelta(days=period)
+    sections = {
+        "overview": (
+            _overview_cache_key(today, days_back),
+            lambda: _build_source_overview(db, today, days_back, request_id),
+            ROLLUP_CACHE_TTL,
+        ),
+        "trend": (
+            _trend_cache_key(trend_start, today),
+            lambda: _build_platform_trend(db, trend_start, today, period),
+            ROLLUP_CACHE_TTL,
+        ),
+        "hot_leads": (
+            _hot_leads_cache_key(days_back),
+            lambda: _build_hot_leads(db, days_back),
+            HOT_LEADS_CACHE_TTL,
+        ),
+    }
+    
+    # Local L1 first; a single MGET for whatever it does not hold
+    cached_values = [_local_analytics.get(key) for key, _, _ in sections.values()]
+    missing_keys = [
+        key for (key, _, _), cached in zip(sections.values(), cached_values) if cached is None
+    ]
+    if missing_keys:
+        try:
+            fetched = dict(zip(missing_keys, cache.mget(missing_keys)))
+        except Exception as e:
+            logger.warning(f"[{request_id}] Cache read failed: {e}")
+            fetched = {}
+        cached_values = [
+            cached if cached is not None else fetched.get(key)
+            for (key, _, _), cached in zip(sections.values(), cached_values)
+        ]
+        for key, value in fetched.items():
+            if value:
+                _local_analytics.set(key, value)
+    
+    try:
+        payload: Dict[str, Any] = {}
+        cache_hits: Dict[str, bool] = {}
+        for (name, (cache_key, build, ttl)), cached in zip(sections.items(), cached_values):
+            cache_hits[name] = bool(cached)
+            if cached:
+                payload[name] = cached
+                continue
+            
+            payload[name] = build()
+            try:
+                _store_payload(cache, cache_key, payload[name], ttl)
+            except Exception as e:
+                logger.warning(f"[{request_id}] Cache write failed: {e}")
+        
+        return _analytics_json(
+            payload,
+            cache_hits=cache_hits,
+            query_time_ms=round((time.time() - start_time) * 1000, 2),
+            request_id=request_id,
+        )
+        
+    except SQLAlchemyError as e:
+        handle_db_error(e, "dashboard_bundle", request_id)
+        raise HTTPException(status_code=503, detail="Database temporarily unavailable")
+    except Exception as e:
+        logger.error(f"[{request_id}] Unexpected error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get(
     "/campaign-performance",
     summary="Get Campaign Performance",
@@ -669,10 +906,25 @@ async def get_hot_leads_by_platform(
 async def get_campaign_performance(
     db: Session = Depends(get_db),
     days_back: int = Query(default=30, ge=1, le=365),
-):
+) -> ORJSONResponse:
     """Get performance metrics by campaign."""
     start_time = time.time()
-    request_id = str(uuid.uuid4())[:8]
+    request_id = next_request_id()
+    cache = get_cache()
+    
+    # Try cache
+    cache_key = f"campaign_perf:{days_back}"
+    try:
+        cached = _cached_payload(cache, cache_key)
+        if cached:
+            return _analytics_json(
+                cached,
+                cache_hit=True,
+                query_time_ms=round((time.time() - start_time) * 1000, 2),
+                request_id=request_id,
+            )
+    except Exception as e:
+        logger.warning(f"[{request_id}] Cache read failed: {e}")
     
     try:
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
@@ -701,30 +953,41 @@ async def get_campaign_performance(
             func.count(Lead.id).desc()
         ).limit(20).all()
         
-        result = []
-        for campaign in campaigns:
-            total = campaign.total or 0
-            converted = campaign.converted or 0
+        campaign_rows = []
+        for utm_campaign, utm_source, total, hot, converted, avg_score in campaigns:
+            total = total or 0
+            converted = converted or 0
             conversion_rate = round((converted / total * 100) if total > 0 else 0, 2)
             
-            result.append({
-                "campaign": campaign.utm_campaign or "Direct",
-                "source": campaign.utm_source or "Direct",
-                "platform": get_platform_from_source(campaign.utm_source, None),
+            campaign_rows.append({
+                "campaign": utm_campaign or "Direct",
+                "source": utm_source or "Direct",
+                "platform": get_platform_from_source(utm_source, None),
                 "total_leads": total,
-                "hot_leads": campaign.hot or 0,
+                "hot_leads": hot or 0,
                 "converted_leads": converted,
                 "conversion_rate": conversion_rate,
-                "avg_score": round(float(campaign.avg_score or 0), 1),
+                "avg_score": round(float(avg_score or 0), 1),
             })
         
-        return {
-            "campaigns": result,
-            "total_campaigns": len(result),
-            "query_time_ms": round((time.time() - start_time) * 1000, 2),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+        result = {
+            "campaigns": campaign_rows,
+            "total_campaigns": len(campaign_rows),
         }
         
+        # Cache for 1 minute
+        try:
+            _store_payload(cache, cache_key, result, CAMPAIGN_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"[{request_id}] Cache write failed: {e}")
+        
+        return _analytics_json(
+            result,
+            cache_hit=False,
+            query_time_ms=round((time.time() - start_time) * 1000, 2),
+            request_id=request_id,
+        )
+        
     except SQLAlchemyError as e:
         handle_db_error(e, "campaign_performance", request_id)
         raise HTTPException(status_code=503, detail="Database temporarily unavailable")
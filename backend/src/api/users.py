@@ -9,12 +9,18 @@ defined BEFORE dynamic path routes (/{user_id}) to avoid FastAPI matching
 import logging
 import secrets
 from datetime import datetime, timezone, timedelta
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from uuid import UUID
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..core.database import get_db
-from ..core.security import hash_password
+from ..core.database import get_db, get_async_db
+from ..core.security import hash_temp_password
 from ..core.auth import require_role, get_current_user
 from ..models.user import User, UserRole, UserStatus, UserPreferences
 from ..schemas.user import (
@@ -33,21 +39,66 @@ from ..services.email_service import EmailService
 # Temporary password expiry window
 TEMP_PASSWORD_EXPIRY_HOURS = 48
 
-# Role hierarchy rank (higher number = more authority)
-_ROLE_RANK: dict[str, int] = {
-    "primary_admin": 100,
-    "administrator": 50,
-    "coordinator": 20,
-    "specialist": 10,
+# Role hierarchy rank (higher number = more authority), keyed by the enum
+# so handlers look up user.role directly
+_ROLE_RANK: dict[UserRole, int] = {
+    UserRole.PRIMARY_ADMIN: 100,
+    UserRole.ADMINISTRATOR: 50,
+    UserRole.COORDINATOR: 20,
+    UserRole.SPECIALIST: 10,
 }
 
 
-def _rank(role_value: str) -> int:
-    """Return the numeric rank of a role string."""
-    return _ROLE_RANK.get(role_value, 0)
+async def _get_user_or_404(db: AsyncSession, user_id: str) -> User:
+    """Primary-key lookup (identity map first); 404 if missing or not a UUID."""
+    try:
+        user = await db.get(User, UUID(user_id))
+    except ValueError:
+        user = None
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return user
+
+
+# Columns backing UserResponse, for list endpoints that skip ORM hydration
+_USER_LIST_COLUMNS = (
+    User.id,
+    User.email,
+    User.first_name,
+    User.last_name,
+    User.role,
+    User.status,
+    User.must_change_password,
+    User.last_login,
+    User.created_at,
+    User.updated_at,
+)
+_USER_RESPONSE_FIELDS = tuple(column.key for column in _USER_LIST_COLUMNS)
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/users", tags=["User Management"])
+router = APIRouter(
+    prefix="/api/users",
+    tags=["User Management"],
+    default_response_class=ORJSONResponse,
+)
+
+
+def _user_json(user: User, status_code: int = status.HTTP_200_OK) -> ORJSONResponse:
+    """
+    Serialize a user straight to an orjson response.
+    
+    The ORM values are trusted, so UserResponse is constructed without
+    validation (same as list_users) and dumped to JSON-ready values.
+    Returning a Response means FastAPI does not re-validate and re-encode
+    it either; response_model on the route still documents the schema.
+    """
+    data = {field: getattr(user, field) for field in _USER_RESPONSE_FIELDS}
+    data["role"] = user.role.value
+    data["status"] = user.status.value
+    return ORJSONResponse(
+        UserResponse.model_construct(**data).model_dump(mode="json"),
+        status_code=status_code,
+    )
 
 
 # =============================================================================
@@ -62,14 +113,23 @@ async def list_users(
     status_filter: str | None = None,
 ):
     """List all users, optionally filtered by role or status."""
-    query = db.query(User)
+    # Select only the response columns: no identity map, no attribute
+    # instrumentation, and no joined load of User.preferences
+    query = db.query(*_USER_LIST_COLUMNS)
     if role:
         query = query.filter(User.role == UserRole(role))
     if status_filter:
         query = query.filter(User.status == UserStatus(status_filter))
 
-    users = query.order_by(User.created_at.desc()).all()
-    return UserListResponse(items=[UserResponse.model_validate(u) for u in users], total=len(users))
+    rows = query.order_by(User.created_at.desc()).all()
+    # Trusted DB values: construct without re-validating each row
+    items = [
+        UserResponse.model_construct(
+            **{**row._asdict(), "role": row.role.value, "status": row.status.value}
+        )
+        for row in rows
+    ]
+    return UserListResponse.model_construct(items=items, total=len(items))
 
 
 # =============================================================================
@@ -129,9 +189,8 @@ async def update_my_preferences(
 # =============================================================================
 
 
-@router.get("/clinic-settings", response_model=ClinicSettingsResponse, dependencies=[Depends(require_role("administrator"))])
-async def get_clinic_settings(db: Session = Depends(get_db)):
-    rows = db.query(ClinicSettings).all()
+def _clinic_settings_response(rows) -> ClinicSettingsResponse:
+    """Build the clinic settings response from (key, value) rows."""
     kv = {r.key: r.value or "" for r in rows}
     return ClinicSettingsResponse(
         clinic_name=kv.get("clinic_name", ""),
@@ -141,26 +200,42 @@ async def get_clinic_settings(db: Session = Depends(get_db)):
     )
 
 
+@router.get("/clinic-settings", response_model=ClinicSettingsResponse, dependencies=[Depends(require_role("administrator"))])
+async def get_clinic_settings(db: Session = Depends(get_db)):
+    rows = db.execute(select(ClinicSettings.key, ClinicSettings.value)).all()
+    return _clinic_settings_response(rows)
+
+
 @router.put("/clinic-settings", response_model=ClinicSettingsResponse, dependencies=[Depends(require_role("administrator"))])
 async def update_clinic_settings(body: ClinicSettingsUpdate, db: Session = Depends(get_db)):
     updates = {k: v for k, v in body.model_dump().items() if v is not None}
-    for key, value in updates.items():
-        row = db.query(ClinicSettings).filter(ClinicSettings.key == key).first()
-        if row:
-            row.value = value
-        else:
-            db.add(ClinicSettings(key=key, value=value))
-    db.commit()
-
-    # Re-fetch everything
-    rows = db.query(ClinicSettings).all()
-    kv = {r.key: r.value or "" for r in rows}
-    return ClinicSettingsResponse(
-        clinic_name=kv.get("clinic_name", ""),
-        clinic_address=kv.get("clinic_address", ""),
-        clinic_phone=kv.get("clinic_phone", ""),
-        clinic_email=kv.get("clinic_email", ""),
+    if not updates:
+        rows = db.execute(select(ClinicSettings.key, ClinicSettings.value)).all()
+        return _clinic_settings_response(rows)
+
+    # Upsert every key in one statement. The data-modifying CTE returns the
+    # new values; untouched keys are read from the pre-statement snapshot,
+    # so the full settings map comes back in the same round-trip.
+    insert_stmt = pg_insert(ClinicSettings).values(
+        [{"key": k, "value": v} for k, v in updates.items()]
+    )
+    upserted = insert_stmt.on_conflict_do_update(
+        index_elements=[ClinicSettings.key],
+        set_={
+            "value": insert_stmt.excluded.value,
+            "updated_at": func.current_timestamp(),
+        },
+    ).returning(ClinicSettings.key, ClinicSettings.value).cte("upserted")
+
+    stmt = union_all(
+        select(upserted.c.key, upserted.c.value),
+        select(ClinicSettings.key, ClinicSettings.value).where(
+            ClinicSettings.key.not_in(select(upserted.c.key))
+        ),
     )
+    rows = db.execute(stmt).all()
+    db.commit()
+    return _clinic_settings_response(rows)
 
 
 # =============================================================================
@@ -169,7 +244,11 @@ async def update_clinic_settings(body: ClinicSettingsUpdate, db: Session = Depen
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_role("administrator"))])
-async def create_user(body: UserCreate, db: Session = Depends(get_db)) -> UserResponse:
+async def create_user(
+    body: UserCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+) -> ORJSONResponse:
     """
     Create a new user.  A random temporary password is generated and sent via
     email.  The user must change it on first login.
@@ -184,7 +263,7 @@ async def create_user(body: UserCreate, db: Session = Depends(get_db)) -> UserRe
 
     user = User(
         email=body.email,
-        password_hash=hash_password(temp_password),
+        password_hash=hash_temp_password(temp_password),
         first_name=body.first_name,
         last_name=body.last_name,
         role=UserRole(body.role),
@@ -192,19 +271,17 @@ async def create_user(body: UserCreate, db: Session = Depends(get_db)) -> UserRe
         must_change_password=True,
         password_expires_at=datetime.now(timezone.utc) + timedelta(hours=TEMP_PASSWORD_EXPIRY_HOURS),
     )
+    # Default preferences ride on the relationship: the unit of work orders
+    # both INSERTs and fills in user_id within the commit's single flush
+    user.preferences = UserPreferences()
     db.add(user)
-    db.flush()  # get the ID
-
-    # Create default preferences
-    prefs = UserPreferences(user_id=user.id)
-    db.add(prefs)
     db.commit()
-    db.refresh(user)
 
-    # Send invitation email (best-effort; do not fail user creation)
-    _send_invitation_email(user, temp_password)
+    # Send invitation email after the response (best-effort; do not fail
+    # user creation). Sync task: FastAPI runs it in the threadpool.
+    background_tasks.add_task(_send_invitation_email, user, temp_password)
 
-    return UserResponse.model_validate(user)
+    return _user_json(user, status_code=status.HTTP_201_CREATED)
 
 
 def _send_invitation_email(user: User, temp_password: str) -> None:
@@ -261,14 +338,16 @@ def _send_invitation_email(user: User, temp_password: str) -> None:
 
 
 @router.post("/{user_id}/resend-invite", response_model=UserResponse, dependencies=[Depends(require_role("administrator"))])
-async def resend_invitation(user_id: str, db: Session = Depends(get_db)) -> UserResponse:
+async def resend_invitation(
+    user_id: str,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+) -> ORJSONResponse:
     """
     Resend the invitation email with a fresh temporary password.
     Resets the 48-hour expiry window.
     """
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    user = await _get_user_or_404(db, user_id)
 
     if user.status == UserStatus.ACTIVE and not user.must_change_password:
         raise HTTPException(
@@ -278,18 +357,18 @@ async def resend_invitation(user_id: str, db: Session = Depends(get_db)) -> User
 
     # Generate new temp password
     temp_password = secrets.token_urlsafe(9)
-    user.password_hash = hash_password(temp_password)
+    # bcrypt is CPU-bound: keep it off the event loop
+    user.password_hash = await run_in_threadpool(hash_temp_password, temp_password)
     user.must_change_password = True
     user.password_expires_at = datetime.now(timezone.utc) + timedelta(hours=TEMP_PASSWORD_EXPIRY_HOURS)
     if user.status == UserStatus.INACTIVE:
         user.status = UserStatus.PENDING
-    db.commit()
-    db.refresh(user)
+    await db.commit()
 
-    # Send invitation email
-    _send_invitation_email(user, temp_password)
+    # Send invitation email after the response (off the request path)
+    background_tasks.add_task(_send_invitation_email, user, temp_password)
 
-    return UserResponse.model_validate(user)
+    return _user_json(user)
 
 
 # =============================================================================
@@ -302,8 +381,8 @@ async def update_user(
     user_id: str,
     body: UserUpdate,
     caller: User = Depends(require_role("administrator")),
-    db: Session = Depends(get_db),
-) -> UserResponse:
+    db: AsyncSession = Depends(get_async_db),
+) -> ORJSONResponse:
     """
     Update user details (name, role, status).
 
@@ -313,12 +392,11 @@ async def update_user(
     - Administrators can change coordinators and specialists.
     - No one can promote a user above their own rank.
     """
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    user = await _get_user_or_404(db, user_id)
 
-    caller_rank = _rank(caller.role.value)
-    target_rank = _rank(user.role.value)
+    caller_rank = _ROLE_RANK[caller.role]
+    target_rank = _ROLE_RANK[user.role]
+    new_role = UserRole(body.role) if body.role is not None else None
 
     # primary_admin is protected: cannot be demoted or deactivated
     if user.role == UserRole.PRIMARY_ADMIN:
@@ -341,24 +419,32 @@ async def update_user(
         )
 
     # Cannot promote a user above your own rank
-    if body.role is not None and _rank(body.role) > caller_rank:
+    if new_role is not None and _ROLE_RANK[new_role] > caller_rank:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You cannot assign a role higher than your own",
         )
 
-    if body.first_name is not None:
-        user.first_name = body.first_name
-    if body.last_name is not None:
-        user.last_name = body.last_name
-    if body.role is not None:
-        user.role = UserRole(body.role)
-    if body.status is not None:
-        user.status = UserStatus(body.status)
+    requested = {
+        "first_name": body.first_name,
+        "last_name": body.last_name,
+        "role": new_role,
+        "status": UserStatus(body.status) if body.status is not None else None,
+    }
+    changes = {
+        field: value for field, value in requested.items()
+        if value is not None and getattr(user, field) != value
+    }
 
-    db.commit()
-    db.refresh(user)
-    return UserResponse.model_validate(user)
+    # No-op save: skip the write transaction entirely
+    if not changes:
+        return _user_json(user)
+
+    for field, value in changes.items():
+        setattr(user, field, value)
+
+    await db.commit()
+    return _user_json(user)
 
 
 # =============================================================================
@@ -370,7 +456,7 @@ async def update_user(
 async def deactivate_user(
     user_id: str,
     caller: User = Depends(require_role("administrator")),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Soft-deactivate a user (set status = inactive).
@@ -380,9 +466,7 @@ async def deactivate_user(
     - Only primary_admin can deactivate an administrator.
     - A user cannot deactivate themselves.
     """
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    user = await _get_user_or_404(db, user_id)
 
     # Cannot deactivate yourself
     if str(caller.id) == str(user.id):
@@ -399,8 +483,8 @@ async def deactivate_user(
         )
 
     # Only primary_admin can deactivate administrators
-    caller_rank = _rank(caller.role.value)
-    target_rank = _rank(user.role.value)
+    caller_rank = _ROLE_RANK[caller.role]
+    target_rank = _ROLE_RANK[user.role]
     if target_rank >= caller_rank:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -408,5 +492,5 @@ async def deactivate_user(
         )
 
     user.status = UserStatus.INACTIVE
-    db.commit()
+    await db.commit()
     return {"success": True, "message": "User deactivated"}
@@ -11,14 +11,15 @@ V2 UPDATES:
 - Populates all new fields: conditions[], preferred_contact_method, etc.
 """
 
-import json
 import logging
 import re
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Mapping
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request, Form, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from ..core.database import get_db
@@ -39,6 +40,7 @@ from ..services.encryption import EncryptionService
 from ..services.audit import AuditService
 from ..services.lead_number import generate_unique_lead_number
 from ..services.cache import get_cache
+from ..services.provider_cache import invalidate_provider_cache
 from ..services.intake_mapping import (
     map_jotform_submission_to_lead_input,
     LeadInput,
@@ -57,7 +59,11 @@ from sqlalchemy import func
 
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/webhooks", tags=["Webhooks"])
+router = APIRouter(
+    prefix="/api/webhooks",
+    tags=["Webhooks"],
+    default_response_class=ORJSONResponse,
+)
 
 
 # =============================================================================
@@ -70,8 +76,10 @@ JOTFORM_FORM_ID = "260267308720050"
 # =============================================================================
 # Field Mapping Configuration
 # =============================================================================
+# Read-only: the keyword matchers below are compiled from these maps at
+# import, so in-place edits would silently diverge from matching behaviour.
 
-CONDITION_MAP = {
+CONDITION_MAP = MappingProxyType({
     "depression": ConditionType.DEPRESSION,
     "anxiety": ConditionType.ANXIETY,
     "ocd": ConditionType.OCD,
@@ -79,15 +87,15 @@ CONDITION_MAP = {
     "ptsd": ConditionType.PTSD,
     "post-traumatic stress disorder": ConditionType.PTSD,
     "other": ConditionType.OTHER,
-}
+})
 
-DURATION_MAP = {
+DURATION_MAP = MappingProxyType({
     "less than 6 months": DurationType.LESS_THAN_6_MONTHS,
     "6 to 12 months": DurationType.SIX_TO_TWELVE_MONTHS,
     "more than 12 months": DurationType.MORE_THAN_12_MONTHS,
-}
+})
 
-TREATMENT_KEYWORDS = {
+TREATMENT_KEYWORDS = MappingProxyType({
     "antidepressant": TreatmentType.ANTIDEPRESSANTS,
     "zoloft": TreatmentType.ANTIDEPRESSANTS,
     "lexapro": TreatmentType.ANTIDEPRESSANTS,
@@ -101,9 +109,9 @@ TREATMENT_KEYWORDS = {
     "cognitive": TreatmentType.THERAPY_CBT,
     "counseling": TreatmentType.THERAPY_CBT,
     "psychotherapy": TreatmentType.THERAPY_CBT,
-}
+})
 
-URGENCY_MAP = {
+URGENCY_MAP = MappingProxyType({
     "as soon as possible": UrgencyType.ASAP,
     "asap": UrgencyType.ASAP,
     "within a month": UrgencyType.WITHIN_30_DAYS,
@@ -111,28 +119,28 @@ URGENCY_MAP = {
     "within a few months": UrgencyType.EXPLORING,
     "exploring": UrgencyType.EXPLORING,
     "just exploring options": UrgencyType.EXPLORING,
-}
+})
 
 # Scoring Constants (matching widget scoring)
-CONDITION_SCORES = {
+CONDITION_SCORES = MappingProxyType({
     ConditionType.DEPRESSION: 50,
     ConditionType.ANXIETY: 50,
     ConditionType.OCD: 50,
     ConditionType.PTSD: 50,
     ConditionType.OTHER: 0,
-}
+})
 
-DURATION_SCORES = {
+DURATION_SCORES = MappingProxyType({
     DurationType.MORE_THAN_12_MONTHS: 20,
     DurationType.SIX_TO_TWELVE_MONTHS: 10,
     DurationType.LESS_THAN_6_MONTHS: 0,
-}
+})
 
-URGENCY_SCORES = {
+URGENCY_SCORES = MappingProxyType({
     UrgencyType.ASAP: 25,
     UrgencyType.WITHIN_30_DAYS: 10,
     UrgencyType.EXPLORING: 0,
-}
+})
 
 INSURANCE_YES_SCORE = 30
 INSURANCE_NO_SCORE = -20
@@ -145,6 +153,54 @@ PROVIDER_REFERRAL_BONUS = 15
 HOT_THRESHOLD = 120
 MEDIUM_THRESHOLD = 70
 
+# Normalization patterns, compiled once at import
+_PHONE_STRIP_RE = re.compile(r"[^\d+]")
+_NON_DIGIT_RE = re.compile(r"[^\d]")
+
+
+def _compile_first_key_matcher(mapping: Mapping[str, Any]):
+    """
+    Compile a keyword map into one regex matching its first contained key.
+    
+    Each alternative is an anchored lookahead, so alternatives are tried in
+    dict order and the first key found anywhere in the text wins, exactly
+    like looping `key in text` over the map, but in one C-level match.
+    The matched alternative's group index selects the value.
+    """
+    pattern = re.compile(
+        "|".join(f"^(?=.*?({re.escape(key)}))" for key in mapping),
+        re.DOTALL,
+    )
+    return pattern, tuple(mapping.values())
+
+
+_CONDITION_MATCHER = _compile_first_key_matcher(CONDITION_MAP)
+_DURATION_MATCHER = _compile_first_key_matcher(DURATION_MAP)
+_URGENCY_MATCHER = _compile_first_key_matcher(URGENCY_MAP)
+
+# One alternation per treatment type: a type applies if any of its
+# keywords occurs in the text
+_TREATMENT_PATTERNS = tuple(
+    (
+        treatment_type,
+        re.compile("|".join(
+            re.escape(keyword)
+            for keyword, keyword_type in TREATMENT_KEYWORDS.items()
+            if keyword_type == treatment_type
+        )),
+    )
+    for treatment_type in dict.fromkeys(TREATMENT_KEYWORDS.values())
+)
+
+
+def _match_first_key(matcher, text: str, default: Any) -> Any:
+    """Return the value of the first map key contained in text, else default."""
+    pattern, values = matcher
+    match = pattern.match(text)
+    if match is None:
+        return default
+    return values[match.lastindex - 1]
+
 
 # =============================================================================
 # Helper Functions
@@ -170,10 +226,10 @@ def get_client_ip(request: Request) -> Optional[str]:
 
 
 def parse_jotform_payload(raw_request: str) -> Dict[str, Any]:
-    """Parse Jotform rawRequest JSON string."""
+    """Parse Jotform rawRequest JSON string (str or bytes) with orjson."""
     try:
-        return json.loads(raw_request)
-    except json.JSONDecodeError as e:
+        return orjson.loads(raw_request)
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse Jotform payload: {e}")
         raise ValueError(f"Invalid JSON in rawRequest: {e}")
 
@@ -183,10 +239,7 @@ def map_condition(conditions: List[str]) -> ConditionType:
     if not conditions:
         return ConditionType.OTHER
     condition_lower = conditions[0].lower().strip()
-    for key, value in CONDITION_MAP.items():
-        if key in condition_lower:
-            return value
-    return ConditionType.OTHER
+    return _match_first_key(_CONDITION_MATCHER, condition_lower, ConditionType.OTHER)
 
 
 def map_duration(duration: str) -> DurationType:
@@ -194,10 +247,7 @@ def map_duration(duration: str) -> DurationType:
     if not duration:
         return DurationType.LESS_THAN_6_MONTHS
     duration_lower = duration.lower().strip()
-    for key, value in DURATION_MAP.items():
-        if key in duration_lower:
-            return value
-    return DurationType.LESS_THAN_6_MONTHS
+    return _match_first_key(_DURATION_MATCHER, duration_lower, DurationType.LESS_THAN_6_MONTHS)
 
 
 def map_treatments(treatments: List[str]) -> List[TreatmentType]:
@@ -207,8 +257,8 @@ def map_treatments(treatments: List[str]) -> List[TreatmentType]:
     result = set()
     for treatment in treatments:
         treatment_lower = treatment.lower()
-        for keyword, treatment_type in TREATMENT_KEYWORDS.items():
-            if keyword in treatment_lower:
+        for treatment_type, pattern in _TREATMENT_PATTERNS:
+            if treatment_type not in result and pattern.search(treatment_lower):
                 result.add(treatment_type)
     if not result:
         return [TreatmentType.NONE]
@@ -220,10 +270,7 @@ def map_urgency(urgency: str) -> UrgencyType:
     if not urgency:
         return UrgencyType.EXPLORING
     urgency_lower = urgency.lower().strip()
-    for key, value in URGENCY_MAP.items():
-        if key in urgency_lower:
-            return value
-    return UrgencyType.EXPLORING
+    return _match_first_key(_URGENCY_MATCHER, urgency_lower, UrgencyType.EXPLORING)
 
 
 def parse_yes_no(value: str) -> bool:
@@ -237,7 +284,7 @@ def normalize_phone(phone: str) -> str:
     """Normalize phone number."""
     if not phone:
         return ""
-    digits = re.sub(r"[^\d+]", "", phone)
+    digits = _PHONE_STRIP_RE.sub("", phone)
     return digits if digits else phone
 
 
@@ -245,7 +292,7 @@ def normalize_zip(zip_code: str) -> str:
     """Normalize ZIP code to 5 digits."""
     if not zip_code:
         return "00000"
-    digits = re.sub(r"[^\d]", "", zip_code)
+    digits = _NON_DIGIT_RE.sub("", zip_code)
     return digits[:5] if len(digits) >= 5 else digits.zfill(5)
 
 
@@ -1021,6 +1068,8 @@ async def jotform_webhook(
             referring_provider.last_referral_at = now
             db.commit()
             logger.info(f"Updated provider stats: {referring_provider.name} total_referrals={referring_provider.total_referrals}")
+            # Covers providers created or backfilled by find_or_create_provider too
+            invalidate_provider_cache(referring_provider.id)
         
         logger.info(
             f"Jotform lead created: {lead.lead_number}, "
@@ -1074,7 +1123,7 @@ async def jotform_webhook(
         except Exception:
             pass
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -1229,7 +1278,7 @@ async def google_ads_webhook(
         # 1. Parse the JSON body
         # =====================================================================
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
         except Exception:
             logger.warning("Google Ads webhook: invalid JSON body")
             raise HTTPException(status_code=400, detail="Invalid JSON payload")
@@ -1410,7 +1459,7 @@ async def google_ads_webhook(
         # =====================================================================
         # 8. Return success so Google Ads confirms delivery
         # =====================================================================
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
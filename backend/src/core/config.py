@@ -57,14 +57,20 @@ class Settings(BaseSettings):
     )
     db_pool_size: int = Field(
         default=20, description="Database connection pool size")
+    # Per engine and per worker; the sync and async engines each hold their
+    # own pool, so the ceiling is 2 * (pool_size + max_overflow) per worker.
     db_max_overflow: int = Field(
-        default=20, description="Max overflow connections")
+        default=10, description="Max overflow connections")
     db_pool_recycle: int = Field(
         default=1800, description="Connection recycle time in seconds (30 min)")
     db_pool_timeout: int = Field(
         default=30, description="Connection checkout timeout in seconds")
     enable_read_replica: bool = Field(
         default=False, description="Enable read/write splitting")
+    db_pgbouncer: bool = Field(
+        default=False,
+        description="DATABASE_URL points at PgBouncer in transaction-pooling mode "
+                    "(disables asyncpg server-side prepared statement caches)")
 
     # ==========================================================================
     # Redis Cache Settings
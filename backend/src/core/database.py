@@ -5,11 +5,14 @@ Provides SQLAlchemy engine, session factory, and dependency injection
 for database sessions in FastAPI endpoints.
 """
 
-from typing import Generator
+from collections import Counter
+from contextvars import ContextVar
+from typing import AsyncGenerator, Generator, Optional
 
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker, declarative_base
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from .config import settings
 
@@ -48,6 +51,68 @@ engine = create_engine(
 )
 
 
+def get_async_engine_url() -> str:
+    """
+    Get database URL using the asyncpg driver.
+    
+    Returns:
+        Database connection URL string for create_async_engine
+    """
+    url = settings.database_url
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            url = "postgresql+asyncpg://" + url[len(prefix):]
+            break
+    if settings.db_pgbouncer:
+        # Dialect-level prepared statement cache (see get_async_connect_args)
+        url += ("&" if "?" in url else "?") + "prepared_statement_cache_size=0"
+    return url
+
+
+def get_async_connect_args() -> dict:
+    """
+    Get asyncpg connect arguments.
+    
+    Behind PgBouncer in transaction-pooling mode, consecutive statements can
+    land on different server connections, so asyncpg's server-side prepared
+    statement caches must be disabled. PgBouncer also rejects startup
+    parameters it does not track (statement_timeout); set that on the
+    database role instead (ALTER ROLE ... SET statement_timeout = '30s').
+    
+    Returns:
+        connect_args dict for create_async_engine
+    """
+    if settings.db_pgbouncer:
+        return {
+            "statement_cache_size": 0,
+            "server_settings": {"timezone": "UTC"},
+        }
+    # Same per-connection settings as set_connection_settings below
+    return {
+        "server_settings": {
+            "timezone": "UTC",
+            "statement_timeout": "30s",
+        },
+    }
+
+
+# Async engine for handlers that must not block the event loop
+# (hot dashboard/analytics reads). Mirrors the sync engine's pool settings:
+# pooled, pre-pinged connections so requests never pay a fresh TCP/TLS
+# handshake, recycled before server/PgBouncer idle timeouts.
+async_engine = create_async_engine(
+    get_async_engine_url(),
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+    pool_timeout=settings.db_pool_timeout,
+    echo=settings.debug,
+    connect_args=get_async_connect_args(),
+)
+
+
 # =============================================================================
 # Session Factory
 # =============================================================================
@@ -60,6 +125,14 @@ SessionLocal = sessionmaker(
 )
 
 
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
 # =============================================================================
 # Event Listeners for Connection Management
 # =============================================================================
@@ -87,6 +160,24 @@ def ping_connection(dbapi_connection, connection_record, connection_proxy):
     pass  # pool_pre_ping handles this, but hook is available for custom logic
 
 
+# Per-request statement counts for N+1 detection (development only). The
+# request middleware sets a Counter; contextvars carry it into threadpool
+# handlers, and every cursor execute on either engine bumps it.
+statement_counts: ContextVar[Optional[Counter]] = ContextVar("statement_counts", default=None)
+
+
+def count_statement(conn, cursor, statement, parameters, context, executemany):
+    """Count an executed statement against the current request, if tracked."""
+    counts = statement_counts.get()
+    if counts is not None:
+        counts[statement] += 1
+
+
+if settings.is_development:
+    event.listen(engine, "before_cursor_execute", count_statement)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+
+
 # =============================================================================
 # Dependency Injection
 # =============================================================================
@@ -112,6 +203,26 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for async database session injection.
+    
+    Use for async handlers on hot read paths so queries do not block
+    the event loop.
+    
+    Yields:
+        SQLAlchemy AsyncSession instance
+        
+    Example:
+        @router.get("/summary")
+        async def get_summary(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(func.count(Lead.id)))
+            return result.scalar_one()
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 # =============================================================================
 # Database Utilities
 # =============================================================================
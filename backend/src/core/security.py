@@ -5,6 +5,7 @@ Provides AES-256 encryption for PHI, password hashing, and JWT utilities.
 All PHI must be encrypted before storage using these utilities.
 """
 
+import functools
 import hashlib
 import secrets
 from datetime import datetime, timedelta
@@ -32,6 +33,20 @@ def hash_password(password: str) -> str:
     return _bcrypt.hashpw(password.encode("utf-8"), _bcrypt.gensalt()).decode("utf-8")
 
 
+# Cost for server-generated temporary passwords. These are random
+# (secrets.token_urlsafe, ~72 bits) and expire within 48 hours, so their
+# strength comes from entropy rather than the work factor; 2^10 rounds is
+# ~4x cheaper than the default 2^12 and still far beyond brute force.
+TEMP_PASSWORD_BCRYPT_ROUNDS = 10
+
+
+def hash_temp_password(password: str) -> str:
+    """Hash a server-generated temporary password with a reduced bcrypt cost."""
+    return _bcrypt.hashpw(
+        password.encode("utf-8"), _bcrypt.gensalt(rounds=TEMP_PASSWORD_BCRYPT_ROUNDS)
+    ).decode("utf-8")
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain-text password against a bcrypt hash."""
     return _bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
@@ -276,6 +291,17 @@ def is_valid_zip_code(zip_code: str) -> bool:
     return len(clean_zip) in (5, 9)
 
 
+@functools.lru_cache(maxsize=4)
+def _service_area_prefixes(raw_prefixes: str) -> frozenset:
+    """
+    Parse the configured ZIP prefixes once per distinct setting value.
+    
+    Keyed by the raw config string, so a changed setting is picked up
+    without explicit invalidation.
+    """
+    return frozenset(prefix.strip() for prefix in raw_prefixes.split(",") if prefix.strip())
+
+
 def is_in_service_area(zip_code: str) -> bool:
     """
     Check if ZIP code is within the service area.
@@ -300,4 +326,4 @@ def is_in_service_area(zip_code: str) -> bool:
     
     prefix = clean_zip[:2]
     
-    return prefix in settings.service_area_prefixes_list
+    return prefix in _service_area_prefixes(settings.service_area_zip_prefixes)
@@ -21,6 +21,7 @@ from sqlalchemy import (
     Date,
     Enum as SQLEnum,
     ARRAY,
+    Computed,
     ForeignKey,
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
@@ -323,6 +324,17 @@ class Lead(Base):
     # Soft delete
     deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)
     
+    # Generated (migration 024): non-deleted and not in a terminal status.
+    # Backed by partial indexes WHERE is_active.
+    is_active = Column(
+        Boolean,
+        Computed(
+            "status NOT IN ('CONSULTATION_COMPLETE', 'TREATMENT_STARTED', 'LOST', 'DISQUALIFIED') "
+            "AND deleted_at IS NULL",
+            persisted=True,
+        ),
+    )
+    
     # Scheduling fields (for coordinator callbacks)
     scheduled_callback_at = Column(DateTime(timezone=True), nullable=True)
     scheduled_notes = Column(Text, nullable=True)
@@ -19,6 +19,7 @@ from sqlalchemy import (
     DateTime,
     Enum as SQLEnum,
     ARRAY,
+    Index,
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
 from sqlalchemy.sql import func
@@ -309,7 +310,6 @@ class ProviderNotesHistory(Base):
     provider_id = Column(
         PGUUID(as_uuid=True),
         nullable=False,
-        index=True,
     )
     
     # Note content
@@ -349,3 +349,12 @@ class ProviderNotesHistory(Base):
             "created_by": self.created_by,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
+
+
+# Notes history reads filter by provider and order by newest first; the
+# composite also serves plain provider_id lookups (migrations 006, 028)
+Index(
+    "idx_provider_notes_created_at",
+    ProviderNotesHistory.provider_id,
+    ProviderNotesHistory.created_at.desc(),
+)
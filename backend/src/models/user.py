@@ -115,6 +115,10 @@ class User(Base):
     # Relationship to preferences
     preferences = relationship("UserPreferences", uselist=False, back_populates="user", lazy="joined")
 
+    # Fetch server-generated created_at/updated_at via RETURNING on flush, so
+    # handlers can serialize the user after commit without a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     @property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
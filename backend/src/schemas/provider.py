@@ -397,3 +397,47 @@ class ProviderMatchResult(BaseModel):
             }
         }
     }
+
+
+# =============================================================================
+# Provider Notes Schemas
+# =============================================================================
+
+class ProviderNoteCreate(BaseModel):
+    """A single note for a provider's notes history."""
+    
+    note_text: str = Field(
+        ...,
+        min_length=1,
+        description="Note content"
+    )
+    note_type: str = Field(
+        default="general",
+        max_length=50,
+        description="Type of note (general, call, meeting, email, followup)"
+    )
+    created_by: Optional[str] = Field(
+        default=None,
+        max_length=255,
+        description="Name/email of the coordinator who created the note"
+    )
+    
+    @field_validator("note_text")
+    @classmethod
+    def strip_note_text(cls, v: str) -> str:
+        """Reject whitespace-only notes."""
+        v = v.strip()
+        if not v:
+            raise ValueError("note_text cannot be empty")
+        return v
+
+
+class ProviderNotesBulkCreate(BaseModel):
+    """Batch of notes inserted in one statement (imports, migrations)."""
+    
+    notes: List[ProviderNoteCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Notes in chronological order; the last becomes the provider's current notes"
+    )
@@ -8,6 +8,9 @@ Services handle data processing, scoring, and external integrations.
 from .lead_scoring import LeadScoringService, calculate_lead_score
 from .encryption import EncryptionService
 from .audit import AuditService
+# Imported for side effects: registers the Lead write hooks that keep the
+# dashboard summary counters current
+from . import dashboard_counters  # noqa: F401
 
 __all__ = [
     "LeadScoringService",
@@ -5,14 +5,20 @@ Tracks all access to Protected Health Information (PHI).
 Required for HIPAA compliance and security auditing.
 """
 
+import asyncio
+import logging
+import threading
 from typing import Optional, Any
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
 from ..models.audit_log import AuditLog, AuditAction
+from ..core.database import SessionLocal
 from ..core.security import hash_ip_address
 
+logger = logging.getLogger(__name__)
+
 
 class AuditService:
     """
@@ -364,3 +370,193 @@ def create_audit_service(db: Session) -> AuditService:
         AuditService instance
     """
     return AuditService(db)
+
+
+# =============================================================================
+# Batched Background Logging
+# =============================================================================
+
+# Flush pending entries once this many are queued, or every interval seconds
+AUDIT_BATCH_SIZE = 50
+AUDIT_FLUSH_INTERVAL_SECONDS = 0.5
+
+# Failed batch writes are requeued and retried on later flushes this many
+# times before falling back to one transaction per entry
+AUDIT_MAX_FLUSH_RETRIES = 3
+
+
+class AuditLogBuffer:
+    """
+    Thread-safe buffer of pending audit entries.
+    
+    Background tasks run in the threadpool, so entries are collected under a
+    lock and written in one multi-row INSERT on a dedicated session, instead
+    of one INSERT + COMMIT per request.
+    
+    A failed batch is put back at the head of the queue and retried on the
+    next flush; after AUDIT_MAX_FLUSH_RETRIES consecutive failures the
+    entries are written one per transaction so a single bad entry cannot
+    hold back the rest.
+    """
+    
+    def __init__(
+        self,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        max_retries: int = AUDIT_MAX_FLUSH_RETRIES,
+    ):
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self._pending: list[AuditLog] = []
+        self._failed_flushes = 0
+        self._lock = threading.Lock()
+    
+    def add(self, entry: AuditLog) -> None:
+        """Queue an entry, flushing immediately if the batch is full."""
+        with self._lock:
+            self._pending.append(entry)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
+    
+    def flush(self) -> int:
+        """
+        Write all pending entries in one transaction.
+        
+        On failure the entries are requeued for the next flush, up to
+        max_retries times, then written individually.
+        
+        Returns:
+            Number of entries written (0 on failure)
+        """
+        with self._lock:
+            entries, self._pending = self._pending, []
+        if not entries:
+            return 0
+        
+        db = SessionLocal()
+        try:
+            db.add_all(entries)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            with self._lock:
+                self._failed_flushes += 1
+                attempt = self._failed_flushes
+                retry = attempt <= self.max_retries
+                if retry:
+                    # Keep arrival order: failed batch goes ahead of new entries
+                    self._pending[:0] = entries
+            if retry:
+                logger.warning(
+                    f"Failed to write {len(entries)} audit log entries "
+                    f"(attempt {attempt}/{self.max_retries}), requeued: {e}"
+                )
+                return 0
+            logger.error(f"Failed to write {len(entries)} audit log entries in batch: {e}")
+        else:
+            with self._lock:
+                self._failed_flushes = 0
+            return len(entries)
+        finally:
+            db.close()
+        
+        # Retries exhausted: isolate failures with one transaction per entry
+        with self._lock:
+            self._failed_flushes = 0
+        return self._write_individually(entries)
+    
+    def _write_individually(self, entries: list[AuditLog]) -> int:
+        """
+        Write entries one per transaction, logging any that still fail.
+        
+        Args:
+            entries: Audit entries to write
+            
+        Returns:
+            Number of entries written
+        """
+        written = 0
+        db = SessionLocal()
+        try:
+            for entry in entries:
+                try:
+                    db.add(entry)
+                    db.commit()
+                    written += 1
+                except Exception as e:
+                    db.rollback()
+                    logger.error(
+                        f"Dropped audit entry {entry.action} for "
+                        f"{entry.table_name}/{entry.record_id}: {e}"
+                    )
+        finally:
+            db.close()
+        return written
+
+
+_audit_buffer = AuditLogBuffer()
+
+
+def log_audit_in_background(
+    action: AuditAction,
+    table_name: str,
+    record_id: UUID,
+    ip_address: Optional[str] = None,
+    **kwargs: Any,
+) -> None:
+    """
+    Queue one audit entry for the next batched write; never raises.
+    
+    Meant for FastAPI ``BackgroundTasks`` so no audit INSERT happens before
+    the response is sent.
+    
+    Args:
+        action: Type of action performed
+        table_name: Name of table being accessed
+        record_id: UUID of record being accessed
+        ip_address: Optional IP address (will be hashed)
+        **kwargs: Remaining AuditLog.create_entry fields
+    """
+    try:
+        _audit_buffer.add(AuditLog.create_entry(
+            table_name=table_name,
+            record_id=record_id,
+            action=action,
+            user_ip_hash=hash_ip_address(ip_address) if ip_address else None,
+            **kwargs,
+        ))
+    except Exception as e:
+        logger.warning(f"Could not queue audit {action} for {table_name}: {e}")
+
+
+async def run_audit_flusher(stop_event: asyncio.Event) -> None:
+    """Flush the audit buffer periodically until stop_event is set."""
+    while not stop_event.is_set():
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=AUDIT_FLUSH_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        await asyncio.to_thread(_audit_buffer.flush)
+
+
+def start_audit_flusher() -> tuple:
+    """
+    Start the periodic audit flusher on the running loop.
+    
+    Returns:
+        (task, stop_event) to pass to stop_audit_flusher
+    """
+    stop_event = asyncio.Event()
+    task = asyncio.create_task(run_audit_flusher(stop_event))
+    return task, stop_event
+
+
+async def stop_audit_flusher(handle: tuple) -> None:
+    """Stop the flusher and write whatever is still pending."""
+    task, stop_event = handle
+    stop_event.set()
+    try:
+        await asyncio.wait_for(task, timeout=5.0)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        task.cancel()
+    _audit_buffer.flush()
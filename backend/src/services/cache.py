@@ -9,12 +9,13 @@ and frequently accessed data with:
 - Cache warming on startup
 """
 
+import asyncio
 import json
 import logging
 import threading
 import time
 from datetime import datetime
-from typing import Any, Optional, Callable, TypeVar, Tuple
+from typing import Any, Awaitable, List, Optional, Callable, TypeVar, Tuple
 from functools import wraps
 from concurrent.futures import ThreadPoolExecutor
 
@@ -53,6 +54,9 @@ class CacheService:
     PREFIX_COHORT = "neuroreach:cohort"
     PREFIX_TREND = "neuroreach:trend"
     
+    # Seconds between cache polls while another worker holds a compute lock
+    LOCK_POLL_INTERVAL = 0.05
+    
     def __init__(self):
         """Initialize Redis connection."""
         self._redis: Optional[redis.Redis] = None
@@ -124,6 +128,40 @@ class CacheService:
             logger.warning(f"Cache get error for {key}: {e}")
             return None
     
+    def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several values from cache in a single round-trip (MGET).
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values in the same order as keys; None for missing/undecodable
+            entries (all None if Redis is unavailable)
+        """
+        if not keys:
+            return []
+        if not self._ensure_connection():
+            return [None] * len(keys)
+
+        try:
+            raw_values = self._redis.mget(keys)
+        except RedisError as e:
+            logger.warning(f"Cache mget error for {keys}: {e}")
+            return [None] * len(keys)
+
+        values: List[Optional[Any]] = []
+        for key, raw in zip(keys, raw_values):
+            if not raw:
+                values.append(None)
+                continue
+            try:
+                values.append(json.loads(raw))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Cache mget decode error for {key}: {e}")
+                values.append(None)
+        return values
+
     def get_with_stale(self, key: str) -> Tuple[Optional[Any], bool]:
         """
         Get value from cache with stale indicator.
@@ -187,20 +225,113 @@ class CacheService:
             logger.warning(f"Cache set error for {key}: {e}")
             return False
     
+    # ==========================================================================
+    # Hash Counters
+    # ==========================================================================
+
+    # Apply HINCRBY deltas only when the hash has been seeded. Incrementing a
+    # missing hash would create a partial set of counters that looks valid.
+    _HINCRBY_IF_EXISTS_SCRIPT = """
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return 0
+    end
+    for i = 1, #ARGV, 2 do
+        redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+    end
+    return 1
+    """
+
+    def hgetall(self, key: str) -> dict:
+        """
+        Get all fields of a Redis hash.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Dict of field -> value (empty if missing/error)
+        """
+        if not self._ensure_connection():
+            return {}
+
+        try:
+            return self._redis.hgetall(key)
+        except RedisError as e:
+            logger.warning(f"Cache hgetall error for {key}: {e}")
+            return {}
+
+    def replace_hash(self, key: str, mapping: dict) -> bool:
+        """
+        Atomically replace a Redis hash with the given fields.
+
+        Args:
+            key: Cache key
+            mapping: Field -> value mapping
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._ensure_connection():
+            return False
+
+        try:
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.delete(key)
+            if mapping:
+                pipe.hset(key, mapping=mapping)
+            pipe.execute()
+            return True
+        except RedisError as e:
+            logger.warning(f"Cache replace_hash error for {key}: {e}")
+            return False
+
+    def hincrby_if_exists(self, key: str, deltas: dict) -> bool:
+        """
+        Increment hash fields atomically, only if the hash already exists.
+
+        Args:
+            key: Cache key
+            deltas: Field -> integer delta mapping
+
+        Returns:
+            True if the deltas were applied, False otherwise
+        """
+        if not deltas or not self._ensure_connection():
+            return False
+
+        try:
+            args = []
+            for field, delta in deltas.items():
+                args.extend((field, int(delta)))
+            return bool(self._redis.eval(self._HINCRBY_IF_EXISTS_SCRIPT, 1, key, *args))
+        except RedisError as e:
+            logger.warning(f"Cache hincrby error for {key}: {e}")
+            return False
+
     # ==========================================================================
     # Stampede Prevention (Distributed Locking)
     # ==========================================================================
     
-    def acquire_lock(self, lock_name: str, timeout: int = 10) -> Optional[Lock]:
+    def acquire_lock(
+        self,
+        lock_name: str,
+        timeout: int = 10,
+        blocking: bool = True,
+    ) -> Optional[Lock]:
         """
         Acquire a distributed lock for cache operations.
         
         Prevents thundering herd / cache stampede when many requests
         try to refresh expired cache simultaneously.
         
+        The lock is shared across processes: redis-py's Lock takes it with
+        SET NX PX and a unique token, and releases it with a Lua
+        compare-and-delete so a holder can never drop another's lock.
+        
         Args:
             lock_name: Name of the lock
             timeout: Lock timeout in seconds
+            blocking: Wait up to 1 second for the lock if True
             
         Returns:
             Lock object if acquired, None otherwise
@@ -214,13 +345,34 @@ class CacheService:
                 timeout=timeout,
                 blocking_timeout=1,  # Wait max 1 second for lock
             )
-            if lock.acquire(blocking=True):
+            if lock.acquire(blocking=blocking):
                 return lock
             return None
         except RedisError as e:
             logger.warning(f"Failed to acquire lock {lock_name}: {e}")
             return None
     
+    async def _wait_for_value_async(self, key: str, timeout: float) -> Optional[Any]:
+        """
+        Poll the cache for a value another worker is computing.
+        
+        Sleeps with asyncio.sleep so the event loop keeps serving requests.
+        
+        Args:
+            key: Cache key
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            Cached value, or None if it did not appear in time
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.LOCK_POLL_INTERVAL)
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+        return None
+    
     def release_lock(self, lock: Optional[Lock]) -> None:
         """
         Release a distributed lock.
@@ -244,8 +396,12 @@ class CacheService:
         """
         Get from cache or compute value with stampede prevention.
         
-        If cache miss, acquires lock before computing to prevent
-        multiple simultaneous computations.
+        If cache miss, acquires a cross-process lock before computing so
+        only one worker (across all uvicorn processes) runs compute_func.
+        A caller that loses the race does not wait: it returns whatever is
+        cached (usually None) and falls back to its own computation. Async
+        handlers should use get_or_compute_async, which polls without
+        blocking the event loop.
         
         Args:
             key: Cache key
@@ -261,8 +417,12 @@ class CacheService:
         if cached is not None:
             return cached
         
+        # No Redis: nothing to single-flight on, just compute
+        if not self.is_connected:
+            return compute_func()
+        
         # Try to acquire lock for computation
-        lock = self.acquire_lock(key, timeout=lock_timeout)
+        lock = self.acquire_lock(key, timeout=lock_timeout, blocking=False)
         
         if lock:
             try:
@@ -281,11 +441,55 @@ class CacheService:
             finally:
                 self.release_lock(lock)
         else:
-            # Couldn't get lock, another thread is computing
-            # Wait briefly and try cache again
-            time.sleep(0.5)
+            # Couldn't get lock, another worker is computing; don't
+            # sleep here since this may run on the event loop
             return self.get(key)
-    
+
+    async def get_or_compute_async(
+        self,
+        key: str,
+        compute_func: Callable[[], Awaitable[T]],
+        ttl: int = 60,
+        lock_timeout: int = 10,
+    ) -> Optional[T]:
+        """
+        Async variant of get_or_compute for coroutine compute functions.
+
+        Same cross-process single-flight, but awaits the computation and
+        yields to the event loop while polling for another worker's result.
+
+        Args:
+            key: Cache key
+            compute_func: Coroutine function to compute value if not cached
+            ttl: Cache TTL in seconds
+            lock_timeout: Lock timeout in seconds
+
+        Returns:
+            Cached or computed value
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        if not self.is_connected:
+            return await compute_func()
+
+        lock = self.acquire_lock(key, timeout=lock_timeout, blocking=False)
+
+        if lock:
+            try:
+                cached = self.get(key)
+                if cached is not None:
+                    return cached
+
+                value = await compute_func()
+                self.set(key, value, ttl=ttl)
+                return value
+            finally:
+                self.release_lock(lock)
+        else:
+            return await self._wait_for_value_async(key, lock_timeout)
+
     def get_stale_while_revalidate(
         self,
         key: str,
@@ -387,6 +591,28 @@ class CacheService:
             logger.warning(f"Cache delete pattern error for {pattern}: {e}")
             return 0
     
+    def incr(self, key: str) -> Optional[int]:
+        """
+        Atomically increment an integer key (e.g. a cache version counter).
+        
+        Bumping a version embedded in other keys invalidates all of them at
+        once without a SCAN; the orphaned keys expire via their TTL.
+        
+        Args:
+            key: Counter key
+            
+        Returns:
+            New value, or None if Redis is unavailable
+        """
+        if not self._ensure_connection():
+            return None
+            
+        try:
+            return self._redis.incr(key)
+        except RedisError as e:
+            logger.warning(f"Cache incr error for {key}: {e}")
+            return None
+    
     # ==========================================================================
     # Dashboard Caching Methods
     # ==========================================================================
@@ -595,6 +821,50 @@ class CacheService:
         return round((hits / total) * 100, 2)
 
 
+class LocalTTLCache:
+    """
+    Tiny in-process cache with a short TTL, used as an L1 in front of Redis.
+    
+    Absorbs burst traffic (dashboard polling, multiple tabs) without a Redis
+    round-trip. Entries are per-process, so the TTL must stay small enough
+    that cross-worker staleness is acceptable (a few seconds).
+    """
+    
+    def __init__(self, ttl: float = 2.0, maxsize: int = 16):
+        """
+        Args:
+            ttl: Entry lifetime in seconds
+            maxsize: Maximum entries; oldest is evicted when full
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            return None
+        return value
+    
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the oldest entry if full."""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[key] = (time.monotonic(), value)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
 # Global cache service instance
 _cache_service: Optional[CacheService] = None
 
@@ -0,0 +1,514 @@
+"""
+Write-maintained dashboard summary counters.
+
+Keeps the KPI counts behind /api/metrics/analytics/dashboard-summary in a
+Redis hash that is updated incrementally on every committed Lead write,
+so reads are a single HGETALL instead of a full aggregate on TTL expiry.
+
+- SQLAlchemy mapper events on Lead diff the counted columns and queue
+  HINCRBY deltas on the session; they are applied only after COMMIT.
+- Time-bucketed counts (today / this week / scheduled today) are stored
+  under date-suffixed fields, and the hash is stamped with the UTC day it
+  was seeded on so a day rollover falls back to SQL.
+- The hash is stamped with the counters version it was seeded under. The
+  leads_changed listener bumps the version on every NOTIFY, so writes that
+  bypass the ORM (raw SQL, other services) make the next read recompute
+  from SQL instead of serving the stale hash.
+- A periodic Celery task recomputes the hash from SQL to correct drift
+  (lost increments while Redis was down).
+"""
+
+import logging
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import bindparam, event, func, inspect, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.sql import Select
+
+from ..models.lead import Lead, PriorityType, LeadStatus, ContactOutcome
+from .cache import get_cache
+
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_COUNTERS_KEY = "neuroreach:metrics:dashboard_counters"
+# Bumped on every leads_changed notification; the hash is valid only while
+# its "version" field matches
+DASHBOARD_COUNTERS_VERSION_KEY = "neuroreach:metrics:dashboard_counters:version"
+
+# Session.info key holding pending deltas until the transaction commits
+_SESSION_DELTAS_KEY = "dashboard_counter_deltas"
+# Session.info flag set when a delta could not be computed reliably
+_SESSION_STALE_KEY = "dashboard_counters_stale"
+
+# Terminal statuses excluded from "active" leads (matches the frontend's
+# activeLeads filter and the table view). Must stay in sync with the
+# generated leads.is_active column (migration 024).
+TERMINAL_STATUSES = (
+    LeadStatus.CONSULTATION_COMPLETE,
+    LeadStatus.TREATMENT_STARTED,
+    LeadStatus.LOST,
+    LeadStatus.DISQUALIFIED,
+)
+
+# Lead columns that affect any counter
+_TRACKED_ATTRS = (
+    "status",
+    "priority",
+    "contact_outcome",
+    "deleted_at",
+    "created_at",
+    "scheduled_callback_at",
+)
+
+# Plain counters (not bucketed by date)
+_STATIC_FIELDS = (
+    "total_leads",
+    "active_leads",
+    "hot_leads",
+    "new_leads",
+    "total_contacted",
+    "answered",
+    "scheduled",
+)
+
+
+# =============================================================================
+# Field Helpers
+# =============================================================================
+
+def _utc_date(value: Optional[datetime]) -> Optional[date]:
+    """Return the UTC calendar date of a timestamp (naive = UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
+
+
+def _created_day_field(day: date) -> str:
+    return f"created:{day.isoformat()}"
+
+
+def _created_week_field(week_start: date) -> str:
+    return f"created_week:{week_start.isoformat()}"
+
+
+def _scheduled_day_field(day: date) -> str:
+    return f"scheduled_on:{day.isoformat()}"
+
+
+def lead_counter_fields(values: Dict[str, Any]) -> Counter:
+    """
+    Return the counter fields a lead with the given column values contributes to.
+
+    Mirrors the FILTER clauses of the dashboard summary aggregate.
+
+    Args:
+        values: Mapping of the tracked Lead column names to values
+
+    Returns:
+        Counter of field -> 1
+    """
+    fields: Counter = Counter()
+    if values.get("deleted_at") is not None:
+        return fields
+
+    status = values.get("status")
+    priority = values.get("priority")
+    outcome = values.get("contact_outcome")
+    is_active = status not in TERMINAL_STATUSES
+
+    fields["total_leads"] = 1
+    if is_active:
+        fields["active_leads"] = 1
+        if priority == PriorityType.HOT:
+            fields["hot_leads"] = 1
+    if outcome is None or outcome == ContactOutcome.NEW:
+        fields["new_leads"] = 1
+    else:
+        fields["total_contacted"] = 1
+    if outcome in (ContactOutcome.ANSWERED, ContactOutcome.CALLBACK_REQUESTED):
+        fields["answered"] = 1
+    if status in (LeadStatus.SCHEDULED, LeadStatus.CONSULTATION_COMPLETE):
+        fields["scheduled"] = 1
+
+    created_day = _utc_date(values.get("created_at"))
+    if created_day is not None:
+        fields[_created_day_field(created_day)] = 1
+        week_start = created_day - timedelta(days=created_day.weekday())
+        fields[_created_week_field(week_start)] = 1
+
+    scheduled_day = _utc_date(values.get("scheduled_callback_at"))
+    if status == LeadStatus.SCHEDULED and scheduled_day is not None:
+        fields[_scheduled_day_field(scheduled_day)] = 1
+
+    return fields
+
+
+# =============================================================================
+# SQL Aggregate
+# =============================================================================
+
+def dashboard_counts_params(now: datetime) -> Dict[str, datetime]:
+    """
+    Bind parameters for DASHBOARD_COUNTS_STMT.
+
+    Args:
+        now: Reference time (UTC)
+
+    Returns:
+        Dict of today_start / week_start / tomorrow_start
+    """
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return {
+        "today_start": today_start,
+        "week_start": today_start - timedelta(days=today_start.weekday()),
+        "tomorrow_start": today_start + timedelta(days=1),
+    }
+
+
+def _build_dashboard_counts_stmt() -> Select:
+    """
+    Build the single aggregate query behind the dashboard counts.
+
+    All counts exclude soft-deleted leads so KPIs match the table view,
+    which filters Lead.deleted_at.is_(None). Date boundaries are bind
+    parameters (see dashboard_counts_params), so the expression is built
+    once at import and its compiled SQL is reused from the engine's
+    compiled cache on every execution.
+
+    Returns:
+        SELECT statement usable with both Session and AsyncSession
+    """
+    timestamp_type = Lead.created_at.type
+    today_start = bindparam("today_start", type_=timestamp_type)
+    week_start = bindparam("week_start", type_=timestamp_type)
+    tomorrow_start = bindparam("tomorrow_start", type_=timestamp_type)
+
+    base_filter = Lead.deleted_at.is_(None)
+
+    return select(
+        # total_leads: All non-deleted leads (for historical context)
+        func.count(Lead.id).filter(base_filter).label('total_leads'),
+        # active_leads: Non-deleted leads EXCLUDING terminal statuses (MATCHES TABLE VIEW);
+        # is_active is a stored generated column, so no per-row NOT IN
+        func.count(Lead.id).filter(Lead.is_active.is_(True)).label('active_leads'),
+        # hot_leads: Non-deleted HOT priority leads (in active statuses only)
+        func.count(Lead.id).filter(
+            Lead.is_active.is_(True),
+            Lead.priority == PriorityType.HOT,
+        ).label('hot_leads'),
+        # new_leads: Non-deleted leads that have never been contacted
+        func.count(Lead.id).filter(
+            base_filter,
+            or_(Lead.contact_outcome == ContactOutcome.NEW, Lead.contact_outcome.is_(None))
+        ).label('new_leads'),
+        # leads_this_week: Non-deleted leads created this week
+        func.count(Lead.id).filter(base_filter, Lead.created_at >= week_start).label('leads_this_week'),
+        # leads_today: Non-deleted leads created today
+        func.count(Lead.id).filter(base_filter, Lead.created_at >= today_start).label('leads_today'),
+        # total_contacted: Non-deleted leads with any contact attempt
+        func.count(Lead.id).filter(
+            base_filter,
+            Lead.contact_outcome.isnot(None),
+            Lead.contact_outcome != ContactOutcome.NEW
+        ).label('total_contacted'),
+        # answered: Non-deleted leads that responded positively
+        func.count(Lead.id).filter(
+            base_filter,
+            Lead.contact_outcome.in_([ContactOutcome.ANSWERED, ContactOutcome.CALLBACK_REQUESTED])
+        ).label('answered'),
+        # scheduled: Non-deleted leads that reached scheduling stage
+        func.count(Lead.id).filter(
+            base_filter,
+            Lead.status.in_([LeadStatus.SCHEDULED, LeadStatus.CONSULTATION_COMPLETE])
+        ).label('scheduled'),
+        # scheduled_today: consultations scheduled for today (folded into this
+        # aggregate so a cache miss costs exactly one round-trip)
+        func.count(Lead.id).filter(
+            base_filter,
+            Lead.status == LeadStatus.SCHEDULED,
+            Lead.scheduled_callback_at >= today_start,
+            Lead.scheduled_callback_at < tomorrow_start,
+        ).label('scheduled_today'),
+    ).where(
+        # Every FILTER branch already requires base_filter; repeating it in
+        # WHERE lets the planner use the partial covering index
+        # idx_leads_dashboard_summary (migration 022) as an index-only scan.
+        base_filter
+    )
+
+
+DASHBOARD_COUNTS_STMT = _build_dashboard_counts_stmt()
+
+
+def query_dashboard_counts(db: Session, now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Compute the raw dashboard counts with a single aggregate query.
+
+    Args:
+        db: Database session
+        now: Reference time (defaults to current UTC time)
+
+    Returns:
+        Dict of counter name -> count
+    """
+    now = now or datetime.now(timezone.utc)
+    row = db.execute(DASHBOARD_COUNTS_STMT, dashboard_counts_params(now)).mappings().one()
+    return {name: value or 0 for name, value in row.items()}
+
+
+async def query_dashboard_counts_async(db: AsyncSession, now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Async variant of query_dashboard_counts for AsyncSession handlers.
+
+    Args:
+        db: Async database session
+        now: Reference time (defaults to current UTC time)
+
+    Returns:
+        Dict of counter name -> count
+    """
+    now = now or datetime.now(timezone.utc)
+    result = await db.execute(DASHBOARD_COUNTS_STMT, dashboard_counts_params(now))
+    row = result.mappings().one()
+    return {name: value or 0 for name, value in row.items()}
+
+
+def build_dashboard_summary(counts: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Build the dashboard summary payload from raw counts.
+
+    Args:
+        counts: Output of query_dashboard_counts (or the Redis counters)
+
+    Returns:
+        Dict matching DashboardSummaryResponse
+    """
+    total_leads = counts.get("total_leads", 0)
+    total_contacted = counts.get("total_contacted", 0)
+    answered = counts.get("answered", 0)
+    scheduled = counts.get("scheduled", 0)
+
+    response_rate = (answered / total_contacted * 100) if total_contacted > 0 else 0.0
+    conversion_rate = (scheduled / total_leads * 100) if total_leads > 0 else 0.0
+
+    return {
+        "total_leads": total_leads,
+        "active_leads": counts.get("active_leads", 0),  # MATCHES TABLE COUNT
+        "hot_leads": counts.get("hot_leads", 0),
+        "new_leads": counts.get("new_leads", 0),
+        "scheduled_today": counts.get("scheduled_today", 0),
+        "overall_response_rate": round(response_rate, 1),
+        "overall_conversion_rate": round(conversion_rate, 1),
+        "leads_this_week": counts.get("leads_this_week", 0),
+        "leads_today": counts.get("leads_today", 0),
+    }
+
+
+# =============================================================================
+# Redis Counters
+# =============================================================================
+
+def dashboard_counters_version() -> int:
+    """Current counters version (0 if never bumped or Redis is down)."""
+    return int(get_cache().get(DASHBOARD_COUNTERS_VERSION_KEY) or 0)
+
+
+def bump_dashboard_counters_version() -> None:
+    """Invalidate the counter hash; the next read reconciles from SQL."""
+    get_cache().incr(DASHBOARD_COUNTERS_VERSION_KEY)
+
+
+def store_dashboard_counts(
+    counts: Dict[str, int],
+    now: Optional[datetime] = None,
+    version: Optional[int] = None,
+) -> bool:
+    """
+    Seed (or overwrite) the Redis counters from SQL-computed counts.
+
+    Args:
+        counts: Output of query_dashboard_counts
+        now: Reference time the counts were computed at
+        version: Counters version read before the counts were queried, so a
+            change notified mid-query leaves the hash stale (defaults to the
+            current version)
+
+    Returns:
+        True if the hash was written
+    """
+    today = (now or datetime.now(timezone.utc)).date()
+    week_start = today - timedelta(days=today.weekday())
+
+    mapping: Dict[str, Any] = {name: counts.get(name, 0) for name in _STATIC_FIELDS}
+    mapping[_created_day_field(today)] = counts.get("leads_today", 0)
+    mapping[_created_week_field(week_start)] = counts.get("leads_this_week", 0)
+    mapping[_scheduled_day_field(today)] = counts.get("scheduled_today", 0)
+    mapping["as_of"] = today.isoformat()
+    mapping["version"] = dashboard_counters_version() if version is None else version
+
+    return get_cache().replace_hash(DASHBOARD_COUNTERS_KEY, mapping)
+
+
+def read_dashboard_summary(now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+    """
+    Read the dashboard summary from the Redis counters.
+
+    Returns None when the counters are missing, were seeded on a previous
+    UTC day (date-bucketed fields for the new day are not populated yet), or
+    were seeded under an older counters version (a lead change was notified
+    since).
+
+    Args:
+        now: Reference time (defaults to current UTC time)
+
+    Returns:
+        Dashboard summary dict, or None on miss
+    """
+    raw = get_cache().hgetall(DASHBOARD_COUNTERS_KEY)
+    today = (now or datetime.now(timezone.utc)).date()
+    if not raw or raw.get("as_of") != today.isoformat():
+        return None
+    if raw.get("version") != str(dashboard_counters_version()):
+        return None
+
+    week_start = today - timedelta(days=today.weekday())
+    try:
+        counts = {name: int(raw.get(name, 0)) for name in _STATIC_FIELDS}
+        counts["leads_today"] = int(raw.get(_created_day_field(today), 0))
+        counts["leads_this_week"] = int(raw.get(_created_week_field(week_start), 0))
+        counts["scheduled_today"] = int(raw.get(_scheduled_day_field(today), 0))
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Dashboard counters malformed, falling back to SQL: {e}")
+        return None
+
+    return build_dashboard_summary(counts)
+
+
+def reconcile_dashboard_counters(db: Session) -> Dict[str, Any]:
+    """
+    Recompute the counters from SQL and overwrite the Redis hash.
+
+    Run periodically to correct drift from writes that bypass the ORM.
+
+    Args:
+        db: Database session
+
+    Returns:
+        The freshly computed dashboard summary
+    """
+    now = datetime.now(timezone.utc)
+    version = dashboard_counters_version()
+    counts = query_dashboard_counts(db, now)
+    store_dashboard_counts(counts, now, version)
+    return build_dashboard_summary(counts)
+
+
+async def reconcile_dashboard_counters_async(db: AsyncSession) -> Dict[str, Any]:
+    """
+    Async variant of reconcile_dashboard_counters for AsyncSession handlers.
+
+    Args:
+        db: Async database session
+
+    Returns:
+        The freshly computed dashboard summary
+    """
+    now = datetime.now(timezone.utc)
+    version = dashboard_counters_version()
+    counts = await query_dashboard_counts_async(db, now)
+    store_dashboard_counts(counts, now, version)
+    return build_dashboard_summary(counts)
+
+
+# =============================================================================
+# Write-Path Hooks
+# =============================================================================
+
+def _queue_deltas(target: Lead, deltas: Counter) -> None:
+    """Accumulate deltas on the owning session until commit."""
+    session = object_session(target)
+    if session is None or not deltas:
+        return
+    pending = session.info.setdefault(_SESSION_DELTAS_KEY, Counter())
+    pending.update(deltas)
+
+
+def _current_values(target: Lead) -> Dict[str, Any]:
+    """Read tracked columns from instance state without triggering loads."""
+    state_dict = inspect(target).dict
+    return {name: state_dict.get(name) for name in _TRACKED_ATTRS}
+
+
+@event.listens_for(Lead, "after_insert")
+def _on_lead_insert(mapper, connection, target: Lead) -> None:
+    values = _current_values(target)
+    # created_at is a server default; the row was created just now
+    if values["created_at"] is None:
+        values["created_at"] = datetime.now(timezone.utc)
+    _queue_deltas(target, lead_counter_fields(values))
+
+
+@event.listens_for(Lead, "after_update")
+def _on_lead_update(mapper, connection, target: Lead) -> None:
+    state = inspect(target)
+    new_values = _current_values(target)
+    old_values = dict(new_values)
+    changed = False
+
+    for name in _TRACKED_ATTRS:
+        history = state.attrs[name].history
+        if not history.has_changes():
+            continue
+        changed = True
+        if not history.deleted:
+            # Previous value was never loaded; the diff would be a guess
+            session = object_session(target)
+            if session is not None:
+                session.info[_SESSION_STALE_KEY] = True
+            return
+        old_values[name] = history.deleted[0]
+
+    if not changed:
+        return
+
+    deltas = lead_counter_fields(new_values)
+    deltas.subtract(lead_counter_fields(old_values))
+    _queue_deltas(target, Counter({k: v for k, v in deltas.items() if v}))
+
+
+@event.listens_for(Lead, "after_delete")
+def _on_lead_delete(mapper, connection, target: Lead) -> None:
+    deltas = Counter()
+    deltas.subtract(lead_counter_fields(_current_values(target)))
+    _queue_deltas(target, deltas)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_counter_deltas(session: Session) -> None:
+    deltas = session.info.pop(_SESSION_DELTAS_KEY, None)
+    stale = session.info.pop(_SESSION_STALE_KEY, False)
+    if not deltas and not stale:
+        return
+
+    try:
+        cache = get_cache()
+        if stale:
+            # Drop the hash; the next read recomputes it from SQL
+            cache.delete(DASHBOARD_COUNTERS_KEY)
+        elif deltas:
+            cache.hincrby_if_exists(DASHBOARD_COUNTERS_KEY, dict(deltas))
+    except Exception as e:
+        # Never fail a committed write over counters; reconciliation repairs drift
+        logger.warning(f"Failed to apply dashboard counter deltas: {e}")
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_counter_deltas(session: Session, previous_transaction) -> None:
+    session.info.pop(_SESSION_DELTAS_KEY, None)
+    session.info.pop(_SESSION_STALE_KEY, None)
@@ -0,0 +1,149 @@
+"""
+Push-based dashboard cache invalidation via Postgres LISTEN/NOTIFY.
+
+Migration 025 raises NOTIFY leads_changed after every statement that
+writes to leads. Each API worker holds one dedicated asyncpg connection
+LISTENing on that channel and, on notification, bumps the dashboard
+counters version and drops the cached dashboard summary (Redis key plus
+any registered in-process caches), so the next read is fresh instead of
+waiting out the TTL.
+
+The version bump is what makes writes that bypass the ORM visible: the
+write-maintained counter hash (services/dashboard_counters.py) is only
+served while its stamped version matches, so the next read reconciles it
+from SQL.
+
+LISTEN needs a session-pooled connection, so the listener is disabled
+behind PgBouncer in transaction-pooling mode (DB_PGBOUNCER=true).
+"""
+
+import asyncio
+import logging
+from typing import Callable, List, Optional
+
+import asyncpg
+
+from ..core.config import settings
+from .cache import get_cache
+from .dashboard_counters import bump_dashboard_counters_version
+
+
+logger = logging.getLogger(__name__)
+
+LEADS_CHANGED_CHANNEL = "leads_changed"
+
+# Redis keys dropped on every lead change notification
+DASHBOARD_CACHE_KEYS = ("neuroreach:metrics:dashboard_summary",)
+
+# Coalesce notification bursts (bulk imports) into one invalidation
+DEBOUNCE_SECONDS = 0.25
+RECONNECT_DELAY_SECONDS = 5.0
+
+_handlers: List[Callable[[], None]] = []
+
+
+def register_lead_change_handler(handler: Callable[[], None]) -> None:
+    """
+    Register an in-process callback run on every lead change notification.
+
+    Used by API modules to clear their per-process caches.
+
+    Args:
+        handler: Zero-argument callable (must not block)
+    """
+    _handlers.append(handler)
+
+
+def _listen_dsn() -> str:
+    """Plain libpq DSN for asyncpg (strips any SQLAlchemy driver suffix)."""
+    url = settings.database_url
+    _, sep, rest = url.partition("://")
+    return f"postgresql://{rest}" if sep else url
+
+
+def _invalidate_dashboard_caches() -> None:
+    """Invalidate dashboard counters and caches in Redis and in this process."""
+    # A reconcile already in flight stamps the old version, so it is not served
+    bump_dashboard_counters_version()
+
+    for handler in _handlers:
+        try:
+            handler()
+        except Exception as e:
+            logger.warning(f"Lead change handler failed: {e}")
+
+    cache = get_cache()
+    for key in DASHBOARD_CACHE_KEYS:
+        cache.delete(key)
+
+
+async def listen_for_lead_changes(stop_event: asyncio.Event) -> None:
+    """
+    LISTEN on leads_changed until stop_event is set, reconnecting on failure.
+
+    Args:
+        stop_event: Set on application shutdown
+    """
+    changed = asyncio.Event()
+
+    def on_notify(connection, pid, channel, payload) -> None:
+        changed.set()
+
+    while not stop_event.is_set():
+        conn: Optional[asyncpg.Connection] = None
+        try:
+            conn = await asyncpg.connect(_listen_dsn())
+            await conn.add_listener(LEADS_CHANGED_CHANNEL, on_notify)
+            logger.info(f"Listening for '{LEADS_CHANGED_CHANNEL}' notifications")
+
+            while not stop_event.is_set() and not conn.is_closed():
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=RECONNECT_DELAY_SECONDS)
+                except asyncio.TimeoutError:
+                    continue
+                await asyncio.sleep(DEBOUNCE_SECONDS)
+                changed.clear()
+                # Redis client is synchronous; keep it off the event loop
+                await asyncio.to_thread(_invalidate_dashboard_caches)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Lead change listener error, reconnecting: {e}")
+        finally:
+            if conn is not None and not conn.is_closed():
+                await conn.close()
+
+        if not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=RECONNECT_DELAY_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+
+def start_lead_change_listener() -> Optional[tuple]:
+    """
+    Start the listener as a background task on the running loop.
+
+    Returns:
+        (task, stop_event) to pass to stop_lead_change_listener, or None if
+        disabled (PgBouncer transaction pooling)
+    """
+    if settings.db_pgbouncer:
+        logger.info("Lead change listener disabled (LISTEN unsupported behind PgBouncer)")
+        return None
+    stop_event = asyncio.Event()
+    task = asyncio.create_task(listen_for_lead_changes(stop_event))
+    return task, stop_event
+
+
+async def stop_lead_change_listener(handle: Optional[tuple]) -> None:
+    """Stop a listener started with start_lead_change_listener."""
+    if handle is None:
+        return
+    task, stop_event = handle
+    stop_event.set()
+    try:
+        await asyncio.wait_for(task, timeout=RECONNECT_DELAY_SECONDS)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        task.cancel()
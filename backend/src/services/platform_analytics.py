@@ -15,7 +15,7 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from ..core.database import get_db
-from .cache import get_cache, CacheService
+from .cache import get_cache, CacheService, LocalTTLCache
 
 
 logger = logging.getLogger(__name__)
@@ -26,6 +26,11 @@ CACHE_TTL_PLATFORM_SUMMARY = 300  # 5 minutes
 CACHE_TTL_PLATFORM_TRENDS = 300  # 5 minutes
 CACHE_TTL_PLATFORM_ACTIVITY = 60  # 1 minute
 CACHE_TTL_PLATFORM_INSIGHTS = 300  # 5 minutes
+LOCAL_TTL_PLATFORM_SUMMARY = 60  # In-process, matches the endpoints' s-maxage
+
+# Per-process summary memo keyed by period, shared by every endpoint that
+# derives its payload from get_platform_summary (insights, funnel, quality...)
+_local_summary_cache = LocalTTLCache(ttl=LOCAL_TTL_PLATFORM_SUMMARY, maxsize=8)
 
 
 class PlatformAnalyticsService:
@@ -75,9 +80,14 @@ class PlatformAnalyticsService:
         """
         cache_key = f"{self.PREFIX}:summary:{period}"
         
-        # Try cache first
+        # In-process memo first, then Redis
+        local = _local_summary_cache.get(period)
+        if local is not None:
+            return local
+        
         cached = self.cache.get(cache_key)
         if cached is not None:
+            _local_summary_cache.set(period, cached)
             return cached
         
         # Get data from materialized views
@@ -99,6 +109,7 @@ class PlatformAnalyticsService:
         
         # Cache result
         self.cache.set(cache_key, response, ttl=CACHE_TTL_PLATFORM_SUMMARY)
+        _local_summary_cache.set(period, response)
         
         return response
     
@@ -656,6 +667,7 @@ class PlatformAnalyticsService:
         ]
         for pattern in patterns:
             self.cache.delete_pattern(pattern)
+        _local_summary_cache.clear()
         logger.info("Platform analytics caches invalidated")
     
     # =========================================================================
@@ -0,0 +1,54 @@
+"""
+Referring Provider Cache Keys.
+
+Shared cache key helpers for provider responses, so every writer of
+referring_providers (providers API, lead intake, webhooks) can invalidate
+the cached list pages and detail entries after it commits.
+
+Cache keys: single providers under providers:id:{uuid}; list pages under
+providers:list:v{version}:{params_hash} and notes history under
+providers:notes:v{version}:{uuid}:{limit}. Mutations bump the version
+(INCR) instead of SCAN-deleting every page.
+"""
+
+import hashlib
+import json
+from typing import Optional
+from uuid import UUID
+
+from .cache import get_cache
+
+
+PROVIDERS_LIST_VERSION_KEY = "providers:list:version"
+CACHE_TTL_PROVIDERS = 60
+
+
+def provider_cache_key(provider_id: UUID) -> str:
+    """Cache key for a single provider response."""
+    return f"providers:id:{provider_id}"
+
+
+def provider_list_cache_key(cache, params: dict) -> str:
+    """Cache key for a list page under the current list version."""
+    version = cache.get(PROVIDERS_LIST_VERSION_KEY) or 0
+    params_hash = hashlib.blake2b(
+        json.dumps(params, sort_keys=True, default=str).encode(), digest_size=8
+    ).hexdigest()
+    return f"providers:list:v{version}:{params_hash}"
+
+
+def provider_notes_cache_key(cache, provider_id: UUID, limit: int) -> str:
+    """Cache key for a notes-history page under the current list version."""
+    version = cache.get(PROVIDERS_LIST_VERSION_KEY) or 0
+    return f"providers:notes:v{version}:{provider_id}:{limit}"
+
+
+def invalidate_provider_cache(provider_id: Optional[UUID] = None) -> None:
+    """Invalidate list pages (version bump) and, if given, one provider."""
+    try:
+        cache = get_cache()
+        cache.incr(PROVIDERS_LIST_VERSION_KEY)
+        if provider_id is not None:
+            cache.delete(provider_cache_key(provider_id))
+    except Exception:
+        pass  # Don't fail the request if cache invalidation fails
@@ -94,6 +94,10 @@ celery_app.conf.update(
             "task": "src.tasks.lead_tasks.check_elasticsearch_sync",
             "schedule": 600.0,  # Every 10 minutes
         },
+        "reconcile-dashboard-counters": {
+            "task": "src.tasks.lead_tasks.reconcile_dashboard_counters",
+            "schedule": 300.0,  # Every 5 minutes
+        },
         "refresh-platform-analytics": {
             "task": "src.tasks.lead_tasks.refresh_platform_analytics_views",
             "schedule": 300.0,  # Every 5 minutes
@@ -1025,6 +1025,35 @@ def warm_dashboard_cache() -> Dict[str, Any]:
         db.close()
 
 
+@shared_task
+def reconcile_dashboard_counters() -> Dict[str, Any]:
+    """
+    Periodic task to reconcile the write-maintained dashboard counters.
+
+    The counters are updated incrementally by Lead write hooks; this
+    recomputes them from SQL and overwrites the Redis hash to correct
+    drift (writes that bypass the ORM, increments lost while Redis was down).
+
+    Returns:
+        Dict with reconcile status and the recomputed summary
+    """
+    from ..services.dashboard_counters import reconcile_dashboard_counters as _reconcile
+
+    db = get_db_session()
+
+    try:
+        summary = _reconcile(db)
+        logger.debug(f"Dashboard counters reconciled: {summary}")
+        return {"status": "reconciled", "summary": summary}
+
+    except Exception as e:
+        logger.error(f"Dashboard counter reconciliation failed: {e}")
+        return {"status": "error", "error": str(e)}
+
+    finally:
+        db.close()
+
+
 # =============================================================================
 # Platform Analytics Tasks
 # =============================================================================
@@ -1228,6 +1257,7 @@ def refresh_platform_analytics_views() -> Dict[str, Any]:
     - mv_platform_priority_distribution (quality distribution)
     - mv_platform_condition_distribution (condition breakdown)
     - mv_platform_hourly_distribution (peak times)
+    - mv_lead_platform_daily (source analytics roll-up, migration 027)
 
     Returns:
         Dict with refresh status and timing for each view
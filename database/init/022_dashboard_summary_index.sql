@@ -0,0 +1,32 @@
+-- =============================================================================
+-- Migration 022: Partial Covering Index for Dashboard Summary
+-- =============================================================================
+--
+-- The /api/metrics/analytics/dashboard-summary aggregate computes every KPI
+-- with COUNT(id) FILTER (WHERE ...) over non-deleted leads. Every FILTER
+-- branch (active, hot, new, this week, today, contacted, answered, scheduled)
+-- only references status, priority, contact_outcome, created_at and
+-- scheduled_callback_at, so a partial index carrying those columns lets
+-- Postgres answer the whole aggregate with an Index Only Scan instead of
+-- visiting heap tuples.
+--
+-- Verify with:
+--   EXPLAIN (ANALYZE, BUFFERS) <dashboard summary query>
+-- and look for "Index Only Scan using idx_leads_dashboard_summary" with
+-- "Heap Fetches: 0" (after VACUUM has set the visibility map).
+--
+-- Reversible: DROP INDEX CONCURRENTLY IF EXISTS idx_leads_dashboard_summary;
+-- =============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_dashboard_summary
+ON leads (status, priority, contact_outcome, created_at)
+INCLUDE (id, scheduled_callback_at)
+WHERE deleted_at IS NULL;
+
+COMMENT ON INDEX idx_leads_dashboard_summary IS
+'Covering index for dashboard summary FILTER aggregates (index-only scan over non-deleted leads)';
+
+-- =============================================================================
+-- Analyze tables to update query planner statistics after index creation
+-- =============================================================================
+ANALYZE leads;
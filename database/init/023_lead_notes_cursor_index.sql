@@ -0,0 +1,22 @@
+-- =============================================================================
+-- Migration 023: Keyset Pagination Index for Lead Notes
+-- =============================================================================
+--
+-- GET /api/leads/{lead_id}/notes is keyset-paginated on
+-- (created_at DESC, id DESC) within a lead. This compound index serves both
+-- the first page and every "after cursor" page as a bounded index range
+-- scan, so fetch time no longer grows with the size of a lead's history.
+--
+-- Reversible: DROP INDEX CONCURRENTLY IF EXISTS idx_lead_notes_lead_created;
+-- =============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_lead_notes_lead_created
+ON lead_notes (lead_id, created_at DESC, id DESC);
+
+COMMENT ON INDEX idx_lead_notes_lead_created IS
+'Keyset pagination for lead notes history: newest first, id as tie-breaker';
+
+-- =============================================================================
+-- Analyze tables to update query planner statistics after index creation
+-- =============================================================================
+ANALYZE lead_notes;
@@ -0,0 +1,59 @@
+-- =============================================================================
+-- Migration 024: Generated is_active Column + Partial Indexes
+-- =============================================================================
+--
+-- "Active" leads (non-deleted, not in a terminal status) drive the dashboard
+-- active_leads / hot_leads KPIs. Evaluating
+--   status NOT IN ('CONSULTATION_COMPLETE','TREATMENT_STARTED','LOST','DISQUALIFIED')
+--   AND deleted_at IS NULL
+-- per row at query time is replaced by a STORED generated column computed
+-- on write, plus small partial indexes over only the active rows.
+--
+-- NOTE: Adding a STORED generated column rewrites the leads table under an
+-- ACCESS EXCLUSIVE lock. Run during a maintenance window on large tables.
+--
+-- Reversible:
+--   DROP INDEX CONCURRENTLY IF EXISTS idx_leads_is_active_priority;
+--   DROP INDEX CONCURRENTLY IF EXISTS idx_leads_active_created_at;
+--   ALTER TABLE leads DROP COLUMN IF EXISTS is_active;
+--   (and recreate idx_leads_dashboard_summary from migration 022)
+-- =============================================================================
+
+ALTER TABLE leads
+ADD COLUMN IF NOT EXISTS is_active BOOLEAN
+GENERATED ALWAYS AS (
+    status NOT IN ('CONSULTATION_COMPLETE', 'TREATMENT_STARTED', 'LOST', 'DISQUALIFIED')
+    AND deleted_at IS NULL
+) STORED;
+
+COMMENT ON COLUMN leads.is_active IS
+'Generated: non-deleted lead not in a terminal status (matches the table view and dashboard active_leads)';
+
+-- Active leads by priority (hot_leads KPI, priority queues)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_is_active_priority
+ON leads (priority)
+WHERE is_active;
+
+-- Active leads by recency
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_active_created_at
+ON leads (created_at DESC)
+WHERE is_active;
+
+-- =============================================================================
+-- Keep the dashboard summary aggregate index-only (migration 022): the
+-- active/hot FILTER branches now read is_active instead of status
+-- =============================================================================
+DROP INDEX CONCURRENTLY IF EXISTS idx_leads_dashboard_summary;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_dashboard_summary
+ON leads (status, priority, contact_outcome, created_at)
+INCLUDE (id, scheduled_callback_at, is_active)
+WHERE deleted_at IS NULL;
+
+COMMENT ON INDEX idx_leads_dashboard_summary IS
+'Covering index for dashboard summary FILTER aggregates (index-only scan over non-deleted leads)';
+
+-- =============================================================================
+-- Analyze tables to update query planner statistics after index creation
+-- =============================================================================
+ANALYZE leads;
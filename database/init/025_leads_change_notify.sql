@@ -0,0 +1,36 @@
+-- =============================================================================
+-- Migration 025: NOTIFY on Lead Changes
+-- =============================================================================
+--
+-- Pushes a 'leads_changed' notification after any INSERT/UPDATE/DELETE on
+-- leads so API workers (services/lead_change_listener.py) can invalidate the
+-- dashboard counters and cached summary immediately instead of waiting for
+-- TTL expiry or the periodic reconcile.
+-- This also covers writes that bypass the ORM hooks (raw SQL, scripts).
+--
+-- The trigger is statement-level, and Postgres folds identical
+-- notifications raised within one transaction into a single delivery, so
+-- bulk updates produce one notification per statement at most.
+--
+-- Reversible:
+--   DROP TRIGGER IF EXISTS trg_leads_notify_changed ON leads;
+--   DROP FUNCTION IF EXISTS notify_leads_changed();
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION notify_leads_changed()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('leads_changed', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_leads_notify_changed ON leads;
+
+CREATE TRIGGER trg_leads_notify_changed
+AFTER INSERT OR UPDATE OR DELETE ON leads
+FOR EACH STATEMENT
+EXECUTE FUNCTION notify_leads_changed();
+
+COMMENT ON FUNCTION notify_leads_changed() IS
+'Statement-level NOTIFY on leads_changed; consumed by the API to invalidate dashboard caches';
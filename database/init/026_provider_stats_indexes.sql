@@ -0,0 +1,29 @@
+-- =============================================================================
+-- Migration 026: Covering Partial Index for Provider Dashboard Stats
+-- =============================================================================
+--
+-- /api/providers/stats computes every referral count (total, converted,
+-- this month) in one aggregate over referral leads:
+--   COUNT(*) FILTER (WHERE status IN (...)), COUNT(*) FILTER (WHERE created_at >= ...)
+--   WHERE is_referral = true
+-- A partial index over only referral leads carrying status and created_at
+-- answers the whole aggregate with an Index Only Scan.
+--
+-- The provider-side counts (total / ACTIVE / PENDING) are one aggregate over
+-- referring_providers, already index-only via idx_providers_status
+-- (migration 005); per-status partial indexes would not help a single scan.
+--
+-- Reversible: DROP INDEX CONCURRENTLY IF EXISTS idx_leads_referral_stats;
+-- =============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_referral_stats
+ON leads (status, created_at)
+WHERE is_referral = true;
+
+COMMENT ON INDEX idx_leads_referral_stats IS
+'Covering partial index for provider dashboard referral counts (index-only scan over referral leads)';
+
+-- =============================================================================
+-- Analyze tables to update query planner statistics after index creation
+-- =============================================================================
+ANALYZE leads;
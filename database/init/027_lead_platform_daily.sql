@@ -0,0 +1,164 @@
+-- =============================================================================
+-- Migration 027: Daily Lead Roll-up by Attribution Platform
+-- =============================================================================
+--
+-- /api/analytics/sources/overview and /trend group leads by attribution
+-- platform (Widget, Google Ads, Jotform, Referral), derived from
+-- utm_source/utm_medium. Scanning every lead in the window on each dashboard
+-- load grows with the leads table; this roll-up keeps one row per
+-- (day, platform), so both endpoints read O(days x 4) rows.
+--
+-- lead_platform() mirrors get_platform_from_source / SOURCE_MAPPING in
+-- backend/src/api/source_analytics.py: exact source key, then exact medium
+-- key, then the first mapping key contained in the source, else Widget.
+-- KEEP BOTH IN SYNC when adding sources.
+--
+-- The view is refreshed CONCURRENTLY with the other platform views by
+-- refresh_platform_analytics_views() (Celery beat, every 5 minutes).
+--
+-- Reversible:
+--   DROP MATERIALIZED VIEW IF EXISTS mv_lead_platform_daily;
+--   DROP FUNCTION IF EXISTS lead_platform(TEXT, TEXT);
+--   (and re-run the refresh function from 004)
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION lead_platform(p_source TEXT, p_medium TEXT)
+RETURNS TEXT AS $$
+    SELECT CASE
+        WHEN lower(p_source) IN ('widget', 'intake_widget', 'embedded', 'direct') THEN 'Widget'
+        WHEN lower(p_source) IN ('google', 'google_ads', 'googleads', 'cpc', 'ppc', 'adwords') THEN 'Google Ads'
+        WHEN lower(p_source) IN ('jotform', 'jotforms', 'form', 'external_form') THEN 'Jotform'
+        WHEN lower(p_source) IN ('referral', 'ref', 'partner', 'affiliate', 'friend', 'word_of_mouth') THEN 'Referral'
+        WHEN lower(p_medium) IN ('widget', 'intake_widget', 'embedded', 'direct') THEN 'Widget'
+        WHEN lower(p_medium) IN ('google', 'google_ads', 'googleads', 'cpc', 'ppc', 'adwords') THEN 'Google Ads'
+        WHEN lower(p_medium) IN ('jotform', 'jotforms', 'form', 'external_form') THEN 'Jotform'
+        WHEN lower(p_medium) IN ('referral', 'ref', 'partner', 'affiliate', 'friend', 'word_of_mouth') THEN 'Referral'
+        WHEN strpos(lower(p_source), 'widget') > 0 THEN 'Widget'
+        WHEN strpos(lower(p_source), 'intake_widget') > 0 THEN 'Widget'
+        WHEN strpos(lower(p_source), 'embedded') > 0 THEN 'Widget'
+        WHEN strpos(lower(p_source), 'direct') > 0 THEN 'Widget'
+        WHEN strpos(lower(p_source), 'google') > 0 THEN 'Google Ads'
+        WHEN strpos(lower(p_source), 'google_ads') > 0 THEN 'Google Ads'
+        WHEN strpos(lower(p_source), 'googleads') > 0 THEN 'Google Ads'
+        WHEN strpos(lower(p_source), 'cpc') > 0 THEN 'Google Ads'
+        WHEN strpos(lower(p_source), 'ppc') > 0 THEN 'Google Ads'
+        WHEN strpos(lower(p_source), 'adwords') > 0 THEN 'Google Ads'
+        WHEN strpos(lower(p_source), 'jotform') > 0 THEN 'Jotform'
+        WHEN strpos(lower(p_source), 'jotforms') > 0 THEN 'Jotform'
+        WHEN strpos(lower(p_source), 'form') > 0 THEN 'Jotform'
+        WHEN strpos(lower(p_source), 'external_form') > 0 THEN 'Jotform'
+        WHEN strpos(lower(p_source), 'referral') > 0 THEN 'Referral'
+        WHEN strpos(lower(p_source), 'ref') > 0 THEN 'Referral'
+        WHEN strpos(lower(p_source), 'partner') > 0 THEN 'Referral'
+        WHEN strpos(lower(p_source), 'affiliate') > 0 THEN 'Referral'
+        WHEN strpos(lower(p_source), 'friend') > 0 THEN 'Referral'
+        WHEN strpos(lower(p_source), 'word_of_mouth') > 0 THEN 'Referral'
+        ELSE 'Widget'
+    END
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+COMMENT ON FUNCTION lead_platform(TEXT, TEXT) IS
+'Attribution platform for a lead (mirrors SOURCE_MAPPING in api/source_analytics.py)';
+
+-- =============================================================================
+-- Roll-up view (one row per UTC day and platform, non-deleted leads)
+-- =============================================================================
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_lead_platform_daily AS
+SELECT
+    (created_at AT TIME ZONE 'UTC')::DATE AS lead_date,
+    lead_platform(utm_source, utm_medium) AS platform,
+    COUNT(*) AS total_leads,
+    COUNT(*) FILTER (WHERE priority = 'HOT') AS hot_leads,
+    COUNT(*) FILTER (WHERE priority = 'MEDIUM') AS medium_leads,
+    COUNT(*) FILTER (WHERE priority = 'LOW') AS low_leads,
+    COUNT(*) FILTER (WHERE status IN ('CONSULTATION_COMPLETE', 'TREATMENT_STARTED')) AS converted_leads,
+    COUNT(*) FILTER (WHERE status = 'SCHEDULED') AS scheduled_leads,
+    COALESCE(SUM(score), 0) AS score_sum
+FROM leads
+WHERE deleted_at IS NULL
+  AND created_at >= NOW() - INTERVAL '366 days'
+GROUP BY 1, 2
+WITH DATA;
+
+-- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_lead_platform_daily_date_platform
+    ON mv_lead_platform_daily (lead_date, platform);
+
+COMMENT ON MATERIALIZED VIEW mv_lead_platform_daily IS
+'Daily lead counts per attribution platform for source analytics';
+
+-- =============================================================================
+-- Include the roll-up in the periodic platform analytics refresh
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION refresh_platform_analytics_views()
+RETURNS TABLE (
+    view_name TEXT,
+    duration_ms INTEGER,
+    status TEXT
+) AS $$
+DECLARE
+    start_time TIMESTAMP;
+    view_duration INTEGER;
+    v_name TEXT;
+    refresh_id INTEGER;
+BEGIN
+    -- Refresh each view and track performance
+    FOR v_name IN 
+        SELECT unnest(ARRAY[
+            'mv_platform_analytics',
+            'mv_platform_daily_stats',
+            'mv_platform_weekly_stats',
+            'mv_platform_monthly_stats',
+            'mv_platform_status_distribution',
+            'mv_platform_priority_distribution',
+            'mv_platform_condition_distribution',
+            'mv_platform_hourly_distribution',
+            'mv_lead_platform_daily'
+        ])
+    LOOP
+        start_time := clock_timestamp();
+        
+        -- Log start
+        INSERT INTO analytics_refresh_log (view_name, status)
+        VALUES (v_name, 'running')
+        RETURNING id INTO refresh_id;
+        
+        BEGIN
+            -- Refresh the view concurrently
+            EXECUTE format('REFRESH MATERIALIZED VIEW CONCURRENTLY %I', v_name);
+            
+            view_duration := EXTRACT(MILLISECONDS FROM clock_timestamp() - start_time)::INTEGER;
+            
+            -- Log success
+            UPDATE analytics_refresh_log 
+            SET completed_at = NOW(),
+                duration_ms = view_duration,
+                status = 'success'
+            WHERE id = refresh_id;
+            
+            view_name := v_name;
+            duration_ms := view_duration;
+            status := 'success';
+            RETURN NEXT;
+            
+        EXCEPTION WHEN OTHERS THEN
+            view_duration := EXTRACT(MILLISECONDS FROM clock_timestamp() - start_time)::INTEGER;
+            
+            -- Log failure
+            UPDATE analytics_refresh_log 
+            SET completed_at = NOW(),
+                duration_ms = view_duration,
+                status = 'failed',
+                error_message = SQLERRM
+            WHERE id = refresh_id;
+            
+            view_name := v_name;
+            duration_ms := view_duration;
+            status := 'failed: ' || SQLERRM;
+            RETURN NEXT;
+        END;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
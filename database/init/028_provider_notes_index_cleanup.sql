@@ -0,0 +1,28 @@
+-- =============================================================================
+-- Migration 028: Provider Notes History Index Cleanup
+-- =============================================================================
+--
+-- /api/providers/{id}/notes reads
+--   WHERE provider_id = :id ORDER BY created_at DESC LIMIT :n
+-- plus COUNT(*) WHERE provider_id = :id. Migration 006 already created the
+-- composite idx_provider_notes_created_at (provider_id, created_at DESC),
+-- which serves both as an ordered index range scan with no sort step.
+--
+-- idx_provider_notes_provider_id (provider_id) is a strict prefix of that
+-- composite, so it only adds write cost on every note insert. Drop it.
+--
+-- Reversible:
+--   CREATE INDEX CONCURRENTLY idx_provider_notes_provider_id
+--       ON provider_notes_history (provider_id);
+-- =============================================================================
+
+-- Make sure the composite exists before dropping its prefix
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_provider_notes_created_at
+ON provider_notes_history (provider_id, created_at DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_provider_notes_provider_id;
+
+-- =============================================================================
+-- Analyze tables to update query planner statistics after index changes
+-- =============================================================================
+ANALYZE provider_notes_history;
@@ -0,0 +1,39 @@
+-- =============================================================================
+-- Migration 029: Partial Indexes for the Soft-Delete Filter
+-- =============================================================================
+--
+-- Every analytics query filters non-deleted leads over a created_at window:
+--   WHERE deleted_at IS NULL AND created_at >= :cutoff
+-- Migration 024's idx_leads_active_created_at is restricted to is_active
+-- (which also excludes terminal statuses), so it cannot serve these
+-- queries. A partial index with the same predicate as the query lets the
+-- planner range-scan created_at without evaluating deleted_at per row.
+--
+-- /api/analytics/source/hot-leads additionally filters priority = 'HOT'.
+-- A dedicated partial index over only hot, non-deleted leads covers the
+-- columns that query groups and aggregates on, so it is answered with an
+-- Index Only Scan over a small fraction of the table.
+--
+-- Reversible:
+--   DROP INDEX CONCURRENTLY IF EXISTS idx_leads_not_deleted_created_at;
+--   DROP INDEX CONCURRENTLY IF EXISTS idx_leads_hot_created_at;
+-- =============================================================================
+
+-- Non-deleted leads by recency (analytics date windows)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_not_deleted_created_at
+ON leads (created_at DESC)
+WHERE deleted_at IS NULL;
+
+-- Hot, non-deleted leads by recency (hot-leads-by-platform)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_hot_created_at
+ON leads (created_at DESC)
+INCLUDE (utm_source, utm_medium, condition, status, score)
+WHERE deleted_at IS NULL AND priority = 'HOT';
+
+COMMENT ON INDEX idx_leads_hot_created_at IS
+'Covering partial index for hot-leads-by-platform (index-only scan over hot, non-deleted leads)';
+
+-- =============================================================================
+-- Analyze tables to update query planner statistics after index creation
+-- =============================================================================
+ANALYZE leads;
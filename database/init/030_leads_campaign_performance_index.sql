@@ -0,0 +1,33 @@
+-- =============================================================================
+-- Migration 030: Covering Index for Campaign Performance
+-- =============================================================================
+--
+-- /api/analytics/sources/campaign-performance aggregates
+--   WHERE deleted_at IS NULL AND utm_campaign IS NOT NULL
+--     AND created_at >= :cutoff
+--   GROUP BY utm_campaign, utm_source
+--   ORDER BY COUNT(id) DESC LIMIT 20
+-- The partial predicate keeps only campaign-attributed, non-deleted leads.
+-- Keys are ordered (utm_campaign, utm_source) so the planner can use a
+-- GroupAggregate over the index order. The INCLUDE columns carry every
+-- counted/averaged column, so the aggregate runs as an Index Only Scan.
+--
+-- Verify with:
+--   EXPLAIN (ANALYZE, BUFFERS) <campaign performance query>
+-- and look for "Index Only Scan using idx_leads_campaign_performance".
+--
+-- Reversible: DROP INDEX CONCURRENTLY IF EXISTS idx_leads_campaign_performance;
+-- =============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_campaign_performance
+ON leads (utm_campaign, utm_source, created_at)
+INCLUDE (id, priority, status, score)
+WHERE deleted_at IS NULL AND utm_campaign IS NOT NULL;
+
+COMMENT ON INDEX idx_leads_campaign_performance IS
+'Covering partial index for campaign performance aggregates (index-only scan over campaign-attributed, non-deleted leads)';
+
+-- =============================================================================
+-- Analyze tables to update query planner statistics after index creation
+-- =============================================================================
+ANALYZE leads;